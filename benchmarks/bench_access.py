@@ -0,0 +1,375 @@
+import json
+import os
+import platform
+import sys
+from argparse import ArgumentParser
+from itertools import repeat
+from time import perf_counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pyobject
+from pyobject import AccessError, Object
+
+ATTRIBUTES = (
+	'public', 'protected', 'private', 'final',
+	'field_public', 'field_protected', 'field_private', 'field_final'
+)
+
+DECLARATIONS = {
+	'public': "self.public_attribute('public', 0)",
+	'protected': "self.protected_attribute('protected', 0)",
+	'private': "self.private_attribute('private', 0)",
+	'final': "self.public_attribute('final', 0, True)",
+}
+
+FIELDS = {
+	'field_public': "public(0)",
+	'field_protected': "protected(0)",
+	'field_private': "private(0)",
+	'field_final': "final(0)",
+}
+
+ACCESSORS = '''
+	def {prefix}get_{name}(self, loops):
+		for _ in loops:
+			try:
+				self.{name}
+			except AccessError:
+				pass
+
+	def {prefix}set_{name}(self, loops):
+		for _ in loops:
+			try:
+				self.{name} = 0
+			except AccessError:
+				pass
+'''
+
+OUTSIDE = '''
+def outside_get_{name}(obj, loops):
+	for _ in loops:
+		try:
+			obj.{name}
+		except AccessError:
+			pass
+
+def outside_set_{name}(obj, loops):
+	for _ in loops:
+		try:
+			obj.{name} = 0
+		except AccessError:
+			pass
+'''
+
+WIDE = tuple(f'wide_{index}' for index in range(30))
+
+MEMBERS = '''
+	@protectedmethod
+	def protected_method(self):
+		return None
+
+	@privatemethod
+	def private_method(self):
+		return None
+
+	@protectedstaticmethod
+	def protected_static():
+		return None
+
+	@privatestaticmethod
+	def private_static():
+		return None
+
+	@protectedclassmethod
+	def protected_class(cls):
+		return None
+
+	@privateclassmethod
+	def private_class(cls):
+		return None
+
+	@protectedproperty
+	def protected_property(self):
+		return 0
+
+	@protected_property.setter
+	def protected_property(self, value):
+		pass
+
+	@privateproperty
+	def private_property(self):
+		return 0
+
+	@private_property.setter
+	def private_property(self, value):
+		pass
+
+	def call_protected_method(self, loops):
+		for _ in loops:
+			self.protected_method()
+
+	def call_private_method(self, loops):
+		for _ in loops:
+			self.private_method()
+
+	def call_protected_static(self, loops):
+		for _ in loops:
+			self.protected_static()
+
+	def call_private_static(self, loops):
+		for _ in loops:
+			self.private_static()
+
+	def call_protected_class(self, loops):
+		for _ in loops:
+			self.protected_class()
+
+	def call_private_class(self, loops):
+		for _ in loops:
+			self.private_class()
+
+	def get_protected_property(self, loops):
+		for _ in loops:
+			self.protected_property
+
+	def set_protected_property(self, loops):
+		for _ in loops:
+			self.protected_property = 0
+
+	def get_private_property(self, loops):
+		for _ in loops:
+			self.private_property
+
+	def set_private_property(self, loops):
+		for _ in loops:
+			self.private_property = 0
+'''
+
+SOURCE = '''
+class Model(Base{keywords}):
+{fields}
+
+	def __init__(self):
+		super().__init__()
+{declarations}
+{accessors}
+{members}
+
+class Child(Model):
+{child_accessors}
+
+class Empty(Base{keywords}):
+	pass
+
+class Wide(Base{keywords}):
+	def __init__(self):
+		super().__init__()
+{wide}
+
+	def read_wide(self, loops):
+		for _ in loops:
+			{wide_read}
+
+	def read_wide_many(self, loops):
+		for _ in loops:
+			{wide_read_many}
+
+	def write_wide(self, loops):
+		for _ in loops:
+{wide_write}
+
+	def write_wide_many(self, loops):
+		for _ in loops:
+{wide_write_many}
+
+class WideBulk(Base{keywords}):
+	def __init__(self):
+		super().__init__()
+{wide_bulk}
+
+def construct(loops):
+	for _ in loops:
+		Model()
+
+def construct_empty(loops):
+	for _ in loops:
+		Empty()
+
+def construct_wide(loops):
+	for _ in loops:
+		Wide()
+
+def construct_wide_bulk(loops):
+	for _ in loops:
+		WideBulk()
+{outside}
+'''
+
+
+def source(flavor: str) -> str:
+	if flavor != 'plain':
+		fields = [f"\t{name} = {declaration}" for name, declaration in FIELDS.items()]
+		declarations = [f"\t\t{declaration}" for declaration in DECLARATIONS.values()]
+		wide = [f"\t\tself.protected_attribute('{name}', 0)" for name in WIDE]
+		wide_bulk = ["\t\tself.declare_attributes(protected={" + ', '.join(f"'{name}': 0" for name in WIDE) + "})"]
+		wide_read_many = f"self.get_many({WIDE!r})"
+		wide_write_many = ["\t\t\tself.set_many({" + ', '.join(f"'{name}': 1" for name in WIDE) + "})"]
+	else:
+		fields = ["\tpass"]
+		declarations = [f"\t\tself.{name} = 0" for name in ATTRIBUTES]
+		wide = wide_bulk = [f"\t\tself.{name} = 0" for name in WIDE]
+		wide_read_many = None
+		wide_write_many = None
+	wide_read = '(' + ', '.join(f"self.{name}" for name in WIDE) + ')'
+	wide_write = [f"\t\t\tself.{name} = 1" for name in WIDE]
+	return SOURCE.format(
+		keywords=', enforce=False' if flavor == 'release' else '',
+		fields='\n'.join(fields),
+		declarations='\n'.join(declarations),
+		wide='\n'.join(wide),
+		wide_bulk='\n'.join(wide_bulk),
+		wide_read=wide_read,
+		wide_read_many=wide_read_many or wide_read,
+		wide_write='\n'.join(wide_write),
+		wide_write_many='\n'.join(wide_write_many or wide_write),
+		accessors=''.join(ACCESSORS.format(prefix='', name=name) for name in ATTRIBUTES),
+		members=MEMBERS,
+		child_accessors=''.join(ACCESSORS.format(prefix='child_', name=name) for name in ATTRIBUTES),
+		outside=''.join(OUTSIDE.format(name=name) for name in ATTRIBUTES),
+	)
+
+
+def namespace(flavor: str) -> dict:
+	ns = builtins(flavor)
+	exec(compile(source(flavor), f'<bench {flavor}>', 'exec'), ns)
+	return ns
+
+
+def builtins(flavor: str) -> dict:
+	if flavor != 'plain':
+		ns = {name: getattr(pyobject, name) for name in (
+			'public', 'protected', 'private', 'final',
+			'protectedmethod', 'privatemethod',
+			'protectedstaticmethod', 'privatestaticmethod',
+			'protectedclassmethod', 'privateclassmethod',
+			'protectedproperty', 'privateproperty',
+		)}
+		ns['Base'] = Object
+	else:
+		ns = {
+			'protectedmethod': pyobject.publicmethod,
+			'privatemethod': pyobject.publicmethod,
+			'protectedstaticmethod': staticmethod,
+			'privatestaticmethod': staticmethod,
+			'protectedclassmethod': classmethod,
+			'privateclassmethod': classmethod,
+			'protectedproperty': property,
+			'privateproperty': property,
+			'Base': object,
+		}
+	ns['AccessError'] = AccessError
+	ns['__name__'] = f'bench_{flavor}'
+	return ns
+
+
+def cases(ns: dict) -> dict:
+	model, child = ns['Model'](), ns['Child']()
+	result = {}
+	for name in ATTRIBUTES:
+		for operation in ('get', 'set'):
+			result[f'{operation}_{name}_inside'] = getattr(model, f'{operation}_{name}')
+			result[f'{operation}_{name}_subclass'] = getattr(child, f'child_{operation}_{name}')
+			outside = ns[f'outside_{operation}_{name}']
+			result[f'{operation}_{name}_outside'] = lambda loops, outside=outside: outside(model, loops)
+	for kind in ('protected', 'private'):
+		for member in ('method', 'static', 'class'):
+			result[f'call_{kind}_{member}'] = getattr(model, f'call_{kind}_{member}')
+		for operation in ('get', 'set'):
+			result[f'{operation}_{kind}_property'] = getattr(model, f'{operation}_{kind}_property')
+	result['construct'] = ns['construct']
+	result['construct_empty'] = ns['construct_empty']
+	result['construct_wide'] = ns['construct_wide']
+	result['construct_wide_bulk'] = ns['construct_wide_bulk']
+	wide = ns['Wide']()
+	for name in ('read_wide', 'read_wide_many', 'write_wide', 'write_wide_many'):
+		result[name] = getattr(wide, name)
+	return result
+
+
+def measure(function, number: int, repeats: int) -> float:
+	best = float('inf')
+	for _ in range(repeats):
+		loops = repeat(None, number)
+		start = perf_counter()
+		function(loops)
+		best = min(best, perf_counter() - start)
+	return best / number * 1e9
+
+
+def run(number: int = 100_000, repeats: int = 5, pattern: str = '', instrument: bool = False, profile: bool = False) -> dict:
+	pyobject.access_controller.instrument(instrument)
+	pyobject.access_controller.profile(profile)
+	measured = cases(namespace('pyobject'))
+	released = cases(namespace('release'))
+	baseline = cases(namespace('plain'))
+	results = []
+	for name, function in measured.items():
+		if pattern not in name:
+			continue
+		pyobject_ns = measure(function, number, repeats)
+		release_ns = measure(released[name], number, repeats)
+		plain_ns = measure(baseline[name], number, repeats)
+		results.append({
+			'case': name,
+			'pyobject_ns': round(pyobject_ns, 1),
+			'release_ns': round(release_ns, 1),
+			'plain_ns': round(plain_ns, 1),
+			'overhead': round(pyobject_ns / plain_ns, 2) if plain_ns else None,
+			'release_overhead': round(release_ns / plain_ns, 2) if plain_ns else None,
+		})
+	return {
+		'python': platform.python_version(),
+		'implementation': platform.python_implementation(),
+		'enforce': pyobject.ENFORCE,
+		'instrument': instrument,
+		'profile': profile,
+		'number': number,
+		'repeat': repeats,
+		'results': results,
+	}
+
+
+def main(argv: list[str] = None) -> int:
+	parser = ArgumentParser(description="Measure pyobject access paths against plain Python classes.")
+	parser.add_argument('-n', '--number', type=int, default=100_000, help="operations per measurement")
+	parser.add_argument('-r', '--repeat', type=int, default=5, help="measurements per case, best is kept")
+	parser.add_argument('-k', '--pattern', default='', help="only run cases whose name contains this string")
+	parser.add_argument('--instrument', action='store_true', help="measure with access check instrumentation enabled")
+	parser.add_argument('--metrics', metavar='PATH', help="write the collected instrumentation as Prometheus text")
+	parser.add_argument('--profile', metavar='PATH', help="write a per-attribute profile of the guarded accesses as JSON")
+	parser.add_argument('--json', metavar='PATH', help="write the results as JSON ('-' for stdout)")
+	args = parser.parse_args(argv)
+	report = run(args.number, args.repeat, args.pattern, args.instrument or bool(args.metrics), bool(args.profile))
+	if args.metrics:
+		pyobject.access_controller.write_metrics(args.metrics)
+	if args.profile:
+		pyobject.access_controller.write_profile(args.profile)
+	if args.json == '-':
+		json.dump(report, sys.stdout, indent=2)
+		print()
+		return 0
+	if args.json:
+		with open(args.json, 'w') as file:
+			json.dump(report, file, indent=2)
+	print(f"{'case':<32}{'pyobject ns':>14}{'release ns':>12}{'plain ns':>12}{'overhead':>10}{'release':>10}")
+	for result in report['results']:
+		print(
+			f"{result['case']:<32}{result['pyobject_ns']:>14.1f}{result['release_ns']:>12.1f}{result['plain_ns']:>12.1f}"
+			f"{result['overhead']:>9.1f}x{result['release_overhead']:>9.2f}x"
+		)
+	return 0
+
+
+if __name__ == '__main__':
+	sys.exit(main())
@@ -0,0 +1,125 @@
+import json
+import os
+import platform
+import sys
+from argparse import ArgumentParser
+from time import perf_counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pyobject
+from benchmarks.bench_access import builtins
+
+KINDS = {
+	'fields': '''
+class Payload{size}(Base{keywords}):
+{fields}
+
+	def __init__(self, payload):
+		super().__init__()
+{assignments}
+''',
+	'attributes': '''
+class Payload{size}(Base{keywords}):
+	def __init__(self, payload):
+		super().__init__()
+{declarations}
+''',
+	'bulk': '''
+class Payload{size}(Base{keywords}):
+	def __init__(self, payload):
+		super().__init__()
+		self.declare_attributes(protected=payload)
+''',
+}
+
+PLAIN = '''
+class Payload{size}:
+	def __init__(self, payload):
+{assignments}
+'''
+
+
+def source(kind: str, flavor: str, size: int) -> str:
+	names = [f'field_{index}' for index in range(size)]
+	assignments = '\n'.join(f"\t\tself.{name} = payload['{name}']" for name in names)
+	if flavor == 'plain':
+		return PLAIN.format(size=size, assignments=assignments)
+	return KINDS[kind].format(
+		size=size,
+		keywords=', enforce=False' if flavor == 'release' else '',
+		fields='\n'.join(f"\t{name} = protected()" for name in names),
+		assignments=assignments,
+		declarations='\n'.join(f"\t\tself.protected_attribute('{name}', payload['{name}'])" for name in names),
+	)
+
+
+def payload_class(kind: str, flavor: str, size: int) -> type:
+	ns = builtins(flavor)
+	exec(compile(source(kind, flavor, size), f'<construct {kind} {flavor}>', 'exec'), ns)
+	return ns[f'Payload{size}']
+
+
+def measure(cls: type, payload: dict, number: int, repeats: int) -> float:
+	payloads = [dict(payload) for _ in range(number)]
+	best = float('inf')
+	for _ in range(repeats):
+		start = perf_counter()
+		for item in payloads:
+			cls(item)
+		best = min(best, perf_counter() - start)
+	return best / number * 1e9
+
+
+def run(number: int = 20_000, repeats: int = 5, sizes: tuple = (4, 32)) -> dict:
+	results = []
+	for size in sizes:
+		payload = {f'field_{index}': index for index in range(size)}
+		plain_ns = measure(payload_class('fields', 'plain', size), payload, number, repeats)
+		for kind in KINDS:
+			pyobject_ns = measure(payload_class(kind, 'pyobject', size), payload, number, repeats)
+			release_ns = measure(payload_class(kind, 'release', size), payload, number, repeats)
+			results.append({
+				'case': f'{kind}_{size}',
+				'pyobject_ns': round(pyobject_ns, 1),
+				'release_ns': round(release_ns, 1),
+				'plain_ns': round(plain_ns, 1),
+				'pyobject_per_second': round(1e9 / pyobject_ns),
+				'overhead': round(pyobject_ns / plain_ns, 2),
+			})
+	return {
+		'python': platform.python_version(),
+		'implementation': platform.python_implementation(),
+		'enforce': pyobject.ENFORCE,
+		'number': number,
+		'repeat': repeats,
+		'results': results,
+	}
+
+
+def main(argv: list[str] = None) -> int:
+	parser = ArgumentParser(description="Measure how many pyobject instances can be built per second.")
+	parser.add_argument('-n', '--number', type=int, default=20_000, help="objects built per measurement")
+	parser.add_argument('-r', '--repeat', type=int, default=5, help="measurements per case, best is kept")
+	parser.add_argument('-s', '--size', type=int, action='append', help="attributes per object (repeatable)")
+	parser.add_argument('--json', metavar='PATH', help="write the results as JSON ('-' for stdout)")
+	args = parser.parse_args(argv)
+	report = run(args.number, args.repeat, tuple(args.size or (4, 32)))
+	if args.json == '-':
+		json.dump(report, sys.stdout, indent=2)
+		print()
+		return 0
+	if args.json:
+		with open(args.json, 'w') as file:
+			json.dump(report, file, indent=2)
+	print(f"{'case':<18}{'pyobject ns':>14}{'release ns':>12}{'plain ns':>12}{'objects/s':>12}{'overhead':>10}")
+	for result in report['results']:
+		print(
+			f"{result['case']:<18}{result['pyobject_ns']:>14.1f}{result['release_ns']:>12.1f}{result['plain_ns']:>12.1f}"
+			f"{result['pyobject_per_second']:>12}{result['overhead']:>9.1f}x"
+		)
+	return 0
+
+
+if __name__ == '__main__':
+	sys.exit(main())
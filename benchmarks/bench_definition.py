@@ -0,0 +1,69 @@
+import json
+import os
+import platform
+import sys
+from argparse import ArgumentParser
+from time import perf_counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pyobject
+from benchmarks.bench_access import builtins, source
+
+
+def definitions(flavor: str) -> tuple:
+	return compile(source(flavor), f'<definition {flavor}>', 'exec'), builtins(flavor)
+
+
+def measure(code, globals_: dict, number: int, repeats: int) -> float:
+	best = float('inf')
+	for _ in range(repeats):
+		start = perf_counter()
+		for _ in range(number):
+			exec(code, dict(globals_))
+		best = min(best, perf_counter() - start)
+	return best / number * 1e6
+
+
+def run(number: int = 200, repeats: int = 5) -> dict:
+	results = []
+	timings = {flavor: measure(*definitions(flavor), number, repeats) for flavor in ('pyobject', 'release', 'plain')}
+	for flavor, us in timings.items():
+		results.append({
+			'flavor': flavor,
+			'module_us': round(us, 1),
+			'class_us': round(us / 3, 1),
+			'overhead': round(us / timings['plain'], 2),
+		})
+	return {
+		'python': platform.python_version(),
+		'implementation': platform.python_implementation(),
+		'enforce': pyobject.ENFORCE,
+		'number': number,
+		'repeat': repeats,
+		'results': results,
+	}
+
+
+def main(argv: list[str] = None) -> int:
+	parser = ArgumentParser(description="Measure how long it takes to define pyobject classes.")
+	parser.add_argument('-n', '--number', type=int, default=200, help="modules defined per measurement")
+	parser.add_argument('-r', '--repeat', type=int, default=5, help="measurements per flavor, best is kept")
+	parser.add_argument('--json', metavar='PATH', help="write the results as JSON ('-' for stdout)")
+	args = parser.parse_args(argv)
+	report = run(args.number, args.repeat)
+	if args.json == '-':
+		json.dump(report, sys.stdout, indent=2)
+		print()
+		return 0
+	if args.json:
+		with open(args.json, 'w') as file:
+			json.dump(report, file, indent=2)
+	print(f"{'flavor':<12}{'module us':>12}{'class us':>12}{'overhead':>10}")
+	for result in report['results']:
+		print(f"{result['flavor']:<12}{result['module_us']:>12.1f}{result['class_us']:>12.1f}{result['overhead']:>9.1f}x")
+	return 0
+
+
+if __name__ == '__main__':
+	sys.exit(main())
@@ -0,0 +1,125 @@
+import json
+import os
+import platform
+import sys
+from argparse import ArgumentParser
+from collections import namedtuple
+from dataclasses import dataclass
+from itertools import repeat
+from time import perf_counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pyobject
+from pyobject import Object, public
+
+SOURCE = '''
+class Point(Object{keywords}):
+	x = public(0)
+	y = public(0)
+
+	def __init__(self, x, y):
+		super().__init__()
+		self.x = x
+		self.y = y
+		self.public_attribute('label', 'point')
+'''
+
+
+@dataclass(frozen=True)
+class DataPoint:
+	x: int
+	y: int
+	label: str = 'point'
+
+
+TuplePoint = namedtuple('TuplePoint', ('x', 'y', 'label'), defaults=('point',))
+
+
+def point_class(frozen: bool) -> type:
+	ns = {'Object': Object, 'public': public}
+	exec(compile(SOURCE.format(keywords=', frozen=True' if frozen else ''), '<bench frozen>', 'exec'), ns)
+	return ns['Point']
+
+
+def cases() -> dict:
+	frozen, mutable = point_class(True), point_class(False)
+	factories = {
+		'frozen': frozen,
+		'object': mutable,
+		'dataclass': DataPoint,
+		'namedtuple': TuplePoint,
+		'tuple': lambda x, y: (x, y, 'point'),
+	}
+	result = {}
+	for name, factory in factories.items():
+		a, b = factory(1, 2), factory(1, 2)
+		if name == 'tuple':
+			read = lambda loops, a=a: [a[0] for _ in loops]
+		else:
+			read = lambda loops, a=a: [a.x for _ in loops]
+		result[name] = {
+			'construct': lambda loops, factory=factory: [factory(1, 2) for _ in loops],
+			'read': read,
+			'hash': (lambda loops, a=a: [hash(a) for _ in loops]) if name != 'object' else None,
+			'eq': (lambda loops, a=a, b=b: [a == b for _ in loops]) if name != 'object' else None,
+		}
+	return result
+
+
+def measure(function, number: int, repeats: int) -> float:
+	best = float('inf')
+	for _ in range(repeats):
+		loops = repeat(None, number)
+		start = perf_counter()
+		function(loops)
+		best = min(best, perf_counter() - start)
+	return best / number * 1e9
+
+
+def run(number: int = 100_000, repeats: int = 5) -> dict:
+	results = []
+	measured = cases()
+	for operation in ('construct', 'read', 'hash', 'eq'):
+		result = {'case': operation}
+		for name, operations in measured.items():
+			function = operations[operation]
+			result[f'{name}_ns'] = None if function is None else round(measure(function, number, repeats), 1)
+		result['overhead'] = round(result['frozen_ns'] / result['tuple_ns'], 2)
+		results.append(result)
+	return {
+		'python': platform.python_version(),
+		'implementation': platform.python_implementation(),
+		'enforce': pyobject.ENFORCE,
+		'number': number,
+		'repeat': repeats,
+		'results': results,
+	}
+
+
+def main(argv: list[str] = None) -> int:
+	parser = ArgumentParser(description="Measure frozen pyobject instances against tuples and frozen dataclasses.")
+	parser.add_argument('-n', '--number', type=int, default=100_000, help="operations per measurement")
+	parser.add_argument('-r', '--repeat', type=int, default=5, help="measurements per case, best is kept")
+	parser.add_argument('--json', metavar='PATH', help="write the results as JSON ('-' for stdout)")
+	args = parser.parse_args(argv)
+	report = run(args.number, args.repeat)
+	if args.json == '-':
+		json.dump(report, sys.stdout, indent=2)
+		print()
+		return 0
+	if args.json:
+		with open(args.json, 'w') as file:
+			json.dump(report, file, indent=2)
+	columns = ('frozen', 'object', 'dataclass', 'namedtuple', 'tuple')
+	print(f"{'case':<12}" + ''.join(f"{name + ' ns':>16}" for name in columns) + f"{'vs tuple':>10}")
+	for result in report['results']:
+		cells = ''.join(
+			f"{'-':>16}" if result[f'{name}_ns'] is None else f"{result[f'{name}_ns']:>16.1f}" for name in columns
+		)
+		print(f"{result['case']:<12}{cells}{result['overhead']:>9.1f}x")
+	return 0
+
+
+if __name__ == '__main__':
+	sys.exit(main())
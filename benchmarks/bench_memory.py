@@ -0,0 +1,81 @@
+import gc
+import json
+import os
+import platform
+import sys
+import tracemalloc
+from argparse import ArgumentParser
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pyobject
+from benchmarks.bench_construct import KINDS, payload_class
+from pyobject import access_controller
+
+
+def measure(cls: type, payload: dict, number: int) -> tuple:
+	payloads = [dict(payload) for _ in range(number)]
+	cls(payloads[0])
+	gc.collect()
+	tracemalloc.start()
+	before = tracemalloc.get_traced_memory()[0]
+	instances = [cls(item) for item in payloads]
+	after = tracemalloc.get_traced_memory()[0]
+	tracemalloc.stop()
+	info = access_controller.memory_info()['classes'].get(cls, {'instance_bytes': 0, 'class_bytes': 0})
+	del instances
+	gc.collect()
+	return (after - before) / number, info['instance_bytes'] / number, info['class_bytes']
+
+
+def run(number: int = 10_000, sizes: tuple = (4, 32)) -> dict:
+	results = []
+	for size in sizes:
+		payload = {f'field_{index}': index for index in range(size)}
+		plain_bytes, _, _ = measure(payload_class('fields', 'plain', size), payload, number)
+		for kind in KINDS:
+			pyobject_bytes, controller_bytes, class_bytes = measure(payload_class(kind, 'pyobject', size), payload, number)
+			release_bytes, _, _ = measure(payload_class(kind, 'release', size), payload, number)
+			results.append({
+				'case': f'{kind}_{size}',
+				'pyobject_bytes': round(pyobject_bytes, 1),
+				'controller_bytes': round(controller_bytes, 1),
+				'class_bytes': class_bytes,
+				'release_bytes': round(release_bytes, 1),
+				'plain_bytes': round(plain_bytes, 1),
+				'overhead': round(pyobject_bytes / plain_bytes, 2),
+			})
+	return {
+		'python': platform.python_version(),
+		'implementation': platform.python_implementation(),
+		'enforce': pyobject.ENFORCE,
+		'number': number,
+		'results': results,
+	}
+
+
+def main(argv: list[str] = None) -> int:
+	parser = ArgumentParser(description="Measure memory per pyobject instance against plain Python classes.")
+	parser.add_argument('-n', '--number', type=int, default=10_000, help="instances kept alive per measurement")
+	parser.add_argument('-s', '--size', type=int, action='append', help="attributes per object (repeatable)")
+	parser.add_argument('--json', metavar='PATH', help="write the results as JSON ('-' for stdout)")
+	args = parser.parse_args(argv)
+	report = run(args.number, tuple(args.size or (4, 32)))
+	if args.json == '-':
+		json.dump(report, sys.stdout, indent=2)
+		print()
+		return 0
+	if args.json:
+		with open(args.json, 'w') as file:
+			json.dump(report, file, indent=2)
+	print(f"{'case':<16}{'pyobject B':>12}{'controller B':>14}{'class B':>10}{'release B':>12}{'plain B':>10}{'overhead':>10}")
+	for result in report['results']:
+		print(
+			f"{result['case']:<16}{result['pyobject_bytes']:>12.1f}{result['controller_bytes']:>14.1f}{result['class_bytes']:>10}"
+			f"{result['release_bytes']:>12.1f}{result['plain_bytes']:>10.1f}{result['overhead']:>9.2f}x"
+		)
+	return 0
+
+
+if __name__ == '__main__':
+	sys.exit(main())
@@ -0,0 +1,125 @@
+import copy
+import json
+import os
+import pickle
+import platform
+import sys
+from argparse import ArgumentParser
+from time import perf_counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pyobject
+from pyobject import Object
+
+
+class Record(Object):
+	def __init__(self, payload):
+		super().__init__()
+		self.declare_attributes(protected=payload)
+
+
+class ReleasedRecord(Object, enforce=False):
+	def __init__(self, payload):
+		super().__init__()
+		self.declare_attributes(protected=payload)
+
+
+class PlainRecord:
+	def __init__(self, payload):
+		self.__dict__.update(payload)
+
+
+FLAVORS = {'pyobject': Record, 'release': ReleasedRecord, 'plain': PlainRecord}
+
+
+def pickle_roundtrip(objects: list):
+	pickle.loads(pickle.dumps(objects, 5))
+
+
+def pickle_out_of_band(objects: list):
+	buffers = []
+	data = pickle.dumps(objects, 5, buffer_callback=buffers.append)
+	pickle.loads(data, buffers=buffers)
+
+
+OPERATIONS = {
+	'copy': lambda objects: [copy.copy(item) for item in objects],
+	'deepcopy': copy.deepcopy,
+	'pickle': pickle_roundtrip,
+	'pickle_oob': pickle_out_of_band,
+}
+
+
+def payloads(sizes: tuple, blob: int) -> dict:
+	result = {f'{size}': lambda size=size: {f'field_{index}': index for index in range(size)} for size in sizes}
+	if blob:
+		result['blob'] = lambda: {'blob': bytes(blob)}
+	return result
+
+
+def measure(operation, objects: list, repeats: int) -> float:
+	best = float('inf')
+	for _ in range(repeats):
+		start = perf_counter()
+		operation(objects)
+		best = min(best, perf_counter() - start)
+	return best / len(objects) * 1e9
+
+
+def run(number: int = 5_000, repeats: int = 5, sizes: tuple = (4, 32), blob: int = 1 << 20) -> dict:
+	results = []
+	for name, payload in payloads(sizes, blob).items():
+		count = max(1, number // 100) if name == 'blob' else number
+		objects = {
+			flavor: [cls(payload()) for _ in range(count)]
+			for flavor, cls in FLAVORS.items()
+		}
+		for operation, function in OPERATIONS.items():
+			timings = {flavor: measure(function, objects[flavor], repeats) for flavor in FLAVORS}
+			results.append({
+				'case': f'{operation}_{name}',
+				'pyobject_ns': round(timings['pyobject'], 1),
+				'release_ns': round(timings['release'], 1),
+				'plain_ns': round(timings['plain'], 1),
+				'pyobject_per_second': round(1e9 / timings['pyobject']),
+				'overhead': round(timings['pyobject'] / timings['plain'], 2),
+			})
+		results[-1]['pickled_bytes'] = len(pickle.dumps(objects['pyobject'], 5)) // count
+	return {
+		'python': platform.python_version(),
+		'implementation': platform.python_implementation(),
+		'enforce': pyobject.ENFORCE,
+		'number': number,
+		'repeat': repeats,
+		'results': results,
+	}
+
+
+def main(argv: list[str] = None) -> int:
+	parser = ArgumentParser(description="Measure copy, deepcopy and pickle throughput of pyobject instances.")
+	parser.add_argument('-n', '--number', type=int, default=5_000, help="objects per measurement")
+	parser.add_argument('-r', '--repeat', type=int, default=5, help="measurements per case, best is kept")
+	parser.add_argument('-s', '--size', type=int, action='append', help="attributes per object (repeatable)")
+	parser.add_argument('-b', '--blob', type=int, default=1 << 20, help="bytes of the large value case, 0 to skip")
+	parser.add_argument('--json', metavar='PATH', help="write the results as JSON ('-' for stdout)")
+	args = parser.parse_args(argv)
+	report = run(args.number, args.repeat, tuple(args.size or (4, 32)), args.blob)
+	if args.json == '-':
+		json.dump(report, sys.stdout, indent=2)
+		print()
+		return 0
+	if args.json:
+		with open(args.json, 'w') as file:
+			json.dump(report, file, indent=2)
+	print(f"{'case':<18}{'pyobject ns':>14}{'release ns':>12}{'plain ns':>12}{'objects/s':>12}{'overhead':>10}")
+	for result in report['results']:
+		print(
+			f"{result['case']:<18}{result['pyobject_ns']:>14.1f}{result['release_ns']:>12.1f}{result['plain_ns']:>12.1f}"
+			f"{result['pyobject_per_second']:>12}{result['overhead']:>9.1f}x"
+		)
+	return 0
+
+
+if __name__ == '__main__':
+	sys.exit(main())
@@ -0,0 +1,106 @@
+import json
+import os
+import platform
+import subprocess
+import sys
+from argparse import ArgumentParser
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PRELUDES = {
+	'pyobject': "from pyobject import Object, private, privatemethod, protectedproperty\n",
+	'release': "from pyobject import Object, private, privatemethod, protectedproperty\n",
+	'plain': "Object = object\nprivate = privatemethod = lambda value: value\nprotectedproperty = property\n",
+}
+
+CLASS = '''
+class Model{index}(Object):
+	value = private(0)
+
+	def __init__(self):
+		super().__init__()
+		self.protected_attribute('name', 0)
+
+	@privatemethod
+	def method(self):
+		return self.value
+
+	@protectedproperty
+	def prop(self):
+		return 0
+'''
+
+
+def script(flavor: str, classes: int) -> str:
+	return PRELUDES[flavor] + ''.join(CLASS.format(index=index) for index in range(classes))
+
+
+def cases(sizes: tuple) -> dict:
+	result = {'interpreter': ('plain', ''), 'import': ('pyobject', 'import pyobject\n')}
+	for size in sizes:
+		for flavor in PRELUDES:
+			result[f'define_{size}_{flavor}'] = (flavor, script(flavor, size))
+	return result
+
+
+def measure(command: list, env: dict, repeats: int) -> float:
+	subprocess.run(command, cwd=ROOT, env=env, check=True)
+	best = float('inf')
+	for _ in range(repeats):
+		start = perf_counter()
+		subprocess.run(command, cwd=ROOT, env=env, check=True)
+		best = min(best, perf_counter() - start)
+	return best * 1e3
+
+
+def run(repeats: int = 10, sizes: tuple = (1_000, 10_000)) -> dict:
+	results = []
+	with TemporaryDirectory() as directory:
+		env = {key: value for key, value in os.environ.items() if key not in ('PYTHONDONTWRITEBYTECODE', 'PYOBJECT_RELEASE')}
+		env['PYTHONPYCACHEPREFIX'] = os.path.join(directory, 'cache')
+		env['PYTHONPATH'] = os.pathsep.join((directory, ROOT))
+		baseline = None
+		for name, (flavor, code) in cases(sizes).items():
+			with open(os.path.join(directory, f'startup_{name}.py'), 'w') as file:
+				file.write(code)
+			command = [sys.executable, '-c', f'import startup_{name}']
+			ms = measure(command, {**env, 'PYOBJECT_RELEASE': '1'} if flavor == 'release' else env, repeats)
+			if baseline is None:
+				baseline = ms
+			results.append({
+				'case': name,
+				'ms': round(ms, 2),
+				'net_ms': round(ms - baseline, 2),
+			})
+	return {
+		'python': platform.python_version(),
+		'implementation': platform.python_implementation(),
+		'repeat': repeats,
+		'results': results,
+	}
+
+
+def main(argv: list[str] = None) -> int:
+	parser = ArgumentParser(description="Measure interpreter startup with pyobject imported and classes defined.")
+	parser.add_argument('-r', '--repeat', type=int, default=10, help="processes started per case, best is kept")
+	parser.add_argument('-s', '--size', type=int, action='append', help="number of classes defined (repeatable)")
+	parser.add_argument('--json', metavar='PATH', help="write the results as JSON ('-' for stdout)")
+	args = parser.parse_args(argv)
+	report = run(args.repeat, tuple(args.size or (1_000, 10_000)))
+	if args.json == '-':
+		json.dump(report, sys.stdout, indent=2)
+		print()
+		return 0
+	if args.json:
+		with open(args.json, 'w') as file:
+			json.dump(report, file, indent=2)
+	print(f"{'case':<28}{'ms':>10}{'net ms':>10}")
+	for result in report['results']:
+		print(f"{result['case']:<28}{result['ms']:>10.2f}{result['net_ms']:>10.2f}")
+	return 0
+
+
+if __name__ == '__main__':
+	sys.exit(main())
@@ -0,0 +1,100 @@
+import json
+import os
+import platform
+import sys
+from argparse import ArgumentParser
+from threading import Barrier, Thread
+from time import perf_counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pyobject
+from pyobject import Object, access_controller, protected
+
+
+class Model(Object):
+	value = protected(0)
+
+	def __init__(self) -> None:
+		super().__init__()
+		self.protected_attribute('protected', 0)
+
+	def read_attribute(self, count: int) -> None:
+		for _ in range(count):
+			self.protected
+
+	def read_field(self, count: int) -> None:
+		for _ in range(count):
+			self.value
+
+
+CASES = ('read_attribute', 'read_field')
+
+
+def measure(case: str, threads: int, number: int) -> float:
+	objects = [Model() for _ in range(threads)]
+	barrier = Barrier(threads + 1)
+
+	def target(obj: Model) -> None:
+		barrier.wait()
+		getattr(obj, case)(number)
+
+	workers = [Thread(target=target, args=(obj,)) for obj in objects]
+	for worker in workers:
+		worker.start()
+	barrier.wait()
+	start = perf_counter()
+	for worker in workers:
+		worker.join()
+	return threads * number / (perf_counter() - start)
+
+
+def run(number: int = 100_000, threads: tuple[int, ...] = (1, 2, 4, 8), repeats: int = 3) -> dict:
+	results = []
+	for case in CASES:
+		single = None
+		for count in threads:
+			ops = max(measure(case, count, number) for _ in range(repeats))
+			single = single or ops
+			results.append({
+				'case': case,
+				'threads': count,
+				'ops_per_second': round(ops),
+				'scaling': round(ops / single, 2),
+			})
+	return {
+		'python': platform.python_version(),
+		'implementation': platform.python_implementation(),
+		'gil': getattr(sys, '_is_gil_enabled', lambda: True)(),
+		'enforce': pyobject.ENFORCE,
+		'number': number,
+		'repeat': repeats,
+		'cache': access_controller.cache_info(),
+		'results': results,
+	}
+
+
+def main(argv: list[str] = None) -> int:
+	parser = ArgumentParser(description="Measure protected reads from several threads at once.")
+	parser.add_argument('-n', '--number', type=int, default=100_000, help="reads per thread")
+	parser.add_argument('-t', '--threads', type=int, nargs='+', default=[1, 2, 4, 8], help="thread counts to measure")
+	parser.add_argument('-r', '--repeat', type=int, default=3, help="measurements per thread count, best is kept")
+	parser.add_argument('--json', metavar='PATH', help="write the results as JSON ('-' for stdout)")
+	args = parser.parse_args(argv)
+	report = run(args.number, tuple(args.threads), args.repeat)
+	if args.json == '-':
+		json.dump(report, sys.stdout, indent=2)
+		print()
+		return 0
+	if args.json:
+		with open(args.json, 'w') as file:
+			json.dump(report, file, indent=2)
+	print(f"python {report['python']} ({report['implementation']}), gil={'on' if report['gil'] else 'off'}")
+	print(f"{'case':<20}{'threads':>8}{'ops/s':>14}{'scaling':>10}")
+	for result in report['results']:
+		print(f"{result['case']:<20}{result['threads']:>8}{result['ops_per_second']:>14}{result['scaling']:>9.2f}x")
+	return 0
+
+
+if __name__ == '__main__':
+	sys.exit(main())
@@ -0,0 +1,37 @@
+import gc
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pyobject import Object, access_controller
+
+
+class Model(Object):
+	def __init__(self) -> None:
+		super().__init__()
+		self.protected_attribute("protected", 0)
+		self.private_attribute("private", 0)
+
+
+def main(total: int = 20_000_000, report: int = 1_000_000):
+	gc.collect()
+	size = len(access_controller.objects)
+	start = time.perf_counter()
+	for i in range(1, total + 1):
+		a, b = Model(), Model()
+		if i % 1_000 == 0:
+			a.other, b.other = b, a
+		del a, b
+		if i % report == 0:
+			gc.collect()
+			print(f"{i:>12} objects  registry={len(access_controller.objects) - size}  {time.perf_counter() - start:.1f}s", flush=True)
+	gc.collect()
+	growth = len(access_controller.objects) - size
+	print(f"registry growth after {total} objects: {growth}")
+	return growth
+
+
+if __name__ == '__main__':
+	sys.exit(1 if main(*map(int, sys.argv[1:])) else 0)
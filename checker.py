@@ -0,0 +1,358 @@
+import ast
+import json
+import sys
+from argparse import ArgumentParser
+from os import sep, walk
+from os.path import basename, isdir, join, relpath
+
+
+ACCESS_DECORATORS = {
+	'protectedmethod': 'protected',
+	'privatemethod': 'private',
+	'protectedstaticmethod': 'protected',
+	'privatestaticmethod': 'private',
+	'protectedclassmethod': 'protected',
+	'privateclassmethod': 'private',
+	'protectedproperty': 'protected',
+	'privateproperty': 'private',
+}
+
+STATIC_DECORATORS = {'staticmethod', 'publicstaticmethod', 'protectedstaticmethod', 'privatestaticmethod'}
+
+ATTRIBUTE_DECLARATIONS = {
+	'public_attribute': 'public',
+	'protected_attribute': 'protected',
+	'private_attribute': 'private',
+}
+
+FIELD_DECLARATIONS = {'public', 'protected', 'private', 'final'}
+
+NESTED_SCOPES = (ast.Lambda, ast.ListComp, ast.SetComp, ast.DictComp, ast.GeneratorExp)
+
+
+def name_of(node: ast.expr) -> str:
+	if isinstance(node, ast.Call):
+		node = node.func
+	if isinstance(node, ast.Attribute):
+		return node.attr
+	if isinstance(node, ast.Name):
+		return node.id
+	return None
+
+
+class Member:
+	__slots__ = ('name', 'access_mode', 'owner', 'line')
+
+	def __init__(self, name: str, access_mode: str, owner: 'ClassInfo', line: int) -> None:
+		self.name = name
+		self.access_mode = access_mode
+		self.owner = owner
+		self.line = line
+
+
+class ClassInfo:
+	__slots__ = ('name', 'qualname', 'filename', 'bases', 'members')
+
+	def __init__(self, name: str, qualname: str, filename: str, bases: list[str]) -> None:
+		self.name = name
+		self.qualname = qualname
+		self.filename = filename
+		self.bases = bases
+		self.members = {}
+
+
+class Scope:
+	__slots__ = ('name', 'line', 'classes', 'owner', 'receiver', 'rebound')
+
+	def __init__(self, name: str, line: int, classes: tuple, owner: ClassInfo = None, receiver: str = None) -> None:
+		self.name = name
+		self.line = line
+		self.classes = classes
+		self.owner = owner
+		self.receiver = receiver
+		self.rebound = False
+
+
+class Site:
+	__slots__ = ('filename', 'path', 'line', 'column', 'scope', 'attribute', 'receiver', 'owners')
+
+	def __init__(self, filename: str, path: str, node: ast.Attribute, scope: Scope) -> None:
+		self.filename = filename
+		self.path = path
+		self.line = node.lineno
+		self.column = node.col_offset
+		self.scope = scope
+		self.attribute = node.attr
+		self.receiver = node.value.id if isinstance(node.value, ast.Name) else None
+		self.owners = ()
+
+
+class Violation:
+	__slots__ = ('filename', 'line', 'column', 'message')
+
+	def __init__(self, site: Site, message: str) -> None:
+		self.filename = site.filename
+		self.line = site.line
+		self.column = site.column
+		self.message = message
+
+	def __str__(self) -> str:
+		return f"{self.filename}:{self.line}:{self.column + 1}: {self.message}"
+
+
+class Collector(ast.NodeVisitor):
+	def __init__(self, filename: str, path: str) -> None:
+		self.filename = filename
+		self.path = path
+		self.classes = []
+		self.sites = []
+		self.qualname = []
+		self.classes_stack = []
+		self.scope = Scope(None, 0, ())
+
+	def visit_ClassDef(self, node: ast.ClassDef) -> None:
+		for child in node.bases + node.keywords + node.decorator_list:
+			self.visit(child)
+		info = ClassInfo(node.name, '.'.join(self.qualname + [node.name]), self.filename, [name_of(base) for base in node.bases])
+		self.classes.append(info)
+		scope = self.scope
+		self.qualname.append(node.name)
+		self.classes_stack.append(info)
+		self.scope = Scope(None, node.lineno, tuple(self.classes_stack))
+		for statement in node.body:
+			self.declare_field(info, statement)
+			if isinstance(statement, (ast.FunctionDef, ast.AsyncFunctionDef)):
+				self.visit_function(statement, info)
+			else:
+				self.visit(statement)
+		self.classes_stack.pop()
+		self.qualname.pop()
+		self.scope = scope
+
+	def declare_field(self, info: ClassInfo, statement: ast.stmt) -> None:
+		if isinstance(statement, ast.Assign) and len(statement.targets) == 1:
+			target, value = statement.targets[0], statement.value
+		elif isinstance(statement, ast.AnnAssign) and statement.value is not None:
+			target, value = statement.target, statement.value
+		else:
+			return
+		if not isinstance(target, ast.Name) or not isinstance(value, ast.Call):
+			return
+		access_mode = None
+		while isinstance(value, ast.Call) and name_of(value) in FIELD_DECLARATIONS:
+			declaration = name_of(value)
+			if declaration != 'final':
+				access_mode = declaration
+				break
+			access_mode = 'public'
+			if not value.args or not isinstance(value.args[0], ast.Call):
+				break
+			value = value.args[0]
+		if access_mode is not None:
+			info.members[target.id] = Member(target.id, access_mode, info, statement.lineno)
+
+	def visit_function(self, node: ast.FunctionDef, info: ClassInfo) -> None:
+		decorators = [name_of(decorator) for decorator in node.decorator_list]
+		for decorator in decorators:
+			if decorator in ACCESS_DECORATORS:
+				info.members[node.name] = Member(node.name, ACCESS_DECORATORS[decorator], info, node.lineno)
+		arguments = node.args.posonlyargs + node.args.args
+		receiver = None
+		if arguments and not STATIC_DECORATORS.intersection(decorators):
+			receiver = arguments[0].arg
+		line = min([node.lineno] + [decorator.lineno for decorator in node.decorator_list])
+		self.visit_scope(node, Scope(node.name, line, tuple(self.classes_stack), info, receiver))
+
+	def visit_scope(self, node: ast.AST, scope: Scope) -> None:
+		previous = self.scope
+		self.qualname.append(scope.name or '<lambda>')
+		self.qualname.append('<locals>')
+		for child in node.decorator_list if hasattr(node, 'decorator_list') else ():
+			self.visit(child)
+		self.scope = scope
+		for child in ast.iter_child_nodes(node):
+			if hasattr(node, 'decorator_list') and child in node.decorator_list:
+				continue
+			self.visit(child)
+		self.scope = previous
+		del self.qualname[-2:]
+
+	def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+		line = min([node.lineno] + [decorator.lineno for decorator in node.decorator_list])
+		self.visit_scope(node, Scope(node.name, line, tuple(self.classes_stack)))
+
+	visit_AsyncFunctionDef = visit_FunctionDef
+
+	def generic_visit(self, node: ast.AST) -> None:
+		if isinstance(node, NESTED_SCOPES):
+			self.visit_scope(node, Scope(None, node.lineno, tuple(self.classes_stack)))
+		else:
+			super().generic_visit(node)
+
+	def visit_Call(self, node: ast.Call) -> None:
+		scope = self.scope
+		if (scope.owner is not None and isinstance(node.func, ast.Attribute) and
+			isinstance(node.func.value, ast.Name) and node.func.value.id == scope.receiver):
+			declaration = node.func.attr
+			if declaration == 'declare_attributes':
+				self.declare_attributes(scope.owner, node)
+			access_mode = ATTRIBUTE_DECLARATIONS.get(declaration)
+			arguments = {keyword.arg: keyword.value for keyword in node.keywords}
+			arguments.update(zip(('name', 'access_mode'), node.args))
+			if declaration == 'new_attribute':
+				mode = arguments.get('access_mode')
+				access_mode = mode.value if isinstance(mode, ast.Constant) else 'public'
+			name = arguments.get('name')
+			if access_mode is not None and isinstance(name, ast.Constant) and isinstance(name.value, str):
+				scope.owner.members.setdefault(name.value, Member(name.value, access_mode, scope.owner, node.lineno))
+		self.generic_visit(node)
+
+	def declare_attributes(self, info: ClassInfo, node: ast.Call) -> None:
+		arguments = {keyword.arg: keyword.value for keyword in node.keywords}
+		arguments.update(zip(('public', 'protected', 'private'), node.args))
+		for access_mode in ('public', 'protected', 'private'):
+			members = arguments.get(access_mode)
+			if not isinstance(members, ast.Dict):
+				continue
+			for key in members.keys:
+				if isinstance(key, ast.Constant) and isinstance(key.value, str):
+					info.members.setdefault(key.value, Member(key.value, access_mode, info, node.lineno))
+
+	def visit_Attribute(self, node: ast.Attribute) -> None:
+		self.sites.append(Site(self.filename, self.path, node, self.scope))
+		self.generic_visit(node)
+
+	def visit_Name(self, node: ast.Name) -> None:
+		if not isinstance(node.ctx, ast.Load) and node.id == self.scope.receiver:
+			self.scope.rebound = True
+
+
+class Checker:
+	def __init__(self) -> None:
+		self.classes = []
+		self.sites = []
+		self.errors = []
+
+	def add_source(self, source: str, filename: str, root: str = None) -> None:
+		try:
+			tree = ast.parse(source, filename)
+		except SyntaxError as error:
+			self.errors.append(f"{filename}:{error.lineno}: {error.msg}")
+			return
+		path = basename(filename) if root is None else relpath(filename, root)
+		collector = Collector(filename, path.replace(sep, '/'))
+		collector.visit(tree)
+		self.classes.extend(collector.classes)
+		self.sites.extend(collector.sites)
+
+	def add_path(self, path: str, root: str = None) -> None:
+		if isdir(path):
+			for directory, directories, files in walk(path):
+				directories[:] = sorted(directory for directory in directories if not directory.startswith('.'))
+				for file in sorted(files):
+					if file.endswith('.py'):
+						self.add_path(join(directory, file), path if root is None else root)
+			return
+		with open(path, encoding='utf-8') as file:
+			self.add_source(file.read(), path, root)
+
+	def object_classes(self) -> dict[str, list[ClassInfo]]:
+		names = {}
+		for info in self.classes:
+			names.setdefault(info.name, []).append(info)
+		objects = {'Object'}
+		changed = True
+		while changed:
+			changed = False
+			for info in self.classes:
+				if info.name not in objects and objects.intersection(info.bases):
+					objects.add(info.name)
+					changed = True
+		return {name: infos for name, infos in names.items() if name in objects}
+
+	def ancestors(self, info: ClassInfo, classes: dict[str, list[ClassInfo]]) -> list[ClassInfo]:
+		result = [info]
+		for base in info.bases:
+			for parent in classes.get(base, ()):
+				if parent is not info:
+					result.extend(ancestor for ancestor in self.ancestors(parent, classes) if ancestor not in result)
+		return result
+
+	def check(self) -> tuple[list[Violation], list[Site]]:
+		classes = self.object_classes()
+		ancestry = {id(info): self.ancestors(info, classes) for infos in classes.values() for info in infos}
+		declarations = {}
+		for infos in classes.values():
+			for info in infos:
+				for member in info.members.values():
+					declarations.setdefault(member.name, []).append(member)
+		unproven = {
+			(id(site.scope), site.attribute) for site in self.sites
+			if site.scope.owner is not None and (site.scope.rebound or site.receiver != site.scope.receiver)
+		}
+		violations, proven = [], []
+		for site in self.sites:
+			members = declarations.get(site.attribute)
+			if not members or any(member.access_mode == 'public' for member in members):
+				continue
+			scope = site.scope
+			if scope.owner is not None and id(scope.owner) in ancestry:
+				if site.receiver is None or site.receiver != scope.receiver:
+					continue
+				ancestors = ancestry[id(scope.owner)]
+				related = [
+					member for member in members
+					if member.owner in ancestors or scope.owner in ancestry[id(member.owner)]
+				]
+				inherited = [member for member in related if member.owner in ancestors]
+				if not inherited:
+					continue
+				denied = [member for member in inherited if member.access_mode == 'private' and member.owner is not scope.owner]
+				if denied:
+					violations.append(Violation(site, f"'{site.attribute}' is private to '{denied[0].owner.qualname}'"))
+				elif (id(scope), site.attribute) in unproven:
+					continue
+				elif all(member.access_mode == 'protected' or member.owner is scope.owner for member in related):
+					site.owners = tuple(member.owner.qualname for member in related)
+					proven.append(site)
+			elif not any(id(info) in ancestry for info in scope.classes):
+				member = members[0]
+				violations.append(Violation(site, f"'{site.attribute}' is {member.access_mode} to '{member.owner.qualname}'"))
+		return violations, proven
+
+	def manifest(self, proven: list[Site]) -> dict:
+		sites = sorted({
+			(site.path, site.scope.line, site.scope.name, site.attribute, owner)
+			for site in proven for owner in site.owners
+		})
+		return {
+			'version': 2,
+			'sites': [
+				{'file': path, 'line': line, 'function': function, 'attribute': attribute, 'class': owner}
+				for path, line, function, attribute, owner in sites
+			],
+		}
+
+
+def main(argv: list[str] = None) -> int:
+	parser = ArgumentParser(description="Check pyobject access rules without running the code.")
+	parser.add_argument('paths', nargs='+', help="files or directories to check")
+	parser.add_argument('-m', '--manifest', metavar='PATH', help="write the call sites proven safe as a JSON manifest")
+	args = parser.parse_args(argv)
+	checker = Checker()
+	for path in args.paths:
+		checker.add_path(path)
+	violations, proven = checker.check()
+	for error in checker.errors:
+		print(error, file=sys.stderr)
+	for violation in violations:
+		print(violation)
+	if args.manifest:
+		with open(args.manifest, 'w') as file:
+			json.dump(checker.manifest(proven), file, indent=2)
+	print(f"{len(violations)} violation(s), {len(proven)} site(s) proven safe", file=sys.stderr)
+	return 1 if violations or checker.errors else 0
+
+
+if __name__ == '__main__':
+	sys.exit(main())
@@ -1,10 +1,26 @@
+from __future__ import annotations
+
 from abc import ABCMeta, abstractmethod
+from contextvars import ContextVar
+from copyreg import __newobj__
+from os import environ, sep
+from threading import RLock, current_thread, local
+from time import monotonic, perf_counter_ns
 from enum import Enum, auto
-from inspect import FrameInfo
-from types import MethodType
-from typing import Any, Callable
+from functools import wraps
+from sys import _getframe, getsizeof
+from types import CodeType, FrameType, MappingProxyType, MethodType
+from weakref import WeakValueDictionary
+
+from utils import caller, caller_code
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+	from typing import Any, Callable, Iterable
 
-from utils import getBase, getBaseByName, stack
+
+ENFORCE = environ.get('PYOBJECT_RELEASE', '').lower() in ('', '0', 'false', 'no', 'off')
+OUT_OF_BAND_SIZE = 64 * 1024
 
 
 class AccessErrors(Enum):
@@ -39,73 +55,410 @@ class _Object(metaclass=ABCMeta):
 	def private_attribute(self, name: str, value: Any = None, final: bool = False):
 		pass
 
+	@abstractmethod
+	def declare_attributes(
+			self,
+			public: dict[str, Any] = None,
+			protected: dict[str, Any] = None,
+			private: dict[str, Any] = None,
+			final: Iterable[str] = ()
+		):
+		pass
+
+	@abstractmethod
+	def get_many(self, names: Iterable[str]) -> tuple:
+		pass
+
+	@abstractmethod
+	def set_many(self, mapping: dict[str, Any]):
+		pass
+
+
+class _Missing:
+	__slots__ = ()
+
+	def __reduce__(self) -> str:
+		return '_MISSING'
+
+
+_MISSING = _Missing()
+
+
+def _unpickle_buffer(kind: type, buffer: Any) -> Any:
+	return buffer if type(buffer) is kind else kind(buffer)
+
+
+class _PickleBuffer:
+	__slots__ = ('value',)
+
+	def __init__(self, value: bytes | bytearray) -> None:
+		self.value = value
+
+	def __reduce_ex__(self, protocol: int) -> tuple:
+		from pickle import PickleBuffer
+		return (_unpickle_buffer, (type(self.value), PickleBuffer(self.value)))
+
+
+class Declaration:
+	__slots__ = ('value', 'access_mode', 'final')
+
+	def __init__(self, value: Any = _MISSING, access_mode: str = 'public', final: bool = False) -> None:
+		self.value = value
+		self.access_mode = access_mode
+		self.final = final
+
+
+def public(value: Any = _MISSING, final: bool = False) -> Declaration:
+	return Declaration(value, 'public', final)
+
+
+def protected(value: Any = _MISSING, final: bool = False) -> Declaration:
+	return Declaration(value, 'protected', final)
+
+
+def private(value: Any = _MISSING, final: bool = False) -> Declaration:
+	return Declaration(value, 'private', final)
+
+
+def final(declaration: Any = _MISSING) -> Declaration:
+	if isinstance(declaration, Declaration):
+		return Declaration(declaration.value, declaration.access_mode, True)
+	return Declaration(declaration, 'public', True)
+
 
 def _object() -> type[_Object]:
 	class Attribute:
-		__slots__ = ('name', 'value', 'access_mode', 'final', 'base_class')
+		__slots__ = ('name', 'access_mode', 'final', 'base_class', 'slot')
 
 		def __init__(
 				self, 
 				name: str, 
-				value: Any = None, 
 				access_mode: str = 'public', 
 				final: bool = False, 
-				base_class: type[_Object] = None
+				base_class: type[_Object] = None,
+				slot: int = 0
 			) -> None:
 			self.name = name
-			self.value = value
 			self.access_mode = access_mode
 			self.final = final
 			self.base_class = base_class
+			self.slot = slot
 			# print("Attribute '%s' created with access mode '%s' from class '%s'" % (name, access_mode, base_class.__name__))
 
+	class Shape:
+		__slots__ = ('attributes', 'size', 'defaults', 'transitions', 'signature', 'public')
+
+		def __init__(self, attributes: dict[str, Attribute], size: int, defaults: tuple = ()) -> None:
+			self.attributes = attributes
+			self.size = size
+			self.defaults = defaults
+			self.transitions = {}
+			self.signature = None
+			self.public = None
+		
+		def declare(self, name: str, access_mode: str, final: bool, base_class: type[_Object]) -> 'Shape':
+			key = (name, access_mode, final, base_class)
+			try:
+				return self.transitions[key]
+			except KeyError:
+				pass
+			previous = self.attributes.get(name)
+			if (previous is not None and previous.access_mode == access_mode and 
+				previous.final == final and previous.base_class is base_class):
+				shape = self
+			elif previous is None:
+				attribute = Attribute(name, access_mode, final, base_class, self.size)
+				shape = Shape({**self.attributes, name: attribute}, self.size + 1, self.defaults)
+			else:
+				attribute = Attribute(name, access_mode, final, base_class, previous.slot)
+				shape = Shape({**self.attributes, name: attribute}, self.size, self.defaults)
+			return self.transitions.setdefault(key, shape)
+		
+		def extend(self, names: tuple, access_mode: str, final: frozenset, base_class: type[_Object]) -> tuple:
+			key = (names, access_mode, final, base_class)
+			try:
+				return self.transitions[key]
+			except KeyError:
+				pass
+			shape = self
+			for name in names:
+				shape = shape.declare(name, access_mode, name in final, base_class)
+			slots = [shape.attributes[name].slot for name in names]
+			span = slice(slots[0], slots[-1] + 1) if slots == list(range(slots[0], slots[0] + len(slots))) else None
+			return self.transitions.setdefault(key, (shape, span))
+		
+		def describe(self) -> tuple:
+			if self.signature is None:
+				self.signature = tuple(
+					(attribute.name, attribute.access_mode, attribute.final, attribute.base_class)
+					for attribute in sorted(self.attributes.values(), key=lambda attribute: attribute.slot)
+				)
+			return self.signature
+		
+		def restore(self, signature: tuple) -> 'Shape':
+			if not signature:
+				return self
+			try:
+				return self.transitions[signature]
+			except KeyError:
+				pass
+			shape = self
+			for name, access_mode, final, base_class in signature:
+				shape = shape.declare(name, access_mode, final, base_class)
+			return self.transitions.setdefault(signature, shape)
+
+	class State:
+		__slots__ = ('shape', 'values', 'dict')
+
+		def __init__(self, shape: Shape, values: list = None, dict: dict = None) -> None:
+			self.shape = shape
+			self.values = values
+			self.dict = dict
+
+	class FrozenState(State):
+		__slots__ = ('public', 'plain', 'hash')
+
+		def __init__(self, shape: Shape, values: tuple, dict: MappingProxyType, public: dict[str, Any], plain: dict[str, Any]) -> None:
+			self.shape = shape
+			self.values = values
+			self.dict = dict
+			self.public = public
+			self.plain = plain
+			self.hash = None
+
+	def frozen_error(instance: _Object) -> AccessError:
+		return AccessError(f"'{type(instance).__name__}' object is frozen", type=AccessErrors.FINAL)
+
+	def access_error(attribute: Attribute) -> AccessError:
+		if attribute.access_mode == 'protected':
+			return AccessError(f"'{attribute.name}' is protected", type=AccessErrors.PROTECTED)
+		return AccessError(f"'{attribute.name}' is private", type=AccessErrors.PRIVATE)
+
+	class Field:
+		__slots__ = ('name', 'access_mode', 'final', 'base_class', 'slot', 'default')
+
+		def __init__(self, name: str, declaration: Declaration, base_class: type[_Object], slot: int) -> None:
+			self.name = name
+			self.access_mode = declaration.access_mode
+			self.final = declaration.final
+			self.base_class = base_class
+			self.slot = slot
+			self.default = declaration.value
+		
+		def __get__(self, instance, owner=None):
+			if instance is None:
+				return self
+			return self.read(instance)
+		
+		def __set__(self, instance, value):
+			self.write(instance, value)
+		
+		def __delete__(self, instance):
+			self.write(instance, _MISSING)
+		
+		def read(self, instance: _Object, code: CodeType = None) -> Any:
+			if self.access_mode != 'public':
+				if access_controller.instrumenting:
+					access_controller.observe(instance, self, 'get', code)
+				elif not access_controller.permitted(caller_code(3) if code is None else code, instance, self):
+					access_controller.violation(access_error(self))
+			values = object_getattribute(instance, STATE).values
+			value = self.default if values is None else values[self.slot]
+			if value is _MISSING:
+				raise AttributeError(f"'{type(instance).__name__}' object has no attribute '{self.name}'")
+			return value
+		
+		def write(self, instance: _Object, value: Any, code: CodeType = None):
+			if self.access_mode != 'public':
+				if access_controller.instrumenting:
+					access_controller.observe(instance, self, 'set' if value is not _MISSING else 'delete', code)
+				elif not access_controller.permitted(caller_code(3) if code is None else code, instance, self):
+					access_controller.violation(access_error(self))
+			values = access_controller.state(instance).values
+			if self.final and values[self.slot] is not _MISSING:
+				raise AccessError(f"'{self.name}' is final", type=AccessErrors.FINAL)
+			values[self.slot] = value
+
+	def compile_fields(cls: type[_Object]):
+		layout = ()
+		for base in cls.__bases__:
+			base_layout = getattr(base, '__layout__', ())
+			if base_layout[:len(layout)] == layout:
+				layout = base_layout
+			elif layout[:len(base_layout)] != base_layout:
+				raise TypeError("multiple bases have instance attribute layout conflict")
+		layout = list(layout)
+		for name, value in tuple(vars(cls).items()):
+			if isinstance(value, Declaration):
+				field = Field(name, value, cls, len(layout))
+				layout.append(field)
+				type.__setattr__(cls, name, field)
+		fields = {field.name: field for field in layout}
+		for name, value in vars(cls).items():
+			if name in fields and not isinstance(value, Field):
+				del fields[name]
+		type.__setattr__(cls, '__layout__', tuple(layout))
+		type.__setattr__(cls, '__fields__', fields)
+		shape = Shape({}, len(layout), tuple(field.default for field in layout))
+		type.__setattr__(cls, '__shape__', shape)
+		type.__setattr__(cls, '__prototype__', shape)
+		type.__setattr__(cls, STATE, State(shape))
+
+	def shape_tree(*roots: Shape):
+		shapes = {}
+		pending = list(roots)
+		while pending:
+			shape = pending.pop()
+			if id(shape) in shapes:
+				continue
+			shapes[id(shape)] = shape
+			for transition in shape.transitions.values():
+				pending.append(transition if transition.__class__ is Shape else transition[0])
+		return shapes.values()
+
+	def sizeof(objects) -> int:
+		return sum(getsizeof(value) for value in {id(value): value for value in objects}.values())
+
+	def functions(members):
+		for value in members:
+			if isinstance(value, property):
+				candidates = (value.fget, value.fset, value.fdel)
+			else:
+				candidates = (getattr(value, '__func__', value),)
+			for function in candidates:
+				while hasattr(function, '__wrapped__'):
+					function = function.__wrapped__
+				if hasattr(function, '__code__'):
+					yield function
+
+	class Trust:
+		__slots__ = ('controller', 'target', 'owner', 'token')
+
+		def __init__(self, controller: 'AccesController', target: Any, owner: type[_Object]) -> None:
+			self.controller = controller
+			self.target = target
+			self.owner = owner
+		
+		def __enter__(self) -> Any:
+			controller = self.controller
+			self.token = controller.grants.set(controller.grants.get() + ((self.target, self.owner),))
+			with controller.lock:
+				controller.trusting += 1
+			return self.target
+		
+		def __exit__(self, *exc_info) -> None:
+			controller = self.controller
+			controller.grants.reset(self.token)
+			with controller.lock:
+				controller.trusting -= 1
+
+	class Metric:
+		__slots__ = ('allowed', 'denied', 'fast', 'slow', 'resolve_ns', 'decide_ns')
+
+		def __init__(self) -> None:
+			self.allowed = 0
+			self.denied = 0
+			self.fast = 0
+			self.slow = 0
+			self.resolve_ns = 0
+			self.decide_ns = 0
+
+		def merge(self, other: 'Metric'):
+			for name in Metric.__slots__:
+				setattr(self, name, getattr(self, name) + getattr(other, name))
+
+		def as_dict(self) -> dict[str, int]:
+			return {'checks': self.allowed + self.denied, **{name: getattr(self, name) for name in Metric.__slots__}}
+
+	class Site:
+		__slots__ = ('reads', 'writes', 'denied', 'check_ns')
+
+		def __init__(self) -> None:
+			self.reads = 0
+			self.writes = 0
+			self.denied = 0
+			self.check_ns = 0
+
+		def merge(self, other: 'Site'):
+			for name in Site.__slots__:
+				setattr(self, name, getattr(self, name) + getattr(other, name))
+
+	class Counters:
+		__slots__ = ('hits', 'misses', 'sites', 'metrics', 'profile')
+
+		def __init__(self) -> None:
+			self.hits = 0
+			self.misses = 0
+			self.sites = {}
+			self.metrics = {}
+			self.profile = {}
+
+	class ThreadCounters(local):
+		def __init__(self, controller: 'AccesController') -> None:
+			self.counters = controller.new_counters()
+
 	class AccesController(dict):
-		__slots__ = ('objects')
+		__slots__ = (
+			'objects', 'decisions', 'maxsize', 'generation', 'lock', 'local', 'counters', 'retired', 
+			'sampling', 'rate', 'interval', 'report', 'grants', 'trusting', 'proven', 
+			'instrumenting', 'metering', 'profiling', 'hooks'
+		)
 
-		def __init__(self):
-			self.objects = {}
+		def __init__(self, maxsize: int = 4096):
+			self.objects = WeakValueDictionary()
+			self.decisions = {}
+			self.maxsize = maxsize
+			self.generation = 0
+			self.lock = RLock()
+			self.counters = []
+			self.retired = Counters()
+			self.local = ThreadCounters(self)
+			self.grants = ContextVar('grants', default=())
+			self.trusting = 0
+			self.proven = {}
+			self.instrumenting = False
+			self.metering = False
+			self.profiling = False
+			self.hooks = frozenset()
+			self.sample()
 		
 		def __set__(self, instance, value):
 			if not isinstance(value, dict):
 				raise TypeError(
 					f"__dict__ must be set to a dictionary, not a '{value.__class__.__name__}'"
 				)
-			self.objects[id(instance)]['dict'] = value
+			self.state(instance).dict = value
 		
 		def __get__(self, instance, owner=None):
-			o = self.objects.get(id(instance), None)
-			if o:
-				return (o['dict'], self)
-			elif instance is not None:
-				o = {
-					'attributes': {
-						'public': {}, 
-						'protected': {}, 
-						'private': {}
-					},
-					'dict': {}
-				}
-				self.objects[id(instance)] = o
-				return (o['dict'], self)
-			else:
+			if instance is None:
 				return owner.__dict__
+			return (self.get_dict(instance), self)
 		
-		def new_object(self, object):
-			self.objects[id(object)] = {
-				'attributes': {
-					'public': {}, 
-					'protected': {}, 
-					'private': {}
-				},
-				'dict': {}
-			}
+		def new_object(self, object) -> State:
+			cls = type(object)
+			shape = cls.__prototype__
+			if shape is not object_getattribute(object, STATE).shape:
+				shape.defaults += (_MISSING,) * (shape.size - len(shape.defaults))
+				type.__setattr__(cls, STATE, State(shape))
+			o = State(shape, list(shape.defaults))
+			object_setattr(object, STATE, o)
+			self.objects[id(object)] = object
+			return o
 		
-		def delete_object(self, object):
-			self.objects.pop(id(object))
-			# print("Object '%s' deleted" % object)
+		def state(self, instance: _Object) -> State:
+			o = object_getattribute(instance, STATE)
+			if o.values is None:
+				return self.new_object(instance)
+			if o.__class__ is FrozenState:
+				raise frozen_error(instance)
+			return o
 		
-		def update_object_id(self, old: int, new: int):
-			self.objects[new] = self.objects.pop(old)
+		def get_dict(self, instance: _Object) -> dict:
+			o = object_getattribute(instance, STATE)
+			if o.dict is None:
+				o = self.state(instance)
+				o.dict = {}
+			return o.dict
 		
 		def new_attribute(
 				self, 
@@ -116,190 +469,1054 @@ def _object() -> type[_Object]:
 				final: bool = False,
 				base_class: type[_Object] = None
 			):
-			o = self.objects[id(instance)]
-			d = o['dict']				
-			code = stack(4)[-1].frame.f_code
-			class_name = code.co_qualname.removesuffix(f".{code.co_name}").split('.')[-1]
-			if class_name != instance.__class__.__name__:
-				base_class = getBaseByName(instance, class_name, Object)
-			if d.__contains__(name):
-				o['attributes'][access_mode][name] = Attribute(name, d.pop(name), access_mode, final, base_class)
+			o = self.state(instance)
+			d = o.dict
+			base_class = self.caller_class(instance)
+			if d is not None and d.__contains__(name):
+				value = d.pop(name)
+			previous = o.shape
+			o.shape = shape = previous.declare(name, access_mode, final, base_class)
+			if shape is not previous:
+				self.advance_prototype(instance, previous, shape)
+			slot = shape.attributes[name].slot
+			values = o.values
+			if slot < len(values):
+				values[slot] = value
 			else:
-				o['attributes'][access_mode][name] = Attribute(name, value, access_mode, final, base_class)
+				values.append(value)
+		
+		def declare_attributes(self, instance: _Object, declarations: tuple, final: Iterable[str]):
+			final = frozenset(final)
+			if final:
+				missing = final.difference(*(members for _, members in declarations if members))
+				if missing:
+					raise ValueError(f"final attributes are not declared: {', '.join(sorted(missing))}")
+			o = self.state(instance)
+			d = o.dict
+			base_class = self.caller_class(instance)
+			shape = previous = o.shape
+			values = o.values
+			for access_mode, members in declarations:
+				if not members:
+					continue
+				extended, span = shape.extend(tuple(members), access_mode, final, base_class)
+				if d is None and span is not None:
+					values[span] = members.values()
+				else:
+					values.extend(None for _ in range(extended.size - len(values)))
+					attributes = extended.attributes
+					for name, value in members.items():
+						if d is not None and d.__contains__(name):
+							value = d.pop(name)
+						values[attributes[name].slot] = value
+				shape = extended
+			o.shape = shape
+			if shape is not previous:
+				self.advance_prototype(instance, previous, shape)
 		
-		def get(self, name: str, instance: _Object, frame_info: FrameInfo = None):
+		def advance_prototype(self, instance: _Object, previous: Shape, shape: Shape):
+			cls = type(instance)
+			if cls.__prototype__ is previous:
+				type.__setattr__(cls, '__prototype__', shape)
+		
+		def caller_class(self, instance: _Object) -> type:
+			frame = caller(4)
+			while frame is not None and id(frame.f_code) in _PrivateObject.__own_codes__:
+				frame = frame.f_back
+			return None if frame is None else self.declaring_class(frame.f_code, instance)
+		
+		def get(self, name: str, instance: _Object, frame: FrameType = None):
 			# print("Get attribute '%s' from class '%s'" % (name, instance))
-			o = self.objects[id(instance)]
-			d = o['dict']
-			a = o['attributes']
-			error = None
-			try:
+			o = object_getattribute(instance, STATE)
+			d = o.dict
+			if d is not None and d.__contains__(name):
 				return (d[name],)
-			except KeyError:
-				try:
-					return (a['public'][name].value,)
-				except KeyError:
-					protected = a['protected'].__contains__(name)
-					private = protected or a['private'].__contains__(name)
-					if protected or private:
-						if frame_info is None:
-							frame_info = stack(3)[-1]
-						fname = frame_info.function
-						owner = type(instance)
-						function = getattr(owner, fname, None)
-						if callable(function):
-							same_code = frame_info.frame.f_code.co_code == function.__code__.co_code
-							if protected:
-								attribute = a['protected'][name]
-								if (same_code or 
-									(not same_code and not attribute.base_class is owner and 
-		  							(attribute.base_class is getBase(instance, Object)))):
-									return (attribute.value,)
-								else:
-									error = AccessError(f"'{name}' is protected", type=AccessErrors.PROTECTED)
-							else:
-								attribute = a['private'][name]
-								same_class = attribute.base_class is owner
-								if ((same_code and same_class) or 
-									(not same_code and not same_class and 
-		  							(attribute.base_class is getBase(instance, Object)))):
-									return (attribute.value,)
-								else:
-									error = AccessError(f"'{name}' is private", type=AccessErrors.PRIVATE)
-						else:
-							if protected:
-								error = AccessError(f"'{name}' is protected", type=AccessErrors.PROTECTED)
-							else:
-								error = AccessError(f"'{name}' is private", type=AccessErrors.PRIVATE)
-			if error:
-				raise error
-			return ()
+			attribute = o.shape.attributes.get(name)
+			if attribute is None or o.values is None:
+				return ()
+			value = o.values[attribute.slot]
+			if value is _MISSING:
+				return ()
+			if attribute.access_mode != 'public':
+				if self.instrumenting:
+					self.observe(instance, attribute, 'get', None if frame is None else frame.f_code)
+				else:
+					if frame is None:
+						frame = caller(3)
+					if not self.permitted(frame.f_code, instance, attribute):
+						self.violation(access_error(attribute))
+			return (value,)
+		
+		def get_many(self, instance: _Object, names: tuple, frame: FrameType) -> tuple:
+			o = object_getattribute(instance, STATE)
+			key = (id(frame.f_code), type(instance), o.shape, names)
+			plan = self.decisions.get(key)
+			if plan is not None and o.values is not None and not o.dict and not self.instrumenting:
+				values = o.values
+				result = tuple([values[slot] for slot in plan[1]])
+				for value in result:
+					if value is _MISSING:
+						break
+				else:
+					self.local.counters.hits += 1
+					return result
+			getattribute = _PrivateObject.__getattribute__
+			result = tuple([getattribute(instance, name, frame) for name in names])
+			if plan is None:
+				self.batch(key, instance, names, frame.f_code, False)
+			return result
+		
+		def set_many(self, instance: _Object, mapping: dict[str, Any], code: CodeType):
+			o = self.state(instance)
+			values = o.values
+			key = (id(code), type(instance), o.shape, tuple(mapping), True)
+			plan = self.decisions.get(key)
+			if plan is not None and not self.instrumenting:
+				slots = plan[1]
+				for slot in slots:
+					if values[slot] is _MISSING:
+						break
+				else:
+					self.local.counters.hits += 1
+					for slot, value in zip(slots, mapping.values()):
+						values[slot] = value
+					return
+			fields = type(instance).__fields__
+			attributes = o.shape.attributes
+			slots = []
+			plain = []
+			for name, value in mapping.items():
+				attribute = fields.get(name)
+				if attribute is not None:
+					final = attribute.final and values[attribute.slot] is not _MISSING
+				else:
+					attribute = attributes.get(name)
+					if attribute is None or values[attribute.slot] is _MISSING:
+						plain.append((name, value))
+						continue
+					final = attribute.final
+				if attribute.access_mode != 'public':
+					if self.instrumenting:
+						self.observe(instance, attribute, 'set', code)
+					elif not self.permitted(code, instance, attribute):
+						self.violation(access_error(attribute))
+				if final:
+					raise AccessError(f"'{name}' is final", type=AccessErrors.FINAL)
+				slots.append((attribute.slot, value))
+			for slot, value in slots:
+				values[slot] = value
+			for name, value in plain:
+				object_setattr(instance, name, value)
+			if plan is None:
+				self.batch(key, instance, key[3], code, True)
+		
+		def batch(self, key: tuple, instance: _Object, names: tuple, code: CodeType, writing: bool):
+			generation = self.generation
+			fields = type(instance).__fields__
+			attributes = object_getattribute(instance, STATE).shape.attributes
+			slots = []
+			for name in names:
+				attribute = fields.get(name) or attributes.get(name)
+				if attribute is None or (writing and attribute.final):
+					return
+				if attribute.access_mode != 'public' and not self.allowed(code, instance, attribute):
+					return
+				slots.append(attribute.slot)
+			with self.lock:
+				if generation == self.generation:
+					while len(self.decisions) >= self.maxsize:
+						self.decisions.pop(next(iter(self.decisions)))
+					self.decisions[key] = (code, tuple(slots))
 		
 		def set(self, name: str, value: Any, instance: _Object):
 			# print("Set attribute '%s' with '%s' from class '%s'" % (name, value, instance))
-			o = self.objects[id(instance)]
-			d = o['dict']
-			a = o['attributes']
-			error = None
-			try:
-				attribute = a['public'][name]
-				if attribute.final:
-					error = AccessError(f"'{name}' is final", type=AccessErrors.FINAL)
+			o = object_getattribute(instance, STATE)
+			attribute = o.shape.attributes.get(name)
+			if attribute is None or o.values is None or o.values[attribute.slot] is _MISSING:
+				return False
+			if attribute.access_mode != 'public':
+				if self.instrumenting:
+					self.observe(instance, attribute, 'set', None)
+				elif not self.permitted(caller_code(3), instance, attribute):
+					self.violation(access_error(attribute))
+			if attribute.final:
+				raise AccessError(f"'{name}' is final", type=AccessErrors.FINAL)
+			o.values[attribute.slot] = value
+			return True
+		
+		def permitted(self, code: CodeType, instance: _Object, attribute: Attribute) -> bool:
+			if self.trusting and self.trusted(instance, attribute):
+				return True
+			if self.sampling and not self.sampled(code, attribute.name):
+				return True
+			return self.allowed(code, instance, attribute)
+		
+		def trusted(self, instance: _Object, attribute: Attribute) -> bool:
+			for target, owner in self.grants.get():
+				if target is instance or (isinstance(target, type) and isinstance(instance, target)):
+					if attribute.access_mode == 'protected' or attribute.base_class is owner:
+						return True
+			return False
+		
+		def trust(self, target: Any, code: CodeType):
+			from contextlib import nullcontext
+			owner = target if isinstance(target, type) else type(target)
+			if not owner.__enforce__:
+				return nullcontext(target)
+			for base in owner.__mro__:
+				if id(code) in own_codes(base):
+					return Trust(self, target, base)
+			self.violation(AccessError(f"'{owner.__name__}' can only be trusted from its own methods"))
+			return nullcontext(target)
+		
+		def sampled(self, code: CodeType, name: str) -> bool:
+			sites = self.local.counters.sites
+			site = (code, name)
+			if self.interval:
+				now = monotonic()
+				if now < sites.get(site, 0.0):
+					return False
+				sites[site] = now + self.interval
+				return True
+			count = sites.get(site, 0)
+			sites[site] = count + 1
+			return count % self.rate == 0
+		
+		def sample(self, rate: int = 1, interval: float = None, report: Callable[[AccessError], Any] = None):
+			if rate < 1:
+				raise ValueError("sampling rate must be at least 1")
+			with self.lock:
+				self.rate = rate
+				self.interval = interval
+				self.report = report
+				self.sampling = rate > 1 or bool(interval)
+				for _, counters in self.counters:
+					counters.sites.clear()
+		
+		def instrument(self, enabled: bool = True):
+			self.metering = enabled
+			self.instrumenting = enabled or self.profiling
+
+		def profile(self, enabled: bool = True):
+			self.profiling = enabled
+			self.instrumenting = enabled or self.metering
+
+		def observe(self, instance: _Object, attribute: Attribute, kind: str, code: CodeType = None):
+			start = perf_counter_ns()
+			if code is None:
+				code = _getframe(3).f_code
+			resolved = perf_counter_ns()
+			counters = self.local.counters
+			misses = counters.misses
+			result = self.permitted(code, instance, attribute)
+			decided = perf_counter_ns()
+			if self.metering:
+				self.record(counters, type(instance), kind, result, counters.misses == misses, resolved - start, decided - resolved)
+			if self.profiling:
+				key = (type(instance), attribute, code)
+				site = counters.profile.get(key)
+				if site is None:
+					site = counters.profile[key] = Site()
+				if kind == 'get':
+					site.reads += 1
 				else:
-					attribute.value = value
-					return True
+					site.writes += 1
+				if not result:
+					site.denied += 1
+				site.check_ns += decided - start
+			if not result:
+				self.violation(access_error(attribute))
+
+		def observe_member(self, kind: str, cls: type, access_mode: str, owner: type, name: str, depth: int, code: CodeType = None):
+			start = perf_counter_ns()
+			if code is None:
+				code = _getframe(depth).f_code
+			resolved = perf_counter_ns()
+			if access_mode == 'protected':
+				fast = id(code) in cls.__codes__
+			else:
+				fast = owner is not None and id(code) in owner.__own_codes__
+			result = fast or (self.sampling and not self.sampled(code, name))
+			if self.metering:
+				self.record(self.local.counters, cls, kind, result, fast, resolved - start, perf_counter_ns() - resolved)
+			if not result:
+				self.violation(AccessError(f"'{name}' is {access_mode}", type=AccessErrors[access_mode.upper()]))
+
+		def record(self, counters: Counters, cls: type, kind: str, result: bool, fast: bool, resolve_ns: int, decide_ns: int):
+			metric = counters.metrics.get((cls, kind))
+			if metric is None:
+				metric = counters.metrics[(cls, kind)] = Metric()
+			if result:
+				metric.allowed += 1
+			else:
+				metric.denied += 1
+			if fast:
+				metric.fast += 1
+			else:
+				metric.slow += 1
+			metric.resolve_ns += resolve_ns
+			metric.decide_ns += decide_ns
+
+		def metrics(self) -> dict:
+			with self.lock:
+				merged = {}
+				for counters in [self.retired] + [counters for _, counters in self.counters]:
+					for key, metric in list(counters.metrics.items()):
+						total = merged.get(key)
+						if total is None:
+							total = merged[key] = Metric()
+						total.merge(metric)
+			total = Metric()
+			classes = {}
+			for (cls, kind), metric in merged.items():
+				total.merge(metric)
+				classes.setdefault(cls, {})[kind] = metric.as_dict()
+			return {**total.as_dict(), 'classes': classes}
+
+		def metrics_clear(self):
+			with self.lock:
+				for counters in [self.retired] + [counters for _, counters in self.counters]:
+					counters.metrics.clear()
+
+		def metrics_text(self) -> str:
+			def label(cls: type) -> str:
+				name = f'{cls.__module__}.{cls.__qualname__}'
+				return name.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+			checks = [
+				'# HELP pyobject_access_checks_total Access checks performed.',
+				'# TYPE pyobject_access_checks_total counter',
+			]
+			paths = [
+				'# HELP pyobject_access_path_total Access checks answered by the fast or the slow path.',
+				'# TYPE pyobject_access_path_total counter',
+			]
+			seconds = [
+				'# HELP pyobject_access_seconds_total Time spent resolving the caller and deciding.',
+				'# TYPE pyobject_access_seconds_total counter',
+			]
+			for cls, kinds in self.metrics()['classes'].items():
+				for kind, metric in kinds.items():
+					labels = f'class="{label(cls)}",kind="{kind}"'
+					checks.append(f'pyobject_access_checks_total{{{labels},result="allowed"}} {metric["allowed"]}')
+					checks.append(f'pyobject_access_checks_total{{{labels},result="denied"}} {metric["denied"]}')
+					paths.append(f'pyobject_access_path_total{{{labels},path="fast"}} {metric["fast"]}')
+					paths.append(f'pyobject_access_path_total{{{labels},path="slow"}} {metric["slow"]}')
+					seconds.append(f'pyobject_access_seconds_total{{{labels},phase="resolve"}} {metric["resolve_ns"] / 1e9:.9f}')
+					seconds.append(f'pyobject_access_seconds_total{{{labels},phase="decide"}} {metric["decide_ns"] / 1e9:.9f}')
+			return '\n'.join(checks + paths + seconds) + '\n'
+
+		def write_metrics(self, path: str):
+			from os import replace
+			temporary = f'{path}.tmp'
+			with open(temporary, 'w') as file:
+				file.write(self.metrics_text())
+			replace(temporary, path)
+
+		def profile_info(self) -> list[dict]:
+			with self.lock:
+				merged = {}
+				for counters in [self.retired] + [counters for _, counters in self.counters]:
+					for key, site in list(counters.profile.items()):
+						merged.setdefault(key, Site()).merge(site)
+			entries = [
+				{
+					'class': f'{cls.__module__}.{cls.__qualname__}',
+					'attribute': attribute.name,
+					'access_mode': attribute.access_mode,
+					'file': code.co_filename,
+					'line': code.co_firstlineno,
+					'function': code.co_qualname,
+					'reads': site.reads,
+					'writes': site.writes,
+					'denied': site.denied,
+					'check_ns': site.check_ns,
+				}
+				for (cls, attribute, code), site in merged.items()
+			]
+			entries.sort(key=lambda entry: entry['check_ns'], reverse=True)
+			return entries
+
+		def profile_clear(self):
+			with self.lock:
+				for counters in [self.retired] + [counters for _, counters in self.counters]:
+					counters.profile.clear()
+
+		def profile_report(self, limit: int = None) -> str:
+			entries = self.profile_info()[:limit]
+			lines = [f"{'check ms':>10}{'reads':>10}{'writes':>10}{'denied':>8}  {'attribute':<40}caller"]
+			for entry in entries:
+				lines.append(
+					f"{entry['check_ns'] / 1e6:>10.3f}{entry['reads']:>10}{entry['writes']:>10}{entry['denied']:>8}  "
+					f"{entry['class'] + '.' + entry['attribute'] + ' (' + entry['access_mode'] + ')':<40}"
+					f"{entry['function']} ({entry['file']}:{entry['line']})"
+				)
+			return '\n'.join(lines) + '\n'
+
+		def write_profile(self, path: str, format: str = 'json'):
+			if format not in ('json', 'text'):
+				raise ValueError(f"unknown profile format '{format}'")
+			with open(path, 'w') as file:
+				if format == 'text':
+					file.write(self.profile_report())
+				else:
+					from json import dump
+					dump(self.profile_info(), file, indent=2)
+
+		def violation(self, error: AccessError):
+			if self.report is None:
+				raise error
+			self.report(error)
+		
+		def allowed(self, code: CodeType, instance: _Object, attribute: Attribute) -> bool:
+			owner = type(instance)
+			key = (id(code), owner, attribute)
+			counters = self.local.counters
+			try:
+				result = self.decisions[key][1]
+				counters.hits += 1
+				return result
 			except KeyError:
-				protected = a['protected'].__contains__(name)
-				private = protected or a['private'].__contains__(name)
-				if protected or private:
-					frame_info = stack(3)[-1]
-					fname = frame_info.function
-					owner = type(instance)
-					function = getattr(owner, fname, None)
-					if callable(function):
-						same_code = frame_info.frame.f_code.co_code == function.__code__.co_code
-						if protected:
-							attribute = a['protected'][name]
-							if (same_code or 
-								(not same_code and not attribute.base_class is owner and 
-								(attribute.base_class is getBase(instance, Object)))):
-								if attribute.final:
-									error = AccessError(f"'{name}' is final", type=AccessErrors.FINAL)
-								else:
-									attribute.value = value
-									return True
-							else:
-								error = AccessError(f"'{name}' is protected", type=AccessErrors.PROTECTED)
-						else:
-							attribute = a['private'][name]
-							same_class = attribute.base_class is owner
-							if (same_code and same_class) or \
-								(not same_code and not same_class and (attribute.base_class is getBase(instance, Object))):
-								if attribute.final:
-									error = AccessError(f"'{name}' is final", type=AccessErrors.FINAL)
-								else:
-									attribute.value = value
-									return True
-							else:
-								error = AccessError(f"'{name}' is private", type=AccessErrors.PRIVATE)
+				counters.misses += 1
+			generation = self.generation
+			base_class = attribute.base_class
+			if base_class is None:
+				result = False
+			elif self.proven and self.proved(code, attribute):
+				result = True
+			elif attribute.access_mode == 'protected':
+				result = id(code) in owner.__codes__
+			else:
+				result = id(code) in base_class.__own_codes__
+			with self.lock:
+				if generation == self.generation:
+					while len(self.decisions) >= self.maxsize:
+						self.decisions.pop(next(iter(self.decisions)))
+					self.decisions[key] = (code, result)
+			return result
+		
+		def member_code(self, depth: int) -> CodeType:
+			frame = _getframe(depth + 1)
+			while frame.f_back is not None and id(frame.f_code) in self.hooks:
+				frame = frame.f_back
+			return frame.f_code
+		
+		def declaring_class(self, code: CodeType, instance: _Object) -> type:
+			return type(instance).__codes__.get(id(code))
+		
+		def proved(self, code: CodeType, attribute: Attribute) -> bool:
+			files = self.proven.get((code.co_firstlineno, code.co_name, attribute.name, attribute.base_class.__qualname__))
+			if not files:
+				return False
+			filename = code.co_filename.replace(sep, '/')
+			return any(filename == file or filename.endswith('/' + file) for file in files)
+		
+		def load_manifest(self, path: str = None):
+			sites = {}
+			if path is not None:
+				from json import load
+				with open(path) as file:
+					manifest = load(file)
+				if manifest.get('version') != 2:
+					raise ValueError(f"unsupported manifest version {manifest.get('version')!r}")
+				for site in manifest['sites']:
+					key = (site['line'], site['function'], site['attribute'], site['class'])
+					sites.setdefault(key, set()).add(site['file'])
+			with self.lock:
+				self.proven = sites
+				self.generation += 1
+				self.decisions.clear()
+		
+		def invalidate(self):
+			with self.lock:
+				self.generation += 1
+				self.decisions.clear()
+		
+		def new_counters(self) -> Counters:
+			counters = Counters()
+			with self.lock:
+				alive = []
+				for thread, other in self.counters:
+					if thread.is_alive():
+						alive.append((thread, other))
 					else:
-						if protected:
-							error = AccessError(f"'{name}' is protected", type=AccessErrors.PROTECTED)
-						else:
-							error = AccessError(f"'{name}' is private", type=AccessErrors.PRIVATE)
-			if error:
-				raise error
-			return False
+						self.retired.hits += other.hits
+						self.retired.misses += other.misses
+						for key, metric in other.metrics.items():
+							self.retired.metrics.setdefault(key, Metric()).merge(metric)
+						for key, site in other.profile.items():
+							self.retired.profile.setdefault(key, Site()).merge(site)
+				alive.append((current_thread(), counters))
+				self.counters = alive
+			return counters
+		
+		def cache_info(self) -> dict[str, int]:
+			with self.lock:
+				counters = [self.retired] + [counters for _, counters in self.counters]
+				return {
+					'hits': sum(c.hits for c in counters),
+					'misses': sum(c.misses for c in counters),
+					'maxsize': self.maxsize,
+					'currsize': len(self.decisions)
+				}
+		
+		def cache_clear(self):
+			with self.lock:
+				self.generation += 1
+				self.decisions.clear()
+				for counters in [self.retired] + [counters for _, counters in self.counters]:
+					counters.hits = 0
+					counters.misses = 0
+		
+		def reduce(self, instance: _Object, protocol: int) -> tuple:
+			o = object_getattribute(instance, STATE)
+			attributes = dict(object_dict(instance))
+			attributes.pop(STATE, None)
+			if o.values is None:
+				return (__newobj__, (type(instance),), (None, None, None, attributes or None))
+			values = tuple(o.values)
+			if protocol >= 5:
+				for value in values:
+					if value.__class__ in (bytes, bytearray) and len(value) >= OUT_OF_BAND_SIZE:
+						values = tuple(
+							_PickleBuffer(value) if value.__class__ in (bytes, bytearray) and len(value) >= OUT_OF_BAND_SIZE else value
+							for value in values
+						)
+						break
+			return (__newobj__, (type(instance),), (o.shape.describe(), values, dict(o.dict) if o.dict else None, attributes or None))
+		
+		def restore(self, instance: _Object, state: tuple):
+			signature, values, d, attributes = state
+			if attributes:
+				object_dict(instance).update(attributes)
+			if values is not None:
+				shape = type(instance).__shape__.restore(signature)
+				object_setattr(instance, STATE, State(shape, list(values), d))
+				self.objects[id(instance)] = instance
+				if type(instance).__frozen__:
+					self.seal(instance)
+		
+		def copy(self, instance: _Object, memo: dict = None) -> _Object:
+			cls = type(instance)
+			o = object_getattribute(instance, STATE)
+			if memo is None and o.__class__ is FrozenState:
+				return instance
+			new = cls.__new__(cls)
+			if memo is not None:
+				from copy import deepcopy
+				memo[id(instance)] = new
+			attributes = dict(object_dict(instance))
+			attributes.pop(STATE, None)
+			if attributes:
+				object_dict(new).update(attributes if memo is None else deepcopy(attributes, memo))
+			if o.values is not None:
+				if memo is None:
+					state = State(o.shape, list(o.values), None if o.dict is None else dict(o.dict))
+				else:
+					state = State(o.shape, list(deepcopy(o.values, memo)), deepcopy(dict(o.dict) if o.dict else None, memo))
+				object_setattr(new, STATE, state)
+				self.objects[id(new)] = new
+				if o.__class__ is FrozenState:
+					self.seal(new)
+			return new
+		
+		def seal(self, instance: _Object):
+			if not type(instance).__enforce__:
+				attributes = object_dict(instance)
+				attributes[STATE] = {
+					name: value for name, value in attributes.items() if not name.startswith('_accessproperty__')
+				}
+				return
+			o = object_getattribute(instance, STATE)
+			if o.values is None:
+				o = self.new_object(instance)
+			shape = o.shape
+			if shape.public is None:
+				fields = type(instance).__fields__
+				shape.public = (
+					tuple(
+						(attribute.name, attribute.slot) for attribute in shape.attributes.values()
+						if attribute.access_mode == 'public' and attribute.name not in fields
+					),
+					tuple((field.name, field.slot) for field in fields.values() if field.access_mode == 'public'),
+				)
+			attributes, fields = shape.public
+			values = tuple(o.values)
+			public = {name: values[slot] for name, slot in attributes if values[slot] is not _MISSING}
+			if o.dict:
+				public.update(o.dict)
+			for name, slot in fields:
+				if values[slot] is not _MISSING:
+					public[name] = values[slot]
+			plain = {
+				name: value for name, value in object_dict(instance).items()
+				if name != STATE and not name.startswith('_accessproperty__')
+			}
+			object_setattr(instance, STATE, FrozenState(shape, values, MappingProxyType(o.dict) if o.dict else SEALED, public, plain))
 		
 		def delete(self, name: str, instance: _Object):
-			o = self.objects[id(instance)]
-			d = o['dict']
-			if name in d:
+			d = object_getattribute(instance, STATE).dict
+			if d is not None and name in d:
 				del d[name]
 				return True
 			return False
 		
 		def reset(self, instance: _Object):
-			o = self.objects[id(instance)]
-			a = o['attributes']
-			o['dict'] = {}
+			o = object_getattribute(instance, STATE)
+			if o.dict is not None:
+				o.dict = None
+		
+		def memory_usage(self, target: Any) -> int:
+			if isinstance(target, type):
+				return self.class_memory(target)
+			o = object_getattribute(target, STATE)
+			if o is getattr(type(target), STATE):
+				return 0
+			size = sizeof((o, o.values) if o.dict is None else (o, o.values, o.dict))
+			reference = self.objects.data.get(id(target))
+			if reference is not None:
+				size += getsizeof(reference) + getsizeof(id(target)) + getsizeof(self.objects.data) // len(self.objects.data)
+			return size
+		
+		def class_memory(self, cls: type[_Object]) -> int:
+			members = vars(cls)
+			if '__shape__' not in members:
+				return 0
+			objects = [
+				members.get(name) for name in (STATE, '__layout__', '__fields__', '__own_codes__', '__codes__')
+			]
+			objects += members['__layout__']
+			for shape in shape_tree(members['__shape__'], members['__prototype__']):
+				objects += (shape, shape.attributes, shape.transitions, shape.defaults, *shape.attributes.values())
+				for key, transition in shape.transitions.items():
+					objects += (key,) if transition.__class__ is Shape else (key, transition, transition[1])
+			return sizeof(object for object in objects if object is not None)
+		
+		def memory_info(self) -> dict:
+			with self.lock:
+				references = list(self.objects.data.items())
+			classes = {}
+			for key, reference in references:
+				instance = reference()
+				if instance is None or id(instance) != key:
+					continue
+				info = classes.get(type(instance))
+				if info is None:
+					info = classes[type(instance)] = {'instances': 0, 'instance_bytes': 0, 'class_bytes': self.memory_usage(type(instance))}
+				info['instances'] += 1
+				info['instance_bytes'] += self.memory_usage(instance)
+			return {
+				'instances': sum(info['instances'] for info in classes.values()),
+				'instance_bytes': sum(info['instance_bytes'] for info in classes.values()),
+				'class_bytes': sum(info['class_bytes'] for info in classes.values()),
+				'registry_bytes': getsizeof(self.objects.data) + sum(getsizeof(key) + getsizeof(reference) for key, reference in references),
+				'decision_bytes': getsizeof(self.decisions) + sizeof(key for key in self.decisions) + sizeof(self.decisions.values()),
+				'leaked': len(self.leaks()),
+				'classes': classes,
+			}
+		
+		def leaks(self) -> list[int]:
+			with self.lock:
+				references = list(self.objects.data.items())
+			leaked = []
+			for key, reference in references:
+				instance = reference()
+				if instance is None or id(instance) != key:
+					leaked.append(key)
+			return leaked
+
+
+	STATE = '_PrivateObject__state'
+	object_getattribute = object.__getattribute__
+	object_setattr = object.__setattr__
+	object_delattr = object.__delattr__
+	access_controller = AccesController()
+
+	class DictObject(_Object):
+		pass
+
+	object_dict = vars(DictObject)['__dict__'].__get__
+	SEALED = MappingProxyType({})
+
+	class ObjectType(ABCMeta):
+		def __new__(mcls, name: str, bases: tuple, namespace: dict, enforce: bool = None, frozen: bool = None, **kwargs):
+			inherited = [base.__enforce__ for base in bases if isinstance(base, ObjectType)]
+			if enforce is None:
+				enforce = inherited[0] if inherited else ENFORCE
+			elif enforce and not all(inherited or (ENFORCE,)):
+				raise TypeError(f"cannot enforce access control on '{name}', a base class is not enforced")
+			if not enforce:
+				namespace['__dict__'] = vars(DictObject)['__dict__']
+			inherited_frozen = any(base.__frozen__ for base in bases if isinstance(base, ObjectType))
+			if frozen is None:
+				frozen = inherited_frozen
+			elif not frozen and inherited_frozen:
+				raise TypeError(f"cannot unfreeze '{name}', a base class is frozen")
+			namespace['__frozen__'] = frozen
+			if frozen and not issubclass(mcls, FrozenType):
+				mcls = FrozenType
+			if inherited:
+				kwargs['enforce'] = enforce
+			return super().__new__(mcls, name, bases, namespace, **kwargs)
+		
+		def __setattr__(cls, name: str, value: Any) -> None:
+			previous = vars(cls).get(name)
+			super().__setattr__(name, value)
+			if any(functions((previous, value))):
+				recompile_codes(cls)
+			access_controller.invalidate()
+		
+		def __delattr__(cls, name: str) -> None:
+			previous = vars(cls).get(name)
+			super().__delattr__(name)
+			if any(functions((previous,))):
+				recompile_codes(cls)
+			access_controller.invalidate()
+
+	class FrozenType(ObjectType):
+		def __call__(cls, *args, **kwargs) -> _Object:
+			instance = super().__call__(*args, **kwargs)
+			access_controller.seal(instance)
+			return instance
+
+	class Blank:
+		__slots__ = ('name')
+
+		def __init__(self, name: str) -> None:
+			self.name = name
+		
+		def __get__(self, instance, owner=None):
+			if instance is None:
+				return self
+			raise AttributeError(f"'{type(instance).__name__}' object has no attribute '{self.name}'")
+
+	def unguarded(name: str, value: Any) -> Any:
+		if isinstance(value, (Declaration, Field)):
+			default = value.value if isinstance(value, Declaration) else value.default
+			return Blank(name) if default is _MISSING else default
+		if not ENFORCE:
+			return value
+		if isinstance(value, (protectedstaticmethod, privatestaticmethod)):
+			return staticmethod(value.__func__)
+		if isinstance(value, (protectedclassmethod, privateclassmethod)):
+			return classmethod(value.__func__)
+		if isinstance(value, accessproperty) and value.cached:
+			return value.copy(access_mode='public')
+		if isinstance(value, accessproperty):
+			return property(value.fget, value.fset, value.fdel, value.__doc__)
+		if callable(value) and getattr(value, '__access__', 'public') != 'public':
+			return value.__wrapped__
+		return value
+
+	def new_plain_attribute(self, name: str, access_mode: str = 'public', value: Any = None, final: bool = False):
+		object_setattr(self, name, value)
+
+	def plain_attribute(self, name: str, value: Any = None, final: bool = False):
+		object_setattr(self, name, value)
+
+	def declare_plain_attributes(
+			self,
+			public: dict[str, Any] = None,
+			protected: dict[str, Any] = None,
+			private: dict[str, Any] = None,
+			final: Iterable[str] = ()
+		):
+		attributes = object_getattribute(self, '__dict__')
+		for members in (public, protected, private):
+			if members:
+				attributes.update(members)
+
+	def get_plain_many(self, names: Iterable[str]) -> tuple:
+		return tuple([object_getattribute(self, name) for name in names])
+
+	def set_plain_many(self, mapping: dict[str, Any]):
+		for name, value in mapping.items():
+			object_setattr(self, name, value)
+
+	def frozen_getattribute(self, name: str, frame=None) -> Any:
+		o = object_getattribute(self, STATE)
+		if o.__class__ is FrozenState:
+			public = o.public
+			if name in public:
+				return public[name]
+		return _PrivateObject.__getattribute__(self, name, caller(2) if frame is None else frame)
+
+	def frozen_setattr(self, name: str, value: Any) -> None:
+		if object_getattribute(self, STATE).__class__ is FrozenState:
+			raise frozen_error(self)
+		field = type(self).__fields__.get(name)
+		if field is not None:
+			field.write(self, value)
+		elif name == '__dict__' or not access_controller.set(name, value, self):
+			object_setattr(self, name, value)
+
+	def frozen_delattr(self, name: str) -> None:
+		if object_getattribute(self, STATE).__class__ is FrozenState:
+			raise frozen_error(self)
+		field = type(self).__fields__.get(name)
+		if field is not None:
+			field.write(self, _MISSING)
+		elif name == '__dict__':
+			access_controller.reset(self)
+		elif not access_controller.delete(name, self):
+			object_delattr(self, name)
+
+	def frozen_eq(self, other: Any) -> bool:
+		if type(other) is not type(self):
+			return NotImplemented
+		o = object_getattribute(self, STATE)
+		p = object_getattribute(other, STATE)
+		if o.__class__ is not FrozenState or p.__class__ is not FrozenState:
+			return self is other
+		return (
+			o.values == p.values and o.dict == p.dict and o.plain == p.plain and 
+			(o.shape is p.shape or o.shape.describe() == p.shape.describe())
+		)
+
+	def frozen_hash(self) -> int:
+		o = object_getattribute(self, STATE)
+		if o.__class__ is not FrozenState:
+			raise TypeError(f"unhashable type: '{type(self).__name__}' is not frozen yet")
+		if o.hash is None:
+			o.hash = hash((type(self), o.values, frozenset(o.plain.items())))
+		return o.hash
+
+	def sealed(function: Callable) -> Callable:
+		@wraps(function)
+		def wrapper(self, *args, **kwargs):
+			if STATE in object_dict(self):
+				raise frozen_error(self)
+			return function(self, *args, **kwargs)
+		return wrapper
+
+	def plain_eq(self, other: Any) -> bool:
+		if type(other) is not type(self):
+			return NotImplemented
+		o = object_dict(self).get(STATE)
+		p = object_dict(other).get(STATE)
+		if o is None or p is None:
+			return self is other
+		return o == p
+
+	def plain_hash(self) -> int:
+		o = object_dict(self).get(STATE)
+		if o is None:
+			raise TypeError(f"unhashable type: '{type(self).__name__}' is not frozen yet")
+		return hash((type(self), frozenset(o.items())))
+
+	def freeze(cls: type[_Object]):
+		members = vars(cls)
+		if cls.__enforce__:
+			for name, value in (
+					('__getattribute__', frozen_getattribute),
+					('__setattr__', frozen_setattr),
+					('__delattr__', frozen_delattr)
+				):
+				type.__setattr__(cls, name, value)
+			equality = (('__eq__', frozen_eq), ('__hash__', frozen_hash))
+		else:
+			for name in (
+					'__setattr__', '__delattr__', 'new_attribute', 'public_attribute', 'protected_attribute',
+					'private_attribute', 'declare_attributes', 'set_many'
+				):
+				type.__setattr__(cls, name, sealed(getattr(cls, name)))
+			equality = (('__eq__', plain_eq), ('__hash__', plain_hash))
+		if '__eq__' not in members:
+			for name, value in equality:
+				type.__setattr__(cls, name, value)
+
+	def release(cls: type[_Object]):
+		members = {}
+		for base in reversed(cls.__mro__):
+			members.update(vars(base))
+		defaults = dict(cls.__defaults__)
+		for name, value in members.items():
+			plain = unguarded(name, value)
+			if plain is not value:
+				type.__setattr__(cls, name, plain)
+				if isinstance(plain, Blank):
+					defaults.pop(name, None)
+				elif isinstance(value, (Declaration, Field)):
+					defaults[name] = plain
+		type.__setattr__(cls, '__defaults__', tuple(defaults.items()))
+		init = vars(_PrivateObject)['__init__']
+		if not defaults:
+			if cls is not _PrivateObject and cls.__init__ is init:
+				type.__setattr__(cls, '__init__', object.__init__)
+		else:
+			mro = cls.__mro__
+			for base in mro[:mro.index(_PrivateObject)]:
+				if vars(base).get('__init__') is object.__init__:
+					type.__setattr__(base, '__init__', init)
+		for name, value in (
+				('__getattribute__', object.__getattribute__),
+				('__setattr__', object.__setattr__),
+				('__delattr__', object.__delattr__),
+				('new_attribute', new_plain_attribute),
+				('public_attribute', plain_attribute),
+				('protected_attribute', plain_attribute),
+				('private_attribute', plain_attribute),
+				('declare_attributes', declare_plain_attributes),
+				('get_many', get_plain_many),
+				('set_many', set_plain_many),
+				('__reduce_ex__', object.__reduce_ex__),
+				('__setstate__', Blank('__setstate__')),
+				('__copy__', None),
+				('__deepcopy__', None),
+				('__layout__', ()),
+				('__fields__', {}),
+				('__prototype__', False)
+			):
+			type.__setattr__(cls, name, value)
+
+	def code_tree(code: CodeType):
+		yield code
+		for const in code.co_consts:
+			if isinstance(const, CodeType):
+				yield from code_tree(const)
+
+	def own_codes(cls: type) -> frozenset:
+		codes = vars(cls).get('__own_codes__')
+		if codes is None:
+			codes = frozenset(
+				id(code) for function in functions(vars(cls).values()) for code in code_tree(function.__code__)
+			)
+		return codes
 
+	def compile_codes(cls: type[_Object]):
+		for value in vars(cls).values():
+			if getattr(value, '__owner__', False) is None:
+				value.__owner__ = cls
+		if '__own_codes__' in vars(cls):
+			type.__delattr__(cls, '__own_codes__')
+		own = own_codes(cls)
+		type.__setattr__(cls, '__own_codes__', own)
+		codes = {}
+		for base in reversed(cls.__bases__):
+			inherited = vars(base).get('__codes__')
+			if inherited is not None:
+				codes.update(inherited)
+				continue
+			for ancestor in reversed(base.__mro__):
+				codes.update(dict.fromkeys(own_codes(ancestor), ancestor if '__own_codes__' in vars(ancestor) else None))
+		codes.update(dict.fromkeys(own, cls))
+		type.__setattr__(cls, '__codes__', codes)
 
-	class _PrivateObject(_Object):
-		__dict__ = AccesController()
+	def recompile_codes(cls: type[_Object]):
+		if '__own_codes__' in vars(cls):
+			compile_codes(cls)
+			for subclass in cls.__subclasses__():
+				recompile_codes(subclass)
+
+	class _PrivateObject(DictObject, metaclass=ObjectType):
+		__dict__ = access_controller
+		__layout__ = ()
+		__fields__ = {}
+		__enforce__ = ENFORCE
+		__frozen__ = False
+		__defaults__ = ()
 		
 		def __init__(self) -> None:
 			super().__init__()
-			_, access_controller = super().__getattribute__('__dict__')
-			access_controller.new_object(self)
+			for name, value in type(self).__defaults__:
+				object_setattr(self, name, value)
 			
-		def __init_subclass__(cls, **kwargs) -> None:
+		def __init_subclass__(cls, enforce: bool = ENFORCE, **kwargs) -> None:
 			super().__init_subclass__(**kwargs)
-			fi = stack(3)[-1]
-			cls.__place__ = (fi.lineno, fi.filename)
+			type.__setattr__(cls, '__enforce__', enforce)
+			compile_codes(cls)
+			if enforce:
+				compile_fields(cls)
+			else:
+				release(cls)
+			if cls.__frozen__:
+				freeze(cls)
+			access_controller.invalidate()
 		
-		def __del__(self):
-			_, access_controller = super().__getattribute__('__dict__')
-			access_controller.delete_object(self)
-
 		def __getattribute__(self, name: str, frame=None) -> Any:
-			__dict__, access_controller = super().__getattribute__('__dict__')
 			if name == '__dict__':
-				return __dict__
+				return access_controller.get_dict(self)
+			field = type(self).__fields__.get(name)
+			if field is not None:
+				return field.read(self, None if frame is None else frame.f_code)
 			else:
 				result = access_controller.get(name, self, frame)
 				if result:
 					return result[0]
 				else:
-					return super().__getattribute__(name)
+					return object_getattribute(self, name)
 		
 		def __setattr__(self, name: str, value: Any) -> None:
-			__dict__, access_controller = super().__getattribute__('__dict__')
-			if name == '__dict__':
+			field = type(self).__fields__.get(name)
+			if field is not None:
+				field.write(self, value)
+			elif name == '__dict__':
 				super().__setattr__(name, value)
 			elif not access_controller.set(name, value, self):
 				super().__setattr__(name, value)
 		
 		def __delattr__(self, name: str) -> None:
-			__dict__, access_controller = super().__getattribute__('__dict__')
-			if name == '__dict__':
+			field = type(self).__fields__.get(name)
+			if field is not None:
+				field.write(self, _MISSING)
+			elif name == '__dict__':
 				access_controller.reset(self)
 			elif not access_controller.delete(name, self):
 				super().__delattr__(name)
 		
 		def new_attribute(self, name: str, access_mode: str = 'public', value: Any = None, final: bool = False):
-			_, access_controller = super().__getattribute__('__dict__')
 			access_controller.new_attribute(self, name, value, access_mode, final, type(self))
 		
 		def public_attribute(self, name: str, value: Any = None, final: bool = False):
-			self.new_attribute(name=name, access_mode='public', value=value, final=final)
+			access_controller.new_attribute(self, name, value, 'public', final, type(self))
 
 		def protected_attribute(self, name: str, value: Any = None, final: bool = False):
-			self.new_attribute(name=name, access_mode='protected', value=value, final=final)
+			access_controller.new_attribute(self, name, value, 'protected', final, type(self))
 
 		def private_attribute(self, name: str, value: Any = None, final: bool = False):
-			self.new_attribute(name=name, access_mode='private', value=value, final=final)
+			access_controller.new_attribute(self, name, value, 'private', final, type(self))
+
+		def declare_attributes(
+				self,
+				public: dict[str, Any] = None,
+				protected: dict[str, Any] = None,
+				private: dict[str, Any] = None,
+				final: Iterable[str] = ()
+			):
+			access_controller.declare_attributes(
+				self, (('public', public), ('protected', protected), ('private', private)), final
+			)
+
+		def get_many(self, names: Iterable[str]) -> tuple:
+			return access_controller.get_many(self, tuple(names), caller(2))
+
+		def set_many(self, mapping: dict[str, Any]):
+			access_controller.set_many(self, mapping, caller_code(2))
+
+		def __reduce_ex__(self, protocol: int) -> tuple:
+			return access_controller.reduce(self, protocol)
+
+		def __setstate__(self, state: tuple):
+			access_controller.restore(self, state)
+
+		def __copy__(self) -> _Object:
+			return access_controller.copy(self)
+
+		def __deepcopy__(self, memo: dict) -> _Object:
+			return access_controller.copy(self, memo)
 	
+	_PrivateObject.__controller__ = access_controller
+	compile_fields(_PrivateObject)
+	compile_codes(_PrivateObject)
+	access_controller.hooks = _PrivateObject.__own_codes__.union(
+		id(code) for hook in (
+			frozen_getattribute, frozen_setattr, frozen_delattr, AccesController.get_many, AccesController.set_many
+		) for code in code_tree(hook.__code__)
+	)
+	if not ENFORCE:
+		release(_PrivateObject)
+	elif environ.get('PYOBJECT_MANIFEST'):
+		access_controller.load_manifest(environ['PYOBJECT_MANIFEST'])
 	return _PrivateObject
 
 
@@ -307,46 +1524,49 @@ class Object(_object()):
 	pass
 
 
+access_controller = vars(Object.__base__)['__controller__']
+
+
+def trusted(target: Any):
+	return access_controller.trust(target, caller_code(2))
+
+
 def publicmethod(function):
 	return function
 
 
 def protectedmethod(function):
-	code = stack(2)[-1].frame.f_code
-	place = (code.co_firstlineno, code.co_filename)
-	def wrapper(*args, **kwargs):
-		frame_info = stack(2)[-1]
-		instance = args[0]
-		method = frame_info.function
-		owner = type(instance)
-		method = getattr(owner, method, None)
-		if callable(method):
-			same_code = frame_info.frame.f_code.co_code == method.__code__.co_code
-			if (same_code or 
-				(not same_code and not (place == owner.__place__) and 
-				(place == getBase(instance, Object).__place__))):
-				return function(*args, **kwargs)
-		raise AccessError(f"'{function.__name__}' is protected", type=AccessErrors.PROTECTED)
+	@wraps(function)
+	def wrapper(self, *args, **kwargs):
+		if access_controller.instrumenting:
+			access_controller.observe_member('method', type(self), 'protected', None, function.__name__, 2)
+			return function(self, *args, **kwargs)
+		code = _getframe(1).f_code
+		if (id(code) in type(self).__codes__ or 
+			(access_controller.sampling and not access_controller.sampled(code, function.__name__))):
+			return function(self, *args, **kwargs)
+		access_controller.violation(AccessError(f"'{function.__name__}' is protected", type=AccessErrors.PROTECTED))
+		return function(self, *args, **kwargs)
+	wrapper.__access__ = 'protected'
+	wrapper.__owner__ = None
 	return wrapper
 
 
 def privatemethod(function):
-	code = stack(2)[-1].frame.f_code
-	place = (code.co_firstlineno, code.co_filename)
-	def wrapper(*args, **kwargs):
-		frame_info = stack(2)[-1]
-		instance = args[0]
-		method = frame_info.function
-		owner = type(instance)
-		method = getattr(owner, method, None)
-		if callable(method):
-			same_code = frame_info.frame.f_code.co_code == method.__code__.co_code
-			same_class = place == owner.__place__
-			if ((same_code and same_class) or 
-				(not same_code and not same_class and 
-				(place == getBase(instance, Object).__place__))):
-				return function(*args, **kwargs)
-		raise AccessError(f"'{function.__name__}' is private", type=AccessErrors.PRIVATE)
+	@wraps(function)
+	def wrapper(self, *args, **kwargs):
+		owner = wrapper.__owner__
+		if access_controller.instrumenting:
+			access_controller.observe_member('method', type(self), 'private', owner, function.__name__, 2)
+			return function(self, *args, **kwargs)
+		code = _getframe(1).f_code
+		if ((owner is not None and id(code) in owner.__own_codes__) or 
+			(access_controller.sampling and not access_controller.sampled(code, function.__name__))):
+			return function(self, *args, **kwargs)
+		access_controller.violation(AccessError(f"'{function.__name__}' is private", type=AccessErrors.PRIVATE))
+		return function(self, *args, **kwargs)
+	wrapper.__access__ = 'private'
+	wrapper.__owner__ = None
 	return wrapper
 
 
@@ -355,54 +1575,50 @@ class publicstaticmethod(staticmethod):
 
 
 class protectedstaticmethod(staticmethod):
-	def __init__(self, function: Callable) -> None:
-		super().__init__(function)
-		code = stack(2)[-1].frame.f_code
-		self.__place = (code.co_firstlineno, code.co_filename)
-		self.__owner = None
-	
 	def __get__(self, instance, owner: type = None):
-		self.__owner = owner or type(instance)
-		return self
+		return MethodType(self.__call_from, owner or type(instance))
 
 	def __call__(self, *args, **kwargs) -> Any:
-		frame_info = stack(2)[-1]
-		method = frame_info.function
-		owner = self.__owner
-		method = getattr(owner, method, None)
-		if callable(method):
-			same_code = frame_info.frame.f_code.co_code == method.__code__.co_code
-			if (same_code or 
-				(not same_code and not (self.__place == owner.__place__) and 
-				(self.__place == getBase(owner, Object).__place__))):
-				return self.__func__(*args, **kwargs)
-		raise AccessError(f"'{self.__func__.__name__}' is protected", type=AccessErrors.PROTECTED)
+		access_controller.violation(AccessError(f"'{self.__func__.__name__}' is protected", type=AccessErrors.PROTECTED))
+		return self.__func__(*args, **kwargs)
+
+	def __call_from(self, owner: type, *args, **kwargs) -> Any:
+		if access_controller.instrumenting:
+			access_controller.observe_member('method', owner, 'protected', None, self.__func__.__name__, 2)
+			return self.__func__(*args, **kwargs)
+		code = _getframe(1).f_code
+		if (id(code) in owner.__codes__ or 
+			(access_controller.sampling and not access_controller.sampled(code, self.__func__.__name__))):
+			return self.__func__(*args, **kwargs)
+		access_controller.violation(AccessError(f"'{self.__func__.__name__}' is protected", type=AccessErrors.PROTECTED))
+		return self.__func__(*args, **kwargs)
 
 
 class privatestaticmethod(staticmethod):
 	def __init__(self, function: Callable) -> None:
 		super().__init__(function)
-		code = stack(2)[-1].frame.f_code
-		self.__place = (code.co_firstlineno, code.co_filename)
-		self.__owner = None
+		self.__owner__ = None
+
+	def __set_name__(self, owner: type, name: str) -> None:
+		self.__owner__ = owner
 	
 	def __get__(self, instance, owner: type = None):
-		self.__owner = owner or type(instance)
-		return self
+		return MethodType(self.__call_from, owner or type(instance))
 
 	def __call__(self, *args, **kwargs) -> Any:
-		frame_info = stack(2)[-1]
-		method = frame_info.function
-		owner = self.__owner
-		method = getattr(owner, method, None)
-		if callable(method):
-			same_code = frame_info.frame.f_code.co_code == method.__code__.co_code
-			same_class = self.__place == owner.__place__
-			if ((same_code and same_class) or 
-				(not same_code and not same_class and 
-				(self.__place == getBase(owner, Object).__place__))):
-				return self.__func__(*args, **kwargs)
-		raise AccessError(f"'{self.__func__.__name__}' is private", type=AccessErrors.PRIVATE)
+		access_controller.violation(AccessError(f"'{self.__func__.__name__}' is private", type=AccessErrors.PRIVATE))
+		return self.__func__(*args, **kwargs)
+
+	def __call_from(self, owner: type, *args, **kwargs) -> Any:
+		if access_controller.instrumenting:
+			access_controller.observe_member('method', owner, 'private', self.__owner__, self.__func__.__name__, 2)
+			return self.__func__(*args, **kwargs)
+		code = _getframe(1).f_code
+		if ((self.__owner__ is not None and id(code) in self.__owner__.__own_codes__) or 
+			(access_controller.sampling and not access_controller.sampled(code, self.__func__.__name__))):
+			return self.__func__(*args, **kwargs)
+		access_controller.violation(AccessError(f"'{self.__func__.__name__}' is private", type=AccessErrors.PRIVATE))
+		return self.__func__(*args, **kwargs)
 
 
 class publicclassmethod(classmethod):
@@ -410,165 +1626,162 @@ class publicclassmethod(classmethod):
 
 
 class protectedclassmethod(classmethod):
-	def __init__(self, function: Callable) -> None:
-		super().__init__(function)
-		code = stack(2)[-1].frame.f_code
-		self.__place = (code.co_firstlineno, code.co_filename)
-	
 	def __get__(self, instance, owner: type = None):
 		return MethodType(self, owner or type(instance))
 
 	def __call__(self, *args, **kwargs) -> Any:
-		frame_info = stack(2)[-1]
-		owner = args[0]
-		method = frame_info.function
-		method = getattr(owner, method, None)
-		if callable(method):
-			same_code = frame_info.frame.f_code.co_code == method.__code__.co_code
-			if (same_code or 
-				(not same_code and not (self.__place == owner.__place__) and 
-				(self.__place == getBase(owner, Object).__place__))):
-				return self.__func__(*args, **kwargs)
-		raise AccessError(f"'{self.__func__.__name__}' is protected", type=AccessErrors.PROTECTED)
+		if access_controller.instrumenting:
+			access_controller.observe_member('method', args[0], 'protected', None, self.__func__.__name__, 2)
+			return self.__func__(*args, **kwargs)
+		code = _getframe(1).f_code
+		if (id(code) in args[0].__codes__ or 
+			(access_controller.sampling and not access_controller.sampled(code, self.__func__.__name__))):
+			return self.__func__(*args, **kwargs)
+		access_controller.violation(AccessError(f"'{self.__func__.__name__}' is protected", type=AccessErrors.PROTECTED))
+		return self.__func__(*args, **kwargs)
 
 
 class privateclassmethod(classmethod):
 	def __init__(self, function: Callable) -> None:
 		super().__init__(function)
-		code = stack(2)[-1].frame.f_code
-		self.__place = (code.co_firstlineno, code.co_filename)
+		self.__owner__ = None
+
+	def __set_name__(self, owner: type, name: str) -> None:
+		self.__owner__ = owner
 	
 	def __get__(self, instance, owner: type = None) -> Callable:
 		return MethodType(self, owner or type(instance))
 
 	def __call__(self, *args, **kwargs) -> Any:
-		frame_info = stack(2)[-1]
-		owner = args[0]
-		method = frame_info.function
-		method = getattr(owner, method, None)
-		if callable(method):
-			same_code = frame_info.frame.f_code.co_code == method.__code__.co_code
-			same_class = self.__place == owner.__place__
-			if ((same_code and same_class) or 
-				(not same_code and not same_class and 
-				(self.__place == getBase(owner, Object).__place__))):
-				return self.__func__(*args, **kwargs)
-		raise AccessError(f"'{self.__func__.__name__}' is private", type=AccessErrors.PRIVATE)
-
+		if access_controller.instrumenting:
+			access_controller.observe_member('method', args[0], 'private', self.__owner__, self.__func__.__name__, 2)
+			return self.__func__(*args, **kwargs)
+		code = _getframe(1).f_code
+		if ((self.__owner__ is not None and id(code) in self.__owner__.__own_codes__) or 
+			(access_controller.sampling and not access_controller.sampled(code, self.__func__.__name__))):
+			return self.__func__(*args, **kwargs)
+		access_controller.violation(AccessError(f"'{self.__func__.__name__}' is private", type=AccessErrors.PRIVATE))
+		return self.__func__(*args, **kwargs)
 
-class publicproperty(property):
-	pass
 
+class accessproperty(property):
+	access_mode = 'public'
+	cached = False
 
-class protectedproperty(property):
-	def __init__(self, fget=None, fset=None, fdel=None, doc=None):
+	def __init__(self, fget=None, fset=None, fdel=None, doc=None, *, access_mode: str = None, cached: bool = None):
 		super().__init__(fget, fset, fdel, doc)
-		code = stack(2)[-1].frame.f_code
-		self.__place = (code.co_firstlineno, code.co_filename)
+		if access_mode is not None:
+			self.access_mode = access_mode
+		if cached is not None:
+			self.cached = cached
+		self.__owner__ = None
+		self.__name__ = getattr(fget, '__name__', None)
 
-	def __get__(self, obj, objtype=None):
-		if obj is None:
-			return self
-		if self.fget is None:
-			raise AttributeError("can't get attribute")
-		frame_info = stack(3)[-1]
-		owner = objtype or type(obj)
-		method = frame_info.function
-		method = getattr(owner, method, None)
-		if callable(method):
-			same_code = frame_info.frame.f_code.co_code == method.__code__.co_code
-			if (same_code or 
-				(not same_code and not (self.__place == owner.__place__) and 
-				(self.__place == getBase(owner, Object).__place__))):
-				return self.fget(obj)
-		raise AccessError(f"'{self.fget.__name__}' is protected", type=AccessErrors.PROTECTED)
+	def __set_name__(self, owner: type, name: str) -> None:
+		self.__owner__ = owner
+		self.__name__ = name
 
-	def __set__(self, obj, value):
-		if self.fset is None:
-			raise AttributeError("can't set attribute")
-		frame_info = stack(3)[-1]
-		owner = type(obj)
-		method = frame_info.function
-		method = getattr(owner, method, None)
-		if callable(method):
-			same_code = frame_info.frame.f_code.co_code == method.__code__.co_code
-			if (same_code or 
-				(not same_code and not (self.__place == owner.__place__) and 
-				(self.__place == getBase(owner, Object).__place__))):
-				return self.fset(obj, value)
-		raise AccessError(f"'{self.fset.__name__}' is protected", type=AccessErrors.PROTECTED)
+	def copy(self, **kwargs) -> 'accessproperty':
+		options = {'access_mode': self.access_mode, 'cached': self.cached}
+		options.update(kwargs)
+		fget, fset, fdel = (options.pop(name, getattr(self, name)) for name in ('fget', 'fset', 'fdel'))
+		return type(self)(fget, fset, fdel, self.__doc__, **options)
 
-	def __delete__(self, obj):
-		if self.fdel is None:
-			raise AttributeError("can't delete attribute")
-		frame_info = stack(3)[-1]
-		owner = type(obj)
-		method = frame_info.function
-		method = getattr(owner, method, None)
-		if callable(method):
-			same_code = frame_info.frame.f_code.co_code == method.__code__.co_code
-			if (same_code or 
-				(not same_code and not (self.__place == owner.__place__) and 
-				(self.__place == getBase(owner, Object).__place__))):
-				return self.fdel(obj)
-		raise AccessError(f"'{self.fdel.__name__}' is protected", type=AccessErrors.PROTECTED)
-
-
-class privateproperty(property):
-	def __init__(self, fget=None, fset=None, fdel=None, doc=None):
-		super().__init__(fget, fset, fdel, doc)
-		code = stack(2)[-1].frame.f_code
-		self.__place = (code.co_firstlineno, code.co_filename)
+	def getter(self, fget: Callable) -> 'accessproperty':
+		return self.copy(fget=fget)
+
+	def setter(self, fset: Callable) -> 'accessproperty':
+		return self.copy(fset=fset)
+
+	def deleter(self, fdel: Callable) -> 'accessproperty':
+		return self.copy(fdel=fdel)
+
+	def check(self, obj, code: CodeType, function: Callable):
+		if access_controller.instrumenting:
+			access_controller.observe_member('property', type(obj), self.access_mode, self.__owner__, function.__name__, 0, code)
+			return
+		if self.access_mode == 'protected':
+			if id(code) in type(obj).__codes__:
+				return
+		elif self.__owner__ is not None and id(code) in self.__owner__.__own_codes__:
+			return
+		if access_controller.sampling and not access_controller.sampled(code, function.__name__):
+			return
+		access_controller.violation(AccessError(f"'{function.__name__}' is {self.access_mode}", type=AccessErrors[self.access_mode.upper()]))
 
 	def __get__(self, obj, objtype=None):
 		if obj is None:
 			return self
 		if self.fget is None:
 			raise AttributeError("can't get attribute")
-		frame_info = stack(3)[-1]
-		owner = objtype or type(obj)
-		method = frame_info.function
-		method = getattr(owner, method, None)
-		if callable(method):
-			same_code = frame_info.frame.f_code.co_code == method.__code__.co_code
-			same_class = self.__place == owner.__place__
-			if ((same_code and same_class) or 
-				(not same_code and not same_class and 
-				(self.__place == getBase(owner, Object).__place__))):
-				return self.fget(obj)
-		raise AccessError(f"'{self.fget.__name__}' is private", type=AccessErrors.PRIVATE)
+		if self.access_mode != 'public':
+			self.check(obj, access_controller.member_code(1), self.fget)
+		if not self.cached:
+			return self.fget(obj)
+		key = f'_accessproperty__{self.__name__}'
+		try:
+			return object.__getattribute__(obj, key)
+		except AttributeError:
+			value = self.fget(obj)
+			object.__setattr__(obj, key, value)
+			return value
 
 	def __set__(self, obj, value):
 		if self.fset is None:
 			raise AttributeError("can't set attribute")
-		frame_info = stack(3)[-1]
-		owner = type(obj)
-		method = frame_info.function
-		method = getattr(owner, method, None)
-		if callable(method):
-			same_code = frame_info.frame.f_code.co_code == method.__code__.co_code
-			same_class = self.__place == owner.__place__
-			if ((same_code and same_class) or 
-				(not same_code and not same_class and 
-				(self.__place == getBase(owner, Object).__place__))):
-				return self.fset(obj, value)
-		raise AccessError(f"'{self.fset.__name__}' is private", type=AccessErrors.PRIVATE)
+		if self.access_mode != 'public':
+			self.check(obj, access_controller.member_code(1), self.fset)
+		self.fset(obj, value)
+		if self.cached:
+			self.clear(obj)
 
 	def __delete__(self, obj):
-		if self.fdel is None:
+		if self.fdel is None and not self.cached:
 			raise AttributeError("can't delete attribute")
-		frame_info = stack(3)[-1]
-		owner = type(obj)
-		method = frame_info.function
-		method = getattr(owner, method, None)
-		if callable(method):
-			same_code = frame_info.frame.f_code.co_code == method.__code__.co_code
-			same_class = self.__place == owner.__place__
-			if ((same_code and same_class) or 
-				(not same_code and not same_class and 
-				(self.__place == getBase(owner, Object).__place__))):
-				return self.fdel(obj)
-		raise AccessError(f"'{self.fdel.__name__}' is private", type=AccessErrors.PRIVATE)
+		if self.access_mode != 'public':
+			self.check(obj, access_controller.member_code(1), self.fdel or self.fget)
+		if self.fdel is not None:
+			self.fdel(obj)
+		if self.cached:
+			self.clear(obj)
+
+	def clear(self, obj):
+		try:
+			object.__delattr__(obj, f'_accessproperty__{self.__name__}')
+		except AttributeError:
+			pass
+
+
+class publicproperty(property):
+	pass
+
+
+class protectedproperty(accessproperty):
+	access_mode = 'protected'
+
+
+class privateproperty(accessproperty):
+	access_mode = 'private'
+
+
+class cachedproperty(accessproperty):
+	cached = True
+
+
+class protectedcachedproperty(cachedproperty):
+	access_mode = 'protected'
+
+
+class privatecachedproperty(cachedproperty):
+	access_mode = 'private'
+
+
+if not ENFORCE:
+	protectedmethod = privatemethod = publicmethod
+	protectedstaticmethod = privatestaticmethod = staticmethod
+	protectedclassmethod = privateclassmethod = classmethod
+	protectedproperty = privateproperty = property
+	protectedcachedproperty = privatecachedproperty = cachedproperty
 
 
 if __name__ == '__main__':
@@ -0,0 +1,69 @@
+from unittest import TestCase
+
+from pyobject import AccessError, AccessErrors, Object, access_controller
+
+
+class TestAccessCache(TestCase):
+	def setUp(self) -> None:
+		class A(Object):
+			def __init__(self) -> None:
+				super().__init__()
+				self.protected_attribute("protected", "[protected value]")
+
+			def read(self):
+				return self.protected
+
+		self._Type = A
+		access_controller.cache_clear()
+		return super().setUp()
+
+	def testHitsAndMisses(self):
+		a = self._Type()
+		for _ in range(10):
+			self.assertEqual(a.read(), "[protected value]")
+		info = access_controller.cache_info()
+		self.assertEqual(info['misses'], 1)
+		self.assertEqual(info['hits'], 9)
+		self.assertEqual(info['currsize'], 1)
+
+	def testDeniedDecisionIsCached(self):
+		a = self._Type()
+		for _ in range(3):
+			with self.assertRaises(AccessError) as access_error:
+				a.protected
+			self.assertEqual(access_error.exception.type, AccessErrors.PROTECTED)
+		info = access_controller.cache_info()
+		self.assertEqual(info['misses'], 1)
+		self.assertEqual(info['hits'], 2)
+
+	def testInvalidatedOnClassCreation(self):
+		self._Type().read()
+		self.assertEqual(access_controller.cache_info()['currsize'], 1)
+
+		class B(self._Type):
+			pass
+
+		self.assertEqual(access_controller.cache_info()['currsize'], 0)
+
+	def testInvalidatedOnMonkeypatch(self):
+		def read(self):
+			value = self.protected
+			return value
+
+		a = self._Type()
+		with self.assertRaises(AccessError):
+			read(a)
+		self._Type.read = read
+		self.assertEqual(read(a), "[protected value]")
+
+	def testBounded(self):
+		maxsize = access_controller.maxsize
+		access_controller.maxsize = 2
+		try:
+			a = self._Type()
+			for function in (lambda: a.protected, lambda: a.protected, lambda: a.protected):
+				with self.assertRaises(AccessError):
+					function()
+			self.assertEqual(access_controller.cache_info()['currsize'], 2)
+		finally:
+			access_controller.maxsize = maxsize
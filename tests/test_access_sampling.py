@@ -0,0 +1,78 @@
+from unittest import TestCase
+
+from pyobject import AccessError, AccessErrors, Object, access_controller, protectedmethod
+
+
+class TestAccessSampling(TestCase):
+	def setUp(self) -> None:
+		class A(Object):
+			def __init__(self) -> None:
+				super().__init__()
+				self.protected_attribute("protected", "[protected value]")
+				self.protected_attribute("other", "[other value]")
+
+			@protectedmethod
+			def method(self):
+				return "[method value]"
+
+		self._Type = A
+		return super().setUp()
+
+	def tearDown(self) -> None:
+		access_controller.sample()
+		return super().tearDown()
+
+	def testOneInNIsChecked(self):
+		access_controller.sample(rate=4)
+		t = self._Type()
+		raised = []
+		for _ in range(8):
+			try:
+				t.protected
+				raised.append(False)
+			except AccessError as access_error:
+				self.assertEqual(access_error.type, AccessErrors.PROTECTED)
+				raised.append(True)
+		self.assertEqual(raised, [True, False, False, False, True, False, False, False])
+
+	def testSitesInOneFunctionAreSampledSeparately(self):
+		violations = []
+		access_controller.sample(rate=2, report=violations.append)
+		t = self._Type()
+
+		def read():
+			return t.protected, t.other
+
+		for _ in range(2):
+			self.assertEqual(read(), ("[protected value]", "[other value]"))
+		self.assertEqual(len(violations), 2)
+		self.assertEqual(sorted(str(violation) for violation in violations), ["'other' is protected", "'protected' is protected"])
+
+	def testMethodsAreSampled(self):
+		access_controller.sample(rate=2)
+		t = self._Type()
+		with self.assertRaises(AccessError):
+			t.method()
+		self.assertEqual(t.method(), "[method value]")
+		with self.assertRaises(AccessError):
+			t.method()
+
+	def testInterval(self):
+		access_controller.sample(interval=3600)
+		t = self._Type()
+		with self.assertRaises(AccessError):
+			t.protected
+		for _ in range(10):
+			self.assertEqual(t.protected, "[protected value]")
+
+	def testReportedViolations(self):
+		violations = []
+		access_controller.sample(rate=2, report=violations.append)
+		t = self._Type()
+		for _ in range(4):
+			self.assertEqual(t.protected, "[protected value]")
+		self.assertEqual([violation.type for violation in violations], [AccessErrors.PROTECTED] * 2)
+
+	def testInvalidRate(self):
+		with self.assertRaises(ValueError):
+			access_controller.sample(rate=0)
@@ -0,0 +1,231 @@
+import json
+from importlib.util import module_from_spec, spec_from_file_location
+from os import mkdir
+from os.path import join
+from tempfile import TemporaryDirectory
+from textwrap import dedent
+from unittest import TestCase
+
+from checker import Checker, main
+from pyobject import AccessError, access_controller
+
+
+SOURCE = dedent('''
+	from pyobject import Object, private, protected, privatemethod
+
+
+	class A(Object):
+		field = private(0)
+		shared = protected(0)
+
+		def __init__(self) -> None:
+			super().__init__()
+			self.private_attribute("secret", 1)
+			self.protected_attribute("visible", 2)
+
+		def read(self):
+			return self.secret + self.field + self.visible
+
+		@privatemethod
+		def helper(self):
+			return [self.secret for _ in range(2)]
+
+
+	class B(A):
+		def read_child(self):
+			return self.visible + self.shared
+
+		def steal(self):
+			return self.secret
+
+
+	def outside(a):
+		return a.secret, a.helper()
+''')
+
+
+class TestChecker(TestCase):
+	def check(self, source: str = SOURCE):
+		checker = Checker()
+		checker.add_source(source, 'sample.py')
+		return checker.check()
+
+	def testViolations(self):
+		violations, _ = self.check()
+		self.assertEqual(
+			[(violation.line, violation.message) for violation in violations],
+			[
+				(27, "'secret' is private to 'A'"),
+				(31, "'secret' is private to 'A'"),
+				(31, "'helper' is private to 'A'"),
+			]
+		)
+
+	def testProven(self):
+		_, proven = self.check()
+		self.assertEqual(
+			sorted((site.scope.name, site.attribute) for site in proven),
+			[('read', 'field'), ('read', 'secret'), ('read', 'visible'), ('read_child', 'shared'), ('read_child', 'visible')]
+		)
+
+	def testNestedScopesAreNotProven(self):
+		_, proven = self.check()
+		self.assertNotIn('helper', [site.scope.name for site in proven])
+
+	def testPublicRedeclarationIsIgnored(self):
+		violations, proven = self.check(SOURCE + dedent('''
+			class C(Object):
+				def __init__(self) -> None:
+					super().__init__()
+					self.public_attribute("secret", 0)
+		'''))
+		self.assertNotIn('secret', [site.attribute for site in proven])
+		self.assertNotIn("'secret' is private to 'A'", [violation.message for violation in violations])
+
+	def testBulkDeclarations(self):
+		violations, proven = self.check(dedent('''
+			from pyobject import Object
+
+
+			class A(Object):
+				def __init__(self) -> None:
+					super().__init__()
+					self.declare_attributes(protected={"visible": 1}, private={"secret": 2})
+
+				def read(self):
+					return self.visible + self.secret
+
+
+			def outside(a):
+				return a.visible, a.secret
+		'''))
+		self.assertEqual(
+			[violation.message for violation in violations],
+			["'visible' is protected to 'A'", "'secret' is private to 'A'"]
+		)
+		self.assertEqual(sorted(site.attribute for site in proven), ['secret', 'visible'])
+
+	def testSyntaxError(self):
+		checker = Checker()
+		checker.add_source("class A(:\n", 'broken.py')
+		self.assertEqual(len(checker.errors), 1)
+
+
+RUNTIME_SOURCE = dedent('''
+	from pyobject import Object, private
+
+
+	def passthrough(function):
+		def wrapper(self, *args):
+			return function(self, *args)
+		return wrapper
+
+
+	class A(Object):
+		def __init__(self) -> None:
+			super().__init__()
+			self.private_attribute("secret", 1)
+
+		@passthrough
+		def read(self):
+			return self.secret
+
+		def peek(self, other):
+			return self.secret, other.secret
+
+
+	class B(Object):
+		def __init__(self) -> None:
+			super().__init__()
+			self.private_attribute("secret", 2)
+''')
+
+
+class TestManifest(TestCase):
+	def setUp(self) -> None:
+		self._directory = TemporaryDirectory()
+		self._manifest = join(self._directory.name, 'manifest.json')
+		return super().setUp()
+
+	def tearDown(self) -> None:
+		access_controller.load_manifest()
+		self._directory.cleanup()
+		return super().tearDown()
+
+	def load(self, source: str, name: str):
+		path = join(self._directory.name, f'{name}.py')
+		with open(path, 'w') as file:
+			file.write(source)
+		spec = spec_from_file_location(f'checker_{name}', path)
+		module = module_from_spec(spec)
+		spec.loader.exec_module(module)
+		return path, module
+
+	def testCommandLine(self):
+		path, _ = self.load(SOURCE, 'sample')
+		self.assertEqual(main([path, '--manifest', self._manifest]), 1)
+		with open(self._manifest) as file:
+			manifest = json.load(file)
+		self.assertEqual(manifest['version'], 2)
+		self.assertEqual(
+			sorted((site['function'], site['attribute'], site['class']) for site in manifest['sites']),
+			[('read', 'field', 'A'), ('read', 'secret', 'A'), ('read', 'visible', 'A'), ('read_child', 'shared', 'A'), ('read_child', 'visible', 'A')]
+		)
+		self.assertTrue(all(site['file'] == 'sample.py' for site in manifest['sites']))
+
+	def testPathsAreRelativeToRoot(self):
+		package = join(self._directory.name, 'package')
+		mkdir(package)
+		with open(join(package, 'sample.py'), 'w') as file:
+			file.write(SOURCE)
+		main([self._directory.name, '--manifest', self._manifest])
+		with open(self._manifest) as file:
+			manifest = json.load(file)
+		self.assertTrue(all(site['file'] == 'package/sample.py' for site in manifest['sites']))
+
+	def testOtherReceiversAreNotProven(self):
+		checker = Checker()
+		checker.add_source(RUNTIME_SOURCE, 'runtime.py')
+		_, proven = checker.check()
+		self.assertEqual([(site.scope.name, site.attribute) for site in proven], [('read', 'secret')])
+		checker = Checker()
+		checker.add_source(SOURCE + dedent('''
+			class C(A):
+				def swap(self, other):
+					self = other
+					return self.visible
+		'''), 'sample.py')
+		_, proven = checker.check()
+		self.assertNotIn('swap', [site.scope.name for site in proven])
+
+	def testRuntimeSkipsProvenSites(self):
+		path, module = self.load(RUNTIME_SOURCE, 'runtime')
+		a, b = module.A(), module.B()
+		with self.assertRaises(AccessError):
+			a.read()
+		main([path, '--manifest', self._manifest])
+		access_controller.load_manifest(self._manifest)
+		self.assertEqual(a.read(), 1)
+		with self.assertRaises(AccessError):
+			a.peek(b)
+
+	def testManifestChecksDeclaringClass(self):
+		path, module = self.load(RUNTIME_SOURCE, 'runtime')
+		a, b = module.A(), module.B()
+		with open(self._manifest, 'w') as file:
+			json.dump({
+				'version': 2,
+				'sites': [
+					{'file': 'runtime.py', 'line': 20, 'function': 'peek', 'attribute': 'secret', 'class': 'A'},
+				],
+			}, file)
+		access_controller.load_manifest(self._manifest)
+		with self.assertRaises(AccessError):
+			a.peek(b)
+		self.assertEqual(a.peek(module.A()), (1, 1))
+
+	def testUnsupportedVersion(self):
+		with open(self._manifest, 'w') as file:
+			json.dump({'version': 1, 'sites': []}, file)
+		with self.assertRaises(ValueError):
+			access_controller.load_manifest(self._manifest)
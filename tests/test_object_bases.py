@@ -0,0 +1,52 @@
+from unittest import TestCase
+
+from pyobject import AccessError, Object
+
+
+class TestObjectBases(TestCase):
+	def setUp(self) -> None:
+		class Mixin:
+			def mixin_read(self):
+				return self.protected
+
+		class A(Object):
+			def __init__(self) -> None:
+				super().__init__()
+				self.protected_attribute("protected", "[protected value]")
+				self.private_attribute("private", "[private value]")
+
+		class B(A):
+			pass
+
+		class C(A):
+			def __init__(self) -> None:
+				super().__init__()
+				self.private_attribute("own", "[own value]")
+
+		class D(Mixin, B, C):
+			def read(self):
+				return self.protected
+
+			def read_own(self):
+				return self.own
+
+		self._Mixin, self._A, self._B, self._C, self._D = Mixin, A, B, C, D
+		return super().setUp()
+
+	def testDiamondDeclaringClass(self):
+		t = self._D()
+		self.assertEqual(t.read(), "[protected value]")
+		with self.assertRaises(AccessError):
+			t.read_own()
+		with self.assertRaises(AccessError):
+			t.protected
+
+	def testDeepHierarchy(self):
+		def read(self):
+			return self.protected
+
+		cls = self._A
+		for _ in range(8):
+			cls = type('Level', (cls,), {'read': read})
+		t = cls()
+		self.assertEqual(t.read(), "[protected value]")
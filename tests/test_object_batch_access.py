@@ -0,0 +1,184 @@
+from unittest import TestCase
+
+from pyobject import (
+	AccessError, AccessErrors, Object, access_controller, private, privateproperty, protected, protectedproperty
+)
+
+
+class TestBatchAccess(TestCase):
+	def setUp(self) -> None:
+		class A(Object):
+			field = private(0)
+			unset = protected()
+
+			def __init__(self) -> None:
+				super().__init__()
+				self.public_attribute("public", "[public value]")
+				self.protected_attribute("protected", "[protected value]")
+				self.private_attribute("private", "[private value]")
+				self.private_attribute("constant", "[constant value]", final=True)
+				self.plain = "[plain value]"
+
+			def read(self, *names):
+				return self.get_many(names)
+
+			def write(self, **mapping):
+				self.set_many(mapping)
+
+			def values(self):
+				return self.field, self.public, self.protected, self.private, self.plain
+
+		class B(A):
+			def read_child(self, *names):
+				return self.get_many(names)
+
+			def write_child(self, **mapping):
+				self.set_many(mapping)
+
+		self._Type = A
+		self._Child = B
+		return super().setUp()
+
+	def testGetMany(self):
+		a = self._Type()
+		names = ("field", "public", "protected", "private", "constant", "plain")
+		expected = (0, "[public value]", "[protected value]", "[private value]", "[constant value]", "[plain value]")
+		for _ in range(3):
+			self.assertEqual(a.read(*names), expected)
+		self.assertEqual(a.get_many(["public", "plain"]), ("[public value]", "[plain value]"))
+		self.assertEqual(a.read("read")[0].__name__, "read")
+
+	def testGetManyChecksAccess(self):
+		a = self._Type()
+		with self.assertRaises(AccessError) as context:
+			a.get_many(("public", "protected"))
+		self.assertEqual(context.exception.type, AccessErrors.PROTECTED)
+		b = self._Child()
+		self.assertEqual(b.read_child("protected"), ("[protected value]",))
+		for _ in range(2):
+			with self.assertRaises(AccessError) as context:
+				b.read_child("protected", "private")
+			self.assertEqual(context.exception.type, AccessErrors.PRIVATE)
+
+	def testGetManyMissing(self):
+		a = self._Type()
+		for _ in range(2):
+			with self.assertRaises(AttributeError):
+				a.read("field", "unset")
+		a.write(unset=1)
+		self.assertEqual(a.read("field", "unset"), (0, 1))
+		with self.assertRaises(AttributeError):
+			a.read("missing")
+
+	def testGetManySeesDictOverlay(self):
+		a = self._Type()
+		self.assertEqual(a.read("public"), ("[public value]",))
+		a.__dict__["public"] = "[overlay value]"
+		self.assertEqual(a.read("public"), ("[overlay value]",))
+
+	def testSetMany(self):
+		a = self._Type()
+		for index in range(3):
+			a.write(field=index, public=index, protected=index, private=index, plain=index)
+			self.assertEqual(a.values(), (index, index, index, index, index))
+		a.set_many({"public": "[public]", "other": "[other]"})
+		self.assertEqual(a.read("public", "other"), ("[public]", "[other]"))
+
+	def testSetManyChecksAccess(self):
+		a = self._Type()
+		with self.assertRaises(AccessError) as context:
+			a.set_many({"public": 1, "private": 1})
+		self.assertEqual(context.exception.type, AccessErrors.PRIVATE)
+		self.assertEqual(a.values()[1], "[public value]")
+		b = self._Child()
+		b.write_child(protected=1)
+		for _ in range(2):
+			with self.assertRaises(AccessError):
+				b.write_child(public=1, field=1)
+		self.assertEqual(b.values()[:2], (0, "[public value]"))
+
+	def testSetManyIsAtomicForFinal(self):
+		a = self._Type()
+		for _ in range(2):
+			with self.assertRaises(AccessError) as context:
+				a.write(field=1, public=1, constant=1)
+			self.assertEqual(context.exception.type, AccessErrors.FINAL)
+			self.assertEqual(a.values()[:2], (0, "[public value]"))
+		self.assertEqual(a.read("constant"), ("[constant value]",))
+
+	def testInstrumented(self):
+		a = self._Type()
+		a.read("protected", "private")
+		access_controller.metrics_clear()
+		access_controller.instrument()
+		try:
+			a.read("protected", "private")
+			a.write(protected=1, private=1)
+			metrics = access_controller.metrics()['classes'][self._Type]
+		finally:
+			access_controller.instrument(False)
+			access_controller.metrics_clear()
+		self.assertEqual(metrics['get']['allowed'], 2)
+		self.assertEqual(metrics['set']['allowed'], 2)
+
+	def testReleasedClass(self):
+		class C(Object, enforce=False):
+			def __init__(self) -> None:
+				super().__init__()
+				self.private_attribute("private", 1)
+
+		c = C()
+		c.set_many({"private": 2, "other": 3})
+		self.assertEqual(c.get_many(("private", "other")), (2, 3))
+
+	def testProperties(self):
+		class A(Object):
+			def __init__(self) -> None:
+				super().__init__()
+				self.private_attribute("value", 1)
+
+			@privateproperty
+			def hidden(self):
+				return self.value
+
+			@hidden.setter
+			def hidden(self, value):
+				self.value = value
+
+			@protectedproperty
+			def visible(self):
+				return self.value
+
+			@visible.setter
+			def visible(self, value):
+				self.value = value
+
+			def read(self, *names):
+				return self.get_many(names)
+
+			def write(self, **mapping):
+				self.set_many(mapping)
+
+		class B(A):
+			def read_child(self, *names):
+				return self.get_many(names)
+
+			def write_child(self, **mapping):
+				self.set_many(mapping)
+
+		b = B()
+		for _ in range(2):
+			self.assertEqual(b.read("hidden", "visible"), (1, 1))
+			b.write(hidden=2)
+			b.write(visible=3)
+			self.assertEqual(b.read_child("visible"), (3,))
+			b.write_child(visible=1)
+		for access in (
+				lambda: b.read_child("hidden"),
+				lambda: b.write_child(hidden=0),
+				lambda: b.get_many(("visible",)),
+				lambda: b.set_many({"visible": 0})
+			):
+			with self.assertRaises(AccessError):
+				access()
+		self.assertEqual(b.read("visible"), (1,))
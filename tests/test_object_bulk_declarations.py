@@ -0,0 +1,110 @@
+from unittest import TestCase
+
+from pyobject import AccessError, AccessErrors, Object
+
+STATE = '_PrivateObject__state'
+
+class TestBulkDeclaration(TestCase):
+	def setUp(self) -> None:
+		class A(Object):
+			def __init__(self) -> None:
+				super().__init__()
+				self.declare_attributes(
+					public={"public": "[public value]"},
+					protected={"protected": "[protected value]", "constant": "[constant value]"},
+					private={"private": "[private value]"},
+					final=("constant",)
+				)
+
+			def read(self):
+				return self.public, self.protected, self.constant, self.private
+
+		class B(A):
+			def read_child(self):
+				return self.protected
+
+			def steal(self):
+				return self.private
+
+		self._Type = A
+		self._Child = B
+		return super().setUp()
+
+	def testFromInside(self):
+		self.assertEqual(
+			self._Type().read(),
+			("[public value]", "[protected value]", "[constant value]", "[private value]")
+		)
+
+	def testFromOutside(self):
+		t = self._Type()
+		self.assertEqual(t.public, "[public value]")
+		with self.assertRaises(AccessError) as context:
+			t.protected
+		self.assertEqual(context.exception.type, AccessErrors.PROTECTED)
+		with self.assertRaises(AccessError) as context:
+			t.private
+		self.assertEqual(context.exception.type, AccessErrors.PRIVATE)
+
+	def testFromChild(self):
+		t = self._Child()
+		self.assertEqual(t.read_child(), "[protected value]")
+		with self.assertRaises(AccessError):
+			t.steal()
+
+	def testFinal(self):
+		class C(self._Type):
+			def change(self, name):
+				setattr(self, name, "[changed]")
+
+		t = C()
+		t.change("protected")
+		with self.assertRaises(AccessError) as context:
+			t.change("constant")
+		self.assertEqual(context.exception.type, AccessErrors.FINAL)
+
+	def testSameLayoutAsSingleDeclarations(self):
+		class C(Object):
+			def __init__(self) -> None:
+				super().__init__()
+				self.protected_attribute("protected", 1)
+				self.private_attribute("private", 2)
+
+		class D(Object):
+			def __init__(self) -> None:
+				super().__init__()
+				self.declare_attributes(protected={"protected": 1}, private={"private": 2})
+
+		single = object.__getattribute__(C(), STATE)
+		bulk = object.__getattribute__(D(), STATE)
+		self.assertEqual(
+			[(a.name, a.access_mode, a.slot) for a in single.shape.attributes.values()],
+			[(a.name, a.access_mode, a.slot) for a in bulk.shape.attributes.values()]
+		)
+		self.assertEqual(single.values, bulk.values)
+		self.assertIs(object.__getattribute__(D(), STATE).shape, bulk.shape)
+
+	def testRedeclaration(self):
+		class C(Object):
+			def __init__(self) -> None:
+				super().__init__()
+				self.__dict__["value"] = "[dict value]"
+				self.protected_attribute("other", 0)
+				self.declare_attributes(private={"other": 1, "value": None})
+
+			def read(self):
+				return self.other, self.value
+
+		t = C()
+		self.assertEqual(t.read(), (1, "[dict value]"))
+		with self.assertRaises(AccessError):
+			t.other
+
+	def testUndeclaredFinal(self):
+		class C(Object):
+			def __init__(self) -> None:
+				super().__init__()
+				self.declare_attributes(private={"value": 0}, final=("other",))
+
+		with self.assertRaises(ValueError):
+			C()
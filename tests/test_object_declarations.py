@@ -0,0 +1,151 @@
+from unittest import TestCase
+
+from pyobject import AccessError, AccessErrors, Object, final, private, protected, public
+
+
+class TestPublicDeclaration(TestCase):
+	def setUp(self) -> None:
+		class A(Object):
+			public = public("[public value]")
+		self._Type = A
+		return super().setUp()
+
+	def testGetPublicFromOutside(self):
+		self.assertEqual(self._Type().public, "[public value]")
+
+	def testSetPublicFromOutside(self):
+		t = self._Type()
+		t.public = "[public value changed]"
+		self.assertEqual(t.public, "[public value changed]")
+		self.assertEqual(self._Type().public, "[public value]", "Values are stored per instance")
+
+	def testDeletePublic(self):
+		t = self._Type()
+		del t.public
+		with self.assertRaises(AttributeError):
+			t.public
+
+
+class TestProtectedDeclaration(TestCase):
+	def setUp(self) -> None:
+		class A(Object):
+			protected = protected("[protected value]")
+
+			def get(self):
+				return self.protected
+
+			def set(self, value):
+				self.protected = value
+
+		self._Type = A
+		return super().setUp()
+
+	def testFromInside(self):
+		t = self._Type()
+		t.set("[protected value changed]")
+		self.assertEqual(t.get(), "[protected value changed]")
+
+	def testFromInsideWithChild(self):
+		class B(self._Type):
+			def child_get(self):
+				return self.protected
+
+		self.assertEqual(B().child_get(), "[protected value]")
+
+	def testFromOutside(self):
+		t = self._Type()
+		with self.assertRaises(AccessError) as access_error:
+			t.protected
+		self.assertEqual(access_error.exception.type, AccessErrors.PROTECTED)
+		with self.assertRaises(AccessError) as access_error:
+			t.protected = "[protected value changed]"
+		self.assertEqual(access_error.exception.type, AccessErrors.PROTECTED)
+
+
+class TestPrivateDeclaration(TestCase):
+	def setUp(self) -> None:
+		class A(Object):
+			private = private("[private value]")
+
+			def get(self):
+				return self.private
+
+		self._Type = A
+		return super().setUp()
+
+	def testFromInside(self):
+		self.assertEqual(self._Type().get(), "[private value]")
+
+	def testFromInsideWithChild(self):
+		class B(self._Type):
+			def child_get(self):
+				return self.private
+
+		with self.assertRaises(AccessError) as access_error:
+			B().child_get()
+		self.assertEqual(access_error.exception.type, AccessErrors.PRIVATE)
+
+	def testFromOutside(self):
+		with self.assertRaises(AccessError) as access_error:
+			self._Type().private
+		self.assertEqual(access_error.exception.type, AccessErrors.PRIVATE)
+
+
+class TestFinalDeclaration(TestCase):
+	def testFinalWithValue(self):
+		class A(Object):
+			constant = final("[final value]")
+
+		t = A()
+		self.assertEqual(t.constant, "[final value]")
+		with self.assertRaises(AccessError) as access_error:
+			t.constant = "[final value changed]"
+		self.assertEqual(access_error.exception.type, AccessErrors.FINAL)
+
+	def testBlankFinalAssignedOnce(self):
+		class A(Object):
+			identifier = protected(final=True)
+
+			def __init__(self, identifier) -> None:
+				super().__init__()
+				self.identifier = identifier
+
+			def change(self):
+				self.identifier = None
+
+		t = A(1)
+		with self.assertRaises(AccessError) as access_error:
+			t.change()
+		self.assertEqual(access_error.exception.type, AccessErrors.FINAL)
+
+	def testFinalMarkerKeepsAccessMode(self):
+		class A(Object):
+			constant = final(private("[final value]"))
+
+		with self.assertRaises(AccessError) as access_error:
+			A().constant
+		self.assertEqual(access_error.exception.type, AccessErrors.PRIVATE)
+
+
+class TestDeclarationLayout(TestCase):
+	def testInheritedSlots(self):
+		class A(Object):
+			a = public(1)
+
+		class B(A):
+			b = public(2)
+
+		t = B()
+		self.assertEqual((t.a, t.b), (1, 2))
+		self.assertEqual([field.slot for field in B.__layout__], [0, 1])
+
+	def testLayoutConflict(self):
+		class A(Object):
+			a = public(1)
+
+		class B(Object):
+			b = public(2)
+
+		with self.assertRaises(TypeError):
+			class C(A, B):
+				pass
@@ -0,0 +1,57 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+from pyobject import (AccessError, Object, privateclassmethod, privatemethod, privateproperty,
+	privatestaticmethod, protectedmethod, protectedproperty)
+
+
+class TestObjectDefinition(TestCase):
+	def testNoFrameInspection(self):
+		with patch('inspect.getframeinfo', side_effect=AssertionError), patch('utils.frameinfo', side_effect=AssertionError):
+			class A(Object):
+				def __init__(self) -> None:
+					super().__init__()
+					self.private_attribute("private", 1)
+
+				@protectedmethod
+				def protected_method(self):
+					return None
+
+				@privatemethod
+				def private_method(self):
+					return None
+
+				@privatestaticmethod
+				def private_static():
+					return None
+
+				@privateclassmethod
+				def private_class(cls):
+					return cls
+
+				@protectedproperty
+				def protected_property(self):
+					return None
+
+				@privateproperty
+				def private_property(self):
+					return None
+
+			class B(A):
+				pass
+
+			B()
+		self.assertFalse(hasattr(A, '__place__'))
+
+	def testClassesOnSameLine(self):
+		def read(self):
+			return self.private_method()
+
+		classes = [type('A', (Object,), {'private_method': privatemethod(lambda self: 1)}) for _ in range(2)]
+		first, second = [type('B', (cls,), {'read': read}) for cls in classes]
+		self.assertIs(vars(classes[0])['private_method'].__owner__, classes[0])
+		self.assertIs(vars(classes[1])['private_method'].__owner__, classes[1])
+		with self.assertRaises(AccessError):
+			first().read()
+		with self.assertRaises(AccessError):
+			second().read()
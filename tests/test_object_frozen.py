@@ -0,0 +1,199 @@
+import copy
+import pickle
+from unittest import TestCase
+
+from pyobject import (
+	AccessError, AccessErrors, Object, access_controller, cachedproperty, private, privatecachedproperty, privateproperty,
+	protectedproperty, public
+)
+
+
+class Point(Object, frozen=True):
+	x = public(0)
+	secret = private(0)
+
+	def __init__(self, x, y) -> None:
+		super().__init__()
+		self.x = x
+		self.public_attribute("y", y)
+		self.private_attribute("z", x + y)
+		self.secret = x * y
+
+	def total(self):
+		return self.x + self.y + self.z + self.secret
+
+	def change(self):
+		self.z = 0
+
+
+class TestFrozen(TestCase):
+	def testReads(self):
+		p = Point(1, 2)
+		self.assertEqual((p.x, p.y), (1, 2))
+		self.assertEqual(p.total(), 8)
+		with self.assertRaises(AccessError) as context:
+			p.z
+		self.assertEqual(context.exception.type, AccessErrors.PRIVATE)
+
+	def testWritesAreRejected(self):
+		p = Point(1, 2)
+		for write in (
+				lambda: setattr(p, "x", 0),
+				lambda: setattr(p, "y", 0),
+				lambda: setattr(p, "other", 0),
+				lambda: delattr(p, "x"),
+				p.change,
+				lambda: p.set_many({"x": 0}),
+				lambda: p.public_attribute("other", 0)
+			):
+			with self.assertRaises(AccessError) as context:
+				write()
+			self.assertEqual(context.exception.type, AccessErrors.FINAL)
+		with self.assertRaises(TypeError):
+			p.__dict__["other"] = 0
+		self.assertEqual(p.total(), 8)
+
+	def testEqualityAndHash(self):
+		a, b, c = Point(1, 2), Point(1, 2), Point(2, 1)
+		self.assertEqual(a, b)
+		self.assertNotEqual(a, c)
+		self.assertEqual(hash(a), hash(b))
+		self.assertEqual(len({a, b, c}), 2)
+		self.assertNotEqual(a, (1, 2))
+
+	def testConstructionIsNotSealed(self):
+		class A(Object, frozen=True):
+			def __init__(self) -> None:
+				super().__init__()
+				self.public_attribute("value", 1)
+				self.value = 2
+
+		self.assertEqual(A().value, 2)
+
+	def testSubclassesAreFrozen(self):
+		class A(Point):
+			def __init__(self) -> None:
+				super().__init__(1, 2)
+				self.public_attribute("extra", 3)
+
+		a = A()
+		self.assertEqual((a.y, a.extra), (2, 3))
+		with self.assertRaises(AccessError):
+			a.extra = 0
+		with self.assertRaises(TypeError):
+			class B(Point, frozen=False):
+				pass
+
+	def testPlainAttributes(self):
+		class A(Object, frozen=True):
+			def __init__(self, value) -> None:
+				super().__init__()
+				self.value = value
+
+		self.assertEqual(A(1), A(1))
+		self.assertNotEqual(A(1), A(2))
+		self.assertEqual(hash(A(1)), hash(A(1)))
+		self.assertNotEqual(hash(A(1)), hash(A(2)))
+		self.assertEqual(len({A(1), A(2), A(1)}), 2)
+		result = copy.deepcopy(A(1))
+		self.assertEqual(result, A(1))
+		self.assertEqual(hash(result), hash(A(1)))
+
+	def testProperties(self):
+		class A(Object, frozen=True):
+			def __init__(self) -> None:
+				super().__init__()
+				self.private_attribute("value", 1)
+
+			@protectedproperty
+			def visible(self):
+				return self.value
+
+			@privateproperty
+			def hidden(self):
+				return self.value + 1
+
+			@privatecachedproperty
+			def cached(self):
+				return self.value + 2
+
+			def read(self):
+				return self.visible, self.hidden, self.cached
+
+		class B(A):
+			def read_child(self):
+				return self.visible
+
+			def steal(self):
+				return self.hidden
+
+		b = B()
+		for _ in range(2):
+			self.assertEqual(b.read(), (1, 2, 3))
+		self.assertEqual(b.read_child(), 1)
+		access_controller.instrument()
+		try:
+			self.assertEqual(b.read(), (1, 2, 3))
+		finally:
+			access_controller.instrument(False)
+			access_controller.metrics_clear()
+		for read, error in (
+				(lambda: b.visible, AccessErrors.PROTECTED),
+				(lambda: b.hidden, AccessErrors.PRIVATE),
+				(b.steal, AccessErrors.PRIVATE)
+			):
+			with self.assertRaises(AccessError) as context:
+				read()
+			self.assertEqual(context.exception.type, error)
+
+	def testCustomEquality(self):
+		class A(Object, frozen=True):
+			def __eq__(self, other):
+				return True
+
+			__hash__ = object.__hash__
+
+		self.assertEqual(A(), 1)
+
+	def testCopyAndPickle(self):
+		p = Point(1, 2)
+		self.assertIs(copy.copy(p), p)
+		for result in (copy.deepcopy(p), pickle.loads(pickle.dumps(p))):
+			self.assertIsNot(result, p)
+			self.assertEqual(result, p)
+			self.assertEqual(hash(result), hash(p))
+			with self.assertRaises(AccessError):
+				result.x = 0
+
+	def testReleasedClass(self):
+		class A(Object, frozen=True, enforce=False):
+			def __init__(self, value) -> None:
+				super().__init__()
+				self.private_attribute("value", value)
+
+			@cachedproperty
+			def cached(self):
+				return object()
+
+		self.assertEqual(A(1), A(1))
+		self.assertNotEqual(A(1), A(2))
+		self.assertEqual(hash(A(1)), hash(A(1)))
+		a = A(1)
+		key = hash(a)
+		a.cached
+		for write in (
+				lambda: setattr(a, "value", 2),
+				lambda: setattr(a, "other", 2),
+				lambda: delattr(a, "value"),
+				lambda: a.private_attribute("value", 2),
+				lambda: a.declare_attributes(public={"value": 2}),
+				lambda: a.set_many({"value": 2})
+			):
+			with self.assertRaises(AccessError) as context:
+				write()
+			self.assertEqual(context.exception.type, AccessErrors.FINAL)
+		self.assertEqual((a, hash(a)), (A(1), key))
+		for result in (copy.copy(a), copy.deepcopy(a)):
+			self.assertEqual(result, a)
+			with self.assertRaises(AccessError):
+				result.value = 2
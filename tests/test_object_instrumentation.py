@@ -0,0 +1,121 @@
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from pyobject import (
+	AccessError, Object, access_controller, private, privatemethod, protectedclassmethod, protectedmethod, protectedproperty
+)
+
+
+class TestInstrumentation(TestCase):
+	def setUp(self) -> None:
+		class A(Object):
+			field = private(0)
+
+			def __init__(self) -> None:
+				super().__init__()
+				self.protected_attribute("protected", "[protected value]")
+
+			def read(self):
+				return self.field, self.protected
+
+			def write(self, value):
+				self.field = value
+				self.protected = value
+
+			@protectedmethod
+			def method(self):
+				return "[method value]"
+
+			@privatemethod
+			def hidden(self):
+				return "[hidden value]"
+
+			@protectedclassmethod
+			def factory(cls):
+				return "[factory value]"
+
+			@protectedproperty
+			def prop(self):
+				return "[property value]"
+
+			def call(self):
+				return self.method(), self.hidden(), self.factory(), self.prop
+
+		self._Type = A
+		access_controller.metrics_clear()
+		access_controller.instrument()
+		return super().setUp()
+
+	def tearDown(self) -> None:
+		access_controller.instrument(False)
+		access_controller.metrics_clear()
+		return super().tearDown()
+
+	def testDisabledByDefault(self):
+		access_controller.instrument(False)
+		t = self._Type()
+		t.read()
+		t.call()
+		self.assertNotIn(self._Type, access_controller.metrics()['classes'])
+
+	def testAllowedChecks(self):
+		t = self._Type()
+		t.read()
+		t.write(1)
+		t.call()
+		metrics = access_controller.metrics()['classes'][self._Type]
+		self.assertEqual(metrics['get']['allowed'], 2)
+		self.assertEqual(metrics['set']['allowed'], 2)
+		self.assertEqual(metrics['method']['allowed'], 3)
+		self.assertEqual(metrics['property']['allowed'], 1)
+		for kind in metrics.values():
+			self.assertEqual(kind['denied'], 0)
+			self.assertEqual(kind['checks'], kind['fast'] + kind['slow'])
+			self.assertGreaterEqual(kind['resolve_ns'], 0)
+			self.assertGreaterEqual(kind['decide_ns'], 0)
+
+	def testDeniedChecksStillRaise(self):
+		t = self._Type()
+		with self.assertRaises(AccessError):
+			t.protected
+		with self.assertRaises(AccessError):
+			t.field = 1
+		with self.assertRaises(AccessError):
+			t.method()
+		with self.assertRaises(AccessError):
+			t.prop
+		metrics = access_controller.metrics()
+		self.assertEqual(metrics['classes'][self._Type]['get']['denied'], 1)
+		self.assertEqual(metrics['classes'][self._Type]['set']['denied'], 1)
+		self.assertEqual(metrics['classes'][self._Type]['method']['denied'], 1)
+		self.assertEqual(metrics['classes'][self._Type]['property']['denied'], 1)
+		self.assertGreaterEqual(metrics['denied'], 4)
+
+	def testDecisionCacheIsTheFastPath(self):
+		t = self._Type()
+		for _ in range(3):
+			t.read()
+		metrics = access_controller.metrics()['classes'][self._Type]['get']
+		self.assertEqual(metrics['checks'], 6)
+		self.assertLessEqual(metrics['slow'], 2)
+		self.assertGreaterEqual(metrics['fast'], 4)
+
+	def testClear(self):
+		self._Type().read()
+		access_controller.metrics_clear()
+		self.assertEqual(access_controller.metrics()['checks'], 0)
+
+	def testPrometheusText(self):
+		self._Type().read()
+		text = access_controller.metrics_text()
+		self.assertIn('# TYPE pyobject_access_checks_total counter', text)
+		name = f'{self._Type.__module__}.{self._Type.__qualname__}'
+		self.assertIn(f'pyobject_access_checks_total{{class="{name}",kind="get",result="allowed"}} 2', text)
+		self.assertIn(f'pyobject_access_seconds_total{{class="{name}",kind="get",phase="resolve"}}', text)
+		with TemporaryDirectory() as directory:
+			path = os.path.join(directory, 'pyobject.prom')
+			access_controller.write_metrics(path)
+			with open(path) as file:
+				self.assertEqual(file.read(), access_controller.metrics_text())
+			self.assertEqual(os.listdir(directory), ['pyobject.prom'])
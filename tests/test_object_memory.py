@@ -0,0 +1,87 @@
+from unittest import TestCase
+
+from pyobject import Object, access_controller, private
+
+
+class TestMemoryInfo(TestCase):
+	def setUp(self) -> None:
+		class A(Object):
+			field = private(0)
+
+			def __init__(self) -> None:
+				super().__init__()
+				self.protected_attribute("protected", 1)
+				self.private_attribute("private", 2)
+
+		class B(Object):
+			field = private(0)
+
+		self._Type = A
+		self._Empty = B
+		return super().setUp()
+
+	def testPerClassCounts(self):
+		instances = [self._Type() for _ in range(5)]
+		empty = self._Empty()
+		info = access_controller.memory_info()
+		self.assertEqual(info['classes'][self._Type]['instances'], 5)
+		self.assertNotIn(self._Empty, info['classes'])
+		self.assertGreaterEqual(info['instances'], 5)
+		self.assertGreater(info['registry_bytes'], 0)
+		self.assertEqual(
+			info['classes'][self._Type]['instance_bytes'],
+			sum(access_controller.memory_usage(instance) for instance in instances)
+		)
+		self.assertEqual(access_controller.memory_usage(empty), 0)
+
+	def testInstanceUsage(self):
+		a = self._Type()
+		size = access_controller.memory_usage(a)
+		self.assertGreater(size, 0)
+		a.__dict__["extra"] = 3
+		self.assertGreater(access_controller.memory_usage(a), size)
+
+	def testClassUsageGrowsWithShapes(self):
+		size = access_controller.memory_usage(self._Type)
+		self.assertGreater(size, 0)
+		self._Type()
+		self.assertGreater(access_controller.memory_usage(self._Type), size)
+
+	def testReleasedClassHasNoOverhead(self):
+		class C(Object, enforce=False):
+			def __init__(self) -> None:
+				super().__init__()
+				self.private_attribute("private", 1)
+
+		self.assertEqual(access_controller.memory_usage(C), 0)
+		self.assertEqual(access_controller.memory_usage(C()), 0)
+
+
+class TestLeaks(TestCase):
+	def testNoLeaks(self):
+		class A(Object):
+			def __init__(self) -> None:
+				super().__init__()
+				self.private_attribute("private", 1)
+
+		leaked = set(access_controller.leaks())
+		instances = [A() for _ in range(3)]
+		del instances
+		self.assertEqual(set(access_controller.leaks()), leaked)
+
+	def testStaleEntryIsReported(self):
+		class A(Object):
+			def __init__(self) -> None:
+				super().__init__()
+				self.private_attribute("private", 1)
+
+		a = A()
+		stale = id(a) + 1
+		data = access_controller.objects.data
+		data[stale] = data[id(a)]
+		try:
+			self.assertIn(stale, access_controller.leaks())
+			self.assertGreaterEqual(access_controller.memory_info()['leaked'], 1)
+		finally:
+			del data[stale]
+		self.assertNotIn(stale, access_controller.leaks())
@@ -0,0 +1,70 @@
+from inspect import signature
+from unittest import TestCase
+
+from pyobject import AccessError, AccessErrors, Object, privatemethod, protectedmethod
+
+
+def read(a):
+	return a.helper()
+
+
+class TestObjectMethods(TestCase):
+	def setUp(self) -> None:
+		class A(Object):
+			def read(self):
+				return self.helper()
+
+			def read_private(self):
+				return self.secret(1)
+
+			@protectedmethod
+			def helper(self):
+				"""Return the helper value."""
+				return "[helper value]"
+
+			@privatemethod
+			def secret(self, value: int, scale: int = 2) -> int:
+				return value * scale
+
+		class B(A):
+			def read_child(self):
+				return self.helper()
+
+			def read_child_private(self):
+				return self.secret(1)
+
+		self._Type = A
+		self._SubType = B
+		return super().setUp()
+
+	def testIdenticalBodyOutside(self):
+		t = self._Type()
+		self.assertEqual(t.read(), "[helper value]")
+		self.assertEqual(read.__code__.co_code, self._Type.read.__code__.co_code)
+		with self.assertRaises(AccessError) as access_error:
+			read(t)
+		self.assertEqual(access_error.exception.type, AccessErrors.PROTECTED)
+
+	def testSubclass(self):
+		t = self._SubType()
+		self.assertEqual(t.read_child(), "[helper value]")
+		self.assertEqual(t.read_private(), 2)
+		with self.assertRaises(AccessError) as access_error:
+			t.read_child_private()
+		self.assertEqual(access_error.exception.type, AccessErrors.PRIVATE)
+
+	def testWraps(self):
+		helper, secret = self._Type.helper, self._Type.secret
+		self.assertEqual(helper.__name__, 'helper')
+		self.assertEqual(helper.__doc__, "Return the helper value.")
+		self.assertEqual(helper.__qualname__, secret.__qualname__.replace('secret', 'helper'))
+		self.assertEqual(str(signature(secret)), "(self, value: int, scale: int = 2) -> int")
+		self.assertEqual(secret.__access__, 'private')
+		self.assertIs(secret.__owner__, self._Type)
+
+	def testMethodAddedLater(self):
+		def later(self):
+			return self.helper(), self.secret(2)
+
+		self._Type.later = later
+		self.assertEqual(self._SubType().later(), ("[helper value]", 4))
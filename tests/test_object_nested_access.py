@@ -0,0 +1,104 @@
+from unittest import TestCase
+
+from pyobject import AccessError, Object, private, privatemethod, protectedmethod
+
+
+class TestObjectNestedAccess(TestCase):
+	def setUp(self) -> None:
+		class A(Object):
+			field = private(0)
+
+			def __init__(self) -> None:
+				super().__init__()
+				self.private_attribute("private", 1)
+				self.protected_attribute("protected", 2)
+				declare = lambda: self.new_attribute("declared", 'private', 3)
+				declare()
+
+			def from_lambda(self):
+				return (lambda: self.private + self.field)()
+
+			def from_comprehension(self):
+				return [self.private for _ in range(2)], {self.protected for _ in range(2)}
+
+			def from_generator(self):
+				return sum(self.private for _ in range(3))
+
+			def from_nested(self):
+				def nested():
+					def deeper():
+						return self.private, self.declared
+					return deeper()
+				return nested()
+
+			def calls(self):
+				return [self.helper() for _ in range(2)], (lambda: self.secret())()
+
+			@protectedmethod
+			def helper(self):
+				return "[helper value]"
+
+			@privatemethod
+			def secret(self):
+				return "[secret value]"
+
+		class B(A):
+			def from_lambda(self):
+				return (lambda: self.private)()
+
+			def protected_from_lambda(self):
+				return (lambda: self.protected)()
+
+		class C(Object):
+			def from_lambda(self, other):
+				return (lambda: other.protected)()
+
+		self._Type, self._SubType, self._OtherType = A, B, C
+		return super().setUp()
+
+	def testLambda(self):
+		self.assertEqual(self._Type().from_lambda(), 1)
+
+	def testComprehension(self):
+		self.assertEqual(self._Type().from_comprehension(), ([1, 1], {2}))
+
+	def testGenerator(self):
+		self.assertEqual(self._Type().from_generator(), 3)
+
+	def testNestedFunction(self):
+		self.assertEqual(self._Type().from_nested(), (1, 3))
+
+	def testMethods(self):
+		self.assertEqual(self._Type().calls(), (["[helper value]"] * 2, "[secret value]"))
+
+	def testSubclassLambda(self):
+		t = self._SubType()
+		self.assertEqual(t.protected_from_lambda(), 2)
+		with self.assertRaises(AccessError):
+			t.from_lambda()
+
+	def testSameMethodName(self):
+		with self.assertRaises(AccessError):
+			self._OtherType().from_lambda(self._Type())
+
+	def testOutsideLambda(self):
+		t = self._Type()
+		with self.assertRaises(AccessError):
+			(lambda: t.private)()
+
+	def testClassesFromSameCode(self):
+		def make():
+			class D(Object):
+				def __init__(self) -> None:
+					super().__init__()
+					self.private_attribute("private", 1)
+
+				def read(self):
+					return (lambda: self.private)()
+
+			return D
+
+		first, second = make(), make()
+		self.assertIsNot(first, second)
+		self.assertEqual(first().read(), 1)
+		self.assertEqual(second().read(), 1)
@@ -0,0 +1,120 @@
+import copy
+import pickle
+from unittest import TestCase
+
+from pyobject import OUT_OF_BAND_SIZE, AccessError, AccessErrors, Object, access_controller, private
+
+
+class Record(Object):
+	field = private(0)
+	empty = private()
+
+	def __init__(self, items=None, blob=b'') -> None:
+		super().__init__()
+		self.protected_attribute("items", [] if items is None else items)
+		self.private_attribute("blob", blob, final=True)
+		self.__dict__["extra"] = "[extra value]"
+		self.plain = "[plain value]"
+
+	def values(self):
+		return self.field, self.items, self.blob, self.__dict__, self.plain
+
+	def missing(self):
+		return self.empty
+
+	def replace(self, blob):
+		self.blob = blob
+
+
+class Released(Object, enforce=False):
+	def __init__(self) -> None:
+		super().__init__()
+		self.private_attribute("items", [1])
+
+
+class Empty(Object):
+	field = private(0)
+
+	def value(self):
+		return self.field
+
+
+class TestPickle(TestCase):
+	def roundtrips(self):
+		yield 'copy', copy.copy
+		yield 'deepcopy', copy.deepcopy
+		for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+			yield f'pickle {protocol}', lambda o, protocol=protocol: pickle.loads(pickle.dumps(o, protocol))
+
+	def testRoundtripKeepsValues(self):
+		record = Record([1, 2], b'data')
+		for name, roundtrip in self.roundtrips():
+			with self.subTest(name):
+				self.assertEqual(roundtrip(record).values(), record.values())
+
+	def testRoundtripKeepsAccessModes(self):
+		for name, roundtrip in self.roundtrips():
+			with self.subTest(name):
+				result = roundtrip(Record())
+				with self.assertRaises(AccessError) as context:
+					result.items
+				self.assertEqual(context.exception.type, AccessErrors.PROTECTED)
+				with self.assertRaises(AccessError) as context:
+					result.blob
+				self.assertEqual(context.exception.type, AccessErrors.PRIVATE)
+				with self.assertRaises(AccessError) as context:
+					result.replace(b'')
+				self.assertEqual(context.exception.type, AccessErrors.FINAL)
+				with self.assertRaises(AttributeError):
+					result.missing()
+
+	def testCopyIsShallow(self):
+		record = Record([1, 2])
+		result = copy.copy(record)
+		self.assertIs(result.values()[1], record.values()[1])
+		result.__dict__["extra"] = "[changed]"
+		self.assertEqual(record.__dict__["extra"], "[extra value]")
+
+	def testDeepcopyIsDeep(self):
+		record = Record([1, 2])
+		result = copy.deepcopy(record)
+		self.assertIsNot(result.values()[1], record.values()[1])
+
+	def testCycles(self):
+		record = Record()
+		record.values()[1].append(record)
+		for name, roundtrip in self.roundtrips():
+			if name == 'copy':
+				continue
+			with self.subTest(name):
+				result = roundtrip(record)
+				self.assertIs(result.values()[1][0], result)
+
+	def testStateIsShared(self):
+		records = pickle.loads(pickle.dumps([Record() for _ in range(3)]))
+		shapes = {id(object.__getattribute__(record, '_PrivateObject__state').shape) for record in records}
+		self.assertEqual(len(shapes), 1)
+
+	def testCopiesAreRegistered(self):
+		result = pickle.loads(pickle.dumps(Record()))
+		self.assertGreater(access_controller.memory_usage(result), 0)
+
+	def testUntouchedInstance(self):
+		for name, roundtrip in self.roundtrips():
+			with self.subTest(name):
+				self.assertEqual(roundtrip(Empty()).value(), 0)
+
+	def testOutOfBandBuffers(self):
+		record = Record(blob=b'x' * OUT_OF_BAND_SIZE)
+		buffers = []
+		data = pickle.dumps(record, 5, buffer_callback=buffers.append)
+		self.assertEqual(len(buffers), 1)
+		self.assertLess(len(data), OUT_OF_BAND_SIZE)
+		self.assertEqual(pickle.loads(data, buffers=buffers).values(), record.values())
+		self.assertEqual(pickle.loads(pickle.dumps(record, 5)).values(), record.values())
+
+	def testReleasedClass(self):
+		released = Released()
+		for name, roundtrip in self.roundtrips():
+			with self.subTest(name):
+				self.assertEqual(roundtrip(released).items, [1])
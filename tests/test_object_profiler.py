@@ -0,0 +1,88 @@
+import json
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from pyobject import AccessError, Object, access_controller, private
+
+
+class TestProfiler(TestCase):
+	def setUp(self) -> None:
+		class A(Object):
+			field = private(0)
+
+			def __init__(self) -> None:
+				super().__init__()
+				self.protected_attribute("protected", "[protected value]")
+
+			def read(self):
+				return self.field, self.protected
+
+			def write(self, value):
+				self.field = value
+
+		self._Type = A
+		access_controller.profile_clear()
+		access_controller.profile()
+		return super().setUp()
+
+	def tearDown(self) -> None:
+		access_controller.profile(False)
+		access_controller.profile_clear()
+		return super().tearDown()
+
+	def entries(self) -> dict:
+		return {
+			(entry['attribute'], entry['function']): entry
+			for entry in access_controller.profile_info() if entry['class'].endswith(self._Type.__qualname__)
+		}
+
+	def testSitesAreCounted(self):
+		t = self._Type()
+		for _ in range(3):
+			t.read()
+		t.write(1)
+		entries = self.entries()
+		read = self._Type.read.__qualname__
+		self.assertEqual(entries[('field', read)]['reads'], 3)
+		self.assertEqual(entries[('protected', read)]['reads'], 3)
+		self.assertEqual(entries[('protected', read)]['access_mode'], 'protected')
+		self.assertEqual(entries[('field', self._Type.write.__qualname__)]['writes'], 1)
+		self.assertEqual(entries[('field', read)]['line'], self._Type.read.__code__.co_firstlineno)
+		self.assertGreaterEqual(entries[('field', read)]['check_ns'], 0)
+
+	def testDeniedAccessIsProfiled(self):
+		t = self._Type()
+		with self.assertRaises(AccessError):
+			t.field
+		entry = self.entries()[('field', self.testDeniedAccessIsProfiled.__qualname__)]
+		self.assertEqual(entry['denied'], 1)
+
+	def testSortedByCheckTime(self):
+		t = self._Type()
+		t.read()
+		t.write(1)
+		times = [entry['check_ns'] for entry in access_controller.profile_info()]
+		self.assertEqual(times, sorted(times, reverse=True))
+
+	def testProfilingDoesNotMeter(self):
+		access_controller.metrics_clear()
+		self._Type().read()
+		self.assertEqual(access_controller.metrics()['checks'], 0)
+		self.assertTrue(self.entries())
+
+	def testExport(self):
+		self._Type().read()
+		self.assertIn('A.field (private)', access_controller.profile_report())
+		with TemporaryDirectory() as directory:
+			path = os.path.join(directory, 'profile.json')
+			access_controller.write_profile(path)
+			with open(path) as file:
+				self.assertEqual(json.load(file), access_controller.profile_info())
+			with self.assertRaises(ValueError):
+				access_controller.write_profile(path, format='csv')
+
+	def testDisabled(self):
+		access_controller.profile(False)
+		self._Type().read()
+		self.assertEqual(self.entries(), {})
@@ -0,0 +1,129 @@
+from unittest import TestCase
+
+from pyobject import (AccessError, AccessErrors, Object, accessproperty, cachedproperty, privatecachedproperty,
+	privateproperty, protectedcachedproperty, protectedproperty)
+
+
+class TestObjectProperties(TestCase):
+	def setUp(self) -> None:
+		class A(Object):
+			def __init__(self) -> None:
+				super().__init__()
+				self.public_attribute("calls", 0)
+				self.public_attribute("stored", 1)
+
+			@protectedproperty
+			def protected(self):
+				return self.stored
+
+			@protected.setter
+			def protected(self, value):
+				self.stored = value
+
+			@privateproperty
+			def private(self):
+				return self.stored
+
+			@private.deleter
+			def private(self):
+				self.stored = None
+
+			@protectedcachedproperty
+			def expensive(self):
+				self.calls += 1
+				return self.calls
+
+			@privatecachedproperty
+			def secret(self):
+				return [self.stored]
+
+			def read(self):
+				return self.protected, self.private, (lambda: self.secret)()
+
+			def write(self, value):
+				self.protected = value
+
+			def remove(self):
+				del self.private
+
+			def read_expensive(self):
+				return self.expensive
+
+			def reset_expensive(self):
+				del self.expensive
+
+		class B(A):
+			def read_child(self):
+				return self.protected
+
+			def read_child_private(self):
+				return self.private
+
+		self._Type, self._SubType = A, B
+		return super().setUp()
+
+	def testInside(self):
+		t = self._Type()
+		self.assertEqual(t.read(), (1, 1, [1]))
+		t.write(2)
+		self.assertEqual(t.read()[:2], (2, 2))
+		t.remove()
+		self.assertIsNone(t.stored)
+
+	def testOutside(self):
+		t = self._Type()
+		for access in (lambda: t.protected, lambda: t.private, lambda: t.expensive, lambda: t.secret):
+			with self.assertRaises(AccessError):
+				access()
+		with self.assertRaises(AccessError) as access_error:
+			t.protected = 3
+		self.assertEqual(access_error.exception.type, AccessErrors.PROTECTED)
+		with self.assertRaises(AccessError) as access_error:
+			del t.private
+		self.assertEqual(access_error.exception.type, AccessErrors.PRIVATE)
+
+	def testChild(self):
+		t = self._SubType()
+		self.assertEqual(t.read_child(), 1)
+		self.assertEqual(t.read(), (1, 1, [1]))
+		with self.assertRaises(AccessError):
+			t.read_child_private()
+
+	def testSetNameAndCopies(self):
+		prop = vars(self._Type)['protected']
+		self.assertIsInstance(prop, protectedproperty)
+		self.assertEqual(prop.access_mode, 'protected')
+		self.assertIs(prop.__owner__, self._Type)
+		self.assertEqual(prop.__name__, 'protected')
+		self.assertIsNotNone(prop.fset)
+
+	def testClassesFromSameLine(self):
+		classes = [type('C', (self._Type,), {'value': privateproperty(lambda self: 0)}) for _ in range(2)]
+		self.assertIsNot(vars(classes[0])['value'].__owner__, vars(classes[1])['value'].__owner__)
+
+	def testCached(self):
+		t = self._Type()
+		self.assertEqual(t.read_expensive(), 1)
+		self.assertEqual(t.read_expensive(), 1)
+		t.reset_expensive()
+		self.assertEqual(t.read_expensive(), 2)
+		self.assertEqual(self._Type().read_expensive(), 1)
+
+	def testCachedIsHidden(self):
+		t = self._Type()
+		t.read_expensive()
+		self.assertNotIn('_accessproperty__expensive', vars(t))
+
+	def testGeneric(self):
+		class C(Object):
+			value = accessproperty(lambda self: 1, access_mode='private')
+			counter = cachedproperty(lambda self: object())
+
+			def read(self):
+				return self.value
+
+		c = C()
+		self.assertEqual(c.read(), 1)
+		with self.assertRaises(AccessError):
+			c.value
+		self.assertIs(c.counter, c.counter)
@@ -0,0 +1,90 @@
+from unittest import TestCase
+
+from pyobject import AccessError, Object
+
+STATE = '_PrivateObject__state'
+
+
+def state(instance):
+	return object.__getattribute__(instance, STATE)
+
+
+class TestPrototype(TestCase):
+	def setUp(self) -> None:
+		class A(Object):
+			def __init__(self, value, extra=False) -> None:
+				super().__init__()
+				self.public_attribute("public", value)
+				if extra:
+					self.public_attribute("extra", value)
+				self.private_attribute("private", value)
+
+			def read(self):
+				return self.private
+
+			def early(self):
+				return self.private
+
+		self._Type = A
+		return super().setUp()
+
+	def testPrototypeCapturedAfterFirstInstance(self):
+		a = self._Type(1)
+		prototype = self._Type.__prototype__
+		self.assertIs(state(a).shape, prototype)
+		b = self._Type(2)
+		self.assertIs(state(b).shape, prototype)
+		self.assertEqual(state(b).values, [2, 2])
+		self.assertEqual((a.public, a.read(), b.public, b.read()), (1, 1, 2, 2))
+		with self.assertRaises(AccessError):
+			b.private
+
+	def testUndeclaredSlotIsMissing(self):
+		class B(Object):
+			def __init__(self) -> None:
+				super().__init__()
+				self.seen = hasattr(self, "value")
+				self.public_attribute("value", None)
+
+		B()
+		b = B()
+		self.assertIs(state(b).shape, B.__prototype__)
+		self.assertFalse(b.seen)
+		self.assertIsNone(b.value)
+
+	def testPrototypeGrowsWithOptionalAttributes(self):
+		self._Type(1)
+		extended = self._Type(2, extra=True)
+		self.assertEqual(extended.extra, 2)
+		self.assertIn("extra", self._Type.__prototype__.attributes)
+		plain = self._Type(3)
+		self.assertIs(state(plain).shape, self._Type.__prototype__)
+		with self.assertRaises(AttributeError):
+			plain.extra
+		self.assertEqual(plain.read(), 3)
+
+	def testSubclassHasOwnPrototype(self):
+		class B(self._Type):
+			def __init__(self, value) -> None:
+				super().__init__(value)
+				self.protected_attribute("child", value)
+
+		self._Type(1)
+		b = B(2)
+		self.assertIsNot(B.__prototype__, self._Type.__prototype__)
+		self.assertIs(state(B(3)).shape, state(b).shape)
+		self.assertEqual(b.read(), 2)
+
+	def testChangedAccessModeIsEnforced(self):
+		class B(Object):
+			def __init__(self, private) -> None:
+				super().__init__()
+				if private:
+					self.private_attribute("value", 1)
+				else:
+					self.public_attribute("value", 1)
+
+		self.assertEqual(B(False).value, 1)
+		with self.assertRaises(AccessError):
+			B(True).value
+		self.assertEqual(B(False).value, 1)
@@ -0,0 +1,46 @@
+import gc
+from unittest import TestCase
+
+from pyobject import Object, access_controller
+
+
+class TestObjectRegistry(TestCase):
+	def setUp(self) -> None:
+		class A(Object):
+			def __init__(self) -> None:
+				super().__init__()
+				self.private_attribute("private", "[private value]")
+				self.public_attribute("public", "[public value]")
+		self._Type = A
+		gc.collect()
+		return super().setUp()
+
+	def testRegistryStaysFlat(self):
+		size = len(access_controller.objects)
+		for _ in range(10_000):
+			self._Type()
+		self.assertEqual(len(access_controller.objects), size)
+
+	def testRegistryReleasesCycles(self):
+		size = len(access_controller.objects)
+		for _ in range(1_000):
+			a, b = self._Type(), self._Type()
+			a.other, b.other = b, a
+		del a, b
+		gc.collect()
+		self.assertEqual(len(access_controller.objects), size)
+
+	def testReusedIdDoesNotInheritState(self):
+		class B(Object):
+			pass
+
+		for _ in range(1_000):
+			identifier = id(self._Type())
+			b = B()
+			if id(b) == identifier:
+				break
+		with self.assertRaises(AttributeError):
+			b.public
+
+	def testNoFinalizer(self):
+		self.assertFalse(hasattr(Object, '__del__'))
@@ -0,0 +1,150 @@
+import os
+import subprocess
+import sys
+from unittest import TestCase
+
+from pyobject import (Object, private, privatecachedproperty, privateclassmethod, privatemethod, privateproperty,
+	privatestaticmethod, protected, protectedmethod)
+
+
+class TestReleaseClass(TestCase):
+	def setUp(self) -> None:
+		class A(Object, enforce=False):
+			field = private("[field value]")
+			blank = protected(final=True)
+
+			def __init__(self) -> None:
+				super().__init__()
+				self.private_attribute("private", "[private value]")
+				self.protected_attribute("protected", "[protected value]", True)
+
+			@privatemethod
+			def method(self):
+				return "[method value]"
+
+			@privatestaticmethod
+			def static():
+				return "[static value]"
+
+			@privateclassmethod
+			def klass(cls):
+				return cls
+
+			@privateproperty
+			def property(self):
+				return "[property value]"
+
+			@privatecachedproperty
+			def cached(self):
+				return object()
+
+		self._Type = A
+		return super().setUp()
+
+	def testNativeAttributeAccess(self):
+		self.assertIs(self._Type.__getattribute__, object.__getattribute__)
+		self.assertIs(self._Type.__setattr__, object.__setattr__)
+		self.assertIs(self._Type.__delattr__, object.__delattr__)
+
+	def testAttributesFromOutside(self):
+		t = self._Type()
+		self.assertEqual(t.private, "[private value]")
+		self.assertEqual(t.field, "[field value]")
+		t.protected = "[protected value changed]"
+		self.assertEqual(t.protected, "[protected value changed]")
+		self.assertEqual(t.__dict__, {
+			"field": "[field value]",
+			"private": "[private value]",
+			"protected": "[protected value changed]"
+		})
+		with self.assertRaises(AttributeError):
+			t.blank
+
+	def testMembersAreUnwrapped(self):
+		members = vars(self._Type)
+		self.assertIs(type(members["method"]), type(lambda: None))
+		self.assertIs(type(members["static"]), staticmethod)
+		self.assertIs(type(members["klass"]), classmethod)
+		self.assertIs(type(members["property"]), property)
+		t = self._Type()
+		self.assertEqual(t.method(), "[method value]")
+		self.assertEqual(t.static(), "[static value]")
+		self.assertIs(t.klass(), self._Type)
+		self.assertEqual(t.property, "[property value]")
+		self.assertEqual(members["cached"].access_mode, 'public')
+		self.assertIs(t.cached, t.cached)
+
+	def testSubclassInheritsRelease(self):
+		class B(self._Type):
+			@protectedmethod
+			def other(self):
+				return "[other value]"
+
+		self.assertFalse(B.__enforce__)
+		self.assertEqual(B().other(), "[other value]")
+		self.assertEqual(B().private, "[private value]")
+
+	def testBulkDeclaration(self):
+		class B(self._Type):
+			def __init__(self) -> None:
+				super().__init__()
+				self.declare_attributes(protected={"bulk": "[bulk value]"}, final=("bulk",))
+
+		t = B()
+		self.assertEqual(t.bulk, "[bulk value]")
+		self.assertEqual(t.__dict__["bulk"], "[bulk value]")
+
+	def testDefaultsThroughPlainParent(self):
+		class B(Object, enforce=False):
+			pass
+
+		class C(B):
+			field = private("[field value]")
+
+			def __init__(self) -> None:
+				super().__init__()
+
+		self.assertEqual(B().__dict__, {})
+		self.assertEqual(C().__dict__, {"field": "[field value]"})
+
+	def testCannotReenforce(self):
+		with self.assertRaises(TypeError):
+			class B(self._Type, enforce=True):
+				pass
+
+
+class TestReleaseEnvironment(TestCase):
+	def testEnvironmentVariable(self):
+		code = (
+			"from pyobject import *\n"
+			"class A(Object):\n"
+			"	def __init__(self):\n"
+			"		super().__init__()\n"
+			"		self.private_attribute('private', 1)\n"
+			"	@privatemethod\n"
+			"	def method(self):\n"
+			"		return 2\n"
+			"assert privatemethod is publicmethod\n"
+			"assert A.__getattribute__ is object.__getattribute__\n"
+			"print(A().private, A().method())\n"
+		)
+		result = subprocess.run(
+			[sys.executable, "-c", code],
+			cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+			env={**os.environ, "PYOBJECT_RELEASE": "1"},
+			capture_output=True,
+			text=True
+		)
+		self.assertEqual(result.returncode, 0, result.stderr)
+		self.assertEqual(result.stdout.strip(), "1 2")
+
+	def testReleaseSuite(self):
+		root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+		result = subprocess.run(
+			[sys.executable, "-m", "unittest", "-q", "test_object_release.TestReleaseClass"],
+			cwd=os.path.join(root, "tests"),
+			env={**os.environ, "PYOBJECT_RELEASE": "1", "PYTHONPATH": root},
+			capture_output=True,
+			text=True
+		)
+		self.assertEqual(result.returncode, 0, result.stderr)
@@ -0,0 +1,42 @@
+import os
+import subprocess
+import sys
+from unittest import TestCase
+
+from pyobject import Object, privatemethod
+
+
+class TestStartupImports(TestCase):
+	def testHeavyModulesAreLazy(self):
+		code = (
+			"import sys\n"
+			"import pyobject\n"
+			"class A(pyobject.Object):\n"
+			"	@pyobject.privatemethod\n"
+			"	def method(self):\n"
+			"		return 1\n"
+			"print(' '.join(sorted({'inspect', 'json', 'typing', 'contextlib', 'tokenize'} & set(sys.modules))))\n"
+		)
+		result = subprocess.run(
+			[sys.executable, "-c", code],
+			cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+			capture_output=True,
+			text=True
+		)
+		self.assertEqual(result.returncode, 0, result.stderr)
+		self.assertEqual(result.stdout.strip(), "")
+
+
+class TestClassAttributes(TestCase):
+	def testPlainValueKeepsCodes(self):
+		class A(Object):
+			@privatemethod
+			def method(self):
+				return 1
+
+		codes = A.__codes__
+		A.value = 1
+		self.assertIs(A.__codes__, codes)
+		A.other = lambda self: self.method()
+		self.assertIsNot(A.__codes__, codes)
+		self.assertEqual(A().other(), 1)
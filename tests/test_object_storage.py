@@ -0,0 +1,54 @@
+from unittest import TestCase
+
+from pyobject import Object, access_controller, public
+
+STATE = '_PrivateObject__state'
+
+
+class TestObjectStorage(TestCase):
+	def setUp(self) -> None:
+		class A(Object):
+			def __init__(self, value=None) -> None:
+				super().__init__()
+				self.public_attribute("public", value)
+				self.protected_attribute("protected", value)
+				self.private_attribute("private", value)
+		self._Type = A
+		return super().setUp()
+
+	def testShapeIsShared(self):
+		a, b = self._Type(1), self._Type(2)
+		state_a, state_b = object.__getattribute__(a, STATE), object.__getattribute__(b, STATE)
+		self.assertIs(state_a.shape, state_b.shape)
+		self.assertEqual(state_a.values, [1, 1, 1])
+		self.assertEqual(state_b.values, [2, 2, 2])
+
+	def testSlotsFollowDeclarationOrder(self):
+		shape = object.__getattribute__(self._Type(), STATE).shape
+		self.assertEqual(
+			[(a.name, a.access_mode, a.slot) for a in shape.attributes.values()],
+			[("public", "public", 0), ("protected", "protected", 1), ("private", "private", 2)]
+		)
+
+	def testRedeclarationReusesSlot(self):
+		class B(Object):
+			def __init__(self) -> None:
+				super().__init__()
+				self.public_attribute("value", 1)
+				self.protected_attribute("value", 2)
+
+		state = object.__getattribute__(B(), STATE)
+		self.assertEqual(state.values, [2])
+		self.assertEqual(state.shape.attributes["value"].access_mode, "protected")
+
+	def testNoStateWithoutDeclarations(self):
+		class B(Object):
+			value = public(1)
+
+		size = len(access_controller.objects)
+		b = B()
+		self.assertEqual(b.value, 1)
+		self.assertIs(object.__getattribute__(b, STATE), vars(B)[STATE])
+		self.assertEqual(len(access_controller.objects), size)
+		b.value = 2
+		self.assertEqual(len(access_controller.objects), size + 1)
@@ -0,0 +1,83 @@
+from threading import Barrier, Thread
+from unittest import TestCase
+
+from pyobject import AccessError, Object, access_controller, privatestaticmethod
+
+
+class TestObjectThreads(TestCase):
+	def setUp(self) -> None:
+		class Other(Object):
+			pass
+
+		class A(Object):
+			def __init__(self) -> None:
+				super().__init__()
+				self.protected_attribute("protected", "[protected value]")
+
+			@privatestaticmethod
+			def helper():
+				return "[helper value]"
+
+			def run(self):
+				helper = self.helper
+				vars(A)['helper'].__get__(None, Other)
+				return helper()
+
+			def read(self, count):
+				for _ in range(count):
+					self.protected
+
+		self._Type = A
+		access_controller.cache_clear()
+		return super().setUp()
+
+	def testStaticMethodOwnerIsNotShared(self):
+		self.assertEqual(self._Type().run(), "[helper value]")
+
+	def testStaticMethodOutsideAccess(self):
+		with self.assertRaises(AccessError):
+			self._Type.helper()
+
+	def testConcurrentReads(self):
+		t = self._Type()
+		threads, count = 8, 2_000
+		barrier = Barrier(threads)
+		errors = []
+
+		def target():
+			barrier.wait()
+			try:
+				t.read(count)
+			except Exception as error:
+				errors.append(error)
+
+		workers = [Thread(target=target) for _ in range(threads)]
+		for worker in workers:
+			worker.start()
+		for worker in workers:
+			worker.join()
+		self.assertEqual(errors, [])
+		info = access_controller.cache_info()
+		self.assertEqual(info['hits'] + info['misses'], threads * count)
+		self.assertGreaterEqual(info['misses'], 1)
+
+	def testConcurrentViolations(self):
+		t = self._Type()
+		threads = 4
+		barrier = Barrier(threads)
+		raised = []
+
+		def target():
+			barrier.wait()
+			for _ in range(500):
+				try:
+					t.protected
+				except AccessError:
+					raised.append(True)
+
+		workers = [Thread(target=target) for _ in range(threads)]
+		for worker in workers:
+			worker.start()
+		for worker in workers:
+			worker.join()
+		self.assertEqual(len(raised), threads * 500)
@@ -0,0 +1,146 @@
+import asyncio
+from threading import Thread
+from unittest import TestCase
+
+from pyobject import AccessError, Object, access_controller, private, privatemethod, trusted
+
+
+class TestObjectTrusted(TestCase):
+	def setUp(self) -> None:
+		class A(Object):
+			field = private(0)
+
+			def __init__(self) -> None:
+				super().__init__()
+				self.private_attribute("private", 0)
+				self.protected_attribute("protected", 0)
+
+			def bulk(self, count):
+				with trusted(self) as this:
+					for _ in range(count):
+						this.private += 1
+						this.field += 1
+				return self.private, self.field
+
+			def leak(self, function):
+				with trusted(self):
+					return function(self)
+
+			@privatemethod
+			def helper(self, function):
+				with trusted(self):
+					return function(self)
+
+			def call_helper(self, function):
+				return self.helper(function)
+
+		class B(A):
+			def __init__(self) -> None:
+				super().__init__()
+				self.private_attribute("own", 0)
+
+			def own_values(self):
+				with trusted(self):
+					return self.own, self.protected
+
+			def inherited_private(self):
+				with trusted(self):
+					return self.private
+
+		self._Type = A
+		self._SubType = B
+		access_controller.cache_clear()
+		return super().setUp()
+
+	def testBulk(self):
+		t = self._Type()
+		self.assertEqual(t.bulk(100), (100, 100))
+
+	def testNoCacheLookupsInsideBlock(self):
+		t = self._Type()
+		t.bulk(100)
+		self.assertEqual(access_controller.cache_info()['hits'], 0)
+		self.assertEqual(access_controller.trusting, 0)
+
+	def testOutside(self):
+		with self.assertRaises(AccessError):
+			trusted(self._Type())
+
+	def testGrantIsScopedToBlock(self):
+		t = self._Type()
+		t.bulk(1)
+		with self.assertRaises(AccessError):
+			t.private
+
+	def testCallbacksInsideBlock(self):
+		t = self._Type()
+		self.assertEqual(t.leak(lambda obj: obj.private), 0)
+		self.assertEqual(t.call_helper(lambda obj: obj.private), 0)
+
+	def testOtherInstance(self):
+		t, other = self._Type(), self._Type()
+		with self.assertRaises(AccessError):
+			t.leak(lambda obj: other.private)
+
+	def testSubclass(self):
+		t = self._SubType()
+		self.assertEqual(t.own_values(), (0, 0))
+		with self.assertRaises(AccessError):
+			t.inherited_private()
+
+	def testClassTarget(self):
+		A = self._Type
+		class C(A):
+			@classmethod
+			def total(cls, objects):
+				with trusted(cls):
+					return sum(obj.protected for obj in objects)
+
+			@classmethod
+			def private_total(cls, objects):
+				with trusted(cls):
+					return sum(obj.private for obj in objects)
+
+		self.assertEqual(C.total([C(), C()]), 0)
+		with self.assertRaises(AccessError):
+			C.private_total([C()])
+		with self.assertRaises(AccessError):
+			C.total([A()])
+
+	def testOtherThread(self):
+		t = self._Type()
+		raised = []
+
+		def target():
+			try:
+				t.private
+			except AccessError:
+				raised.append(True)
+
+		def start(obj):
+			worker = Thread(target=target)
+			worker.start()
+			worker.join()
+			return obj.private
+
+		self.assertEqual(t.leak(start), 0)
+		self.assertEqual(raised, [True])
+
+	def testOtherCoroutine(self):
+		t = self._Type()
+
+		async def read():
+			return t.private
+
+		async def main():
+			task = asyncio.get_running_loop().create_task(read())
+			await asyncio.sleep(0)
+			return t.leak(lambda obj: obj.private), task
+
+		async def run():
+			value, task = await main()
+			with self.assertRaises(AccessError):
+				await task
+			return value
+
+		self.assertEqual(asyncio.run(run()), 0)
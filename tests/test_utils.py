@@ -0,0 +1,28 @@
+from unittest import TestCase
+
+from utils import caller, caller_code, frameinfo, stack
+
+
+class TestCaller(TestCase):
+	def testCallerMatchesStack(self):
+		def inner():
+			return caller(2), stack(2)[-1]
+
+		frame, frame_info = inner()
+		self.assertIs(frame, frame_info.frame)
+		self.assertEqual(frame.f_code.co_name, frame_info.function)
+
+	def testCallerCode(self):
+		def inner():
+			return caller_code(2)
+
+		self.assertIs(inner(), self.testCallerCode.__code__)
+
+	def testFrameInfo(self):
+		def inner():
+			return frameinfo(caller(2))
+
+		frame_info = inner()
+		self.assertEqual(frame_info.function, 'testFrameInfo')
+		self.assertEqual(frame_info.filename, __file__)
+